@@ -3,6 +3,10 @@
 
 from __future__ import unicode_literals
 
+import collections
+import importlib
+import os
+
 import pysigscan
 
 from dfvfs.analyzer import specification
@@ -10,13 +14,190 @@ from dfvfs.lib import definitions
 from dfvfs.resolver import resolver
 
 
+class _ScanDataFileObject(object):
+  """File-like object that caches the scan data of another file-like object.
+
+  The signature scanners of the different format categories read the same
+  ranges of data, such as the start and end of the file. Reads within a range
+  that was read before are served from the cached scan data.
+  """
+
+  def __init__(self, file_object, minimum_read_size):
+    """Initializes a file-like object.
+
+    Args:
+      file_object (FileIO): file-like object.
+      minimum_read_size (int): minimum number of bytes to read from
+          the file-like object at once.
+    """
+    super(_ScanDataFileObject, self).__init__()
+    self._current_offset = 0
+    self._file_object = file_object
+    self._minimum_read_size = minimum_read_size
+    self._scan_data_ranges = []
+    self._size = file_object.get_size()
+
+    self.number_of_reads = 0
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+    """
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object.
+    """
+    return self._size
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    if size is None:
+      size = self._size - self._current_offset
+
+    end_offset = min(self._current_offset + size, self._size)
+
+    for range_offset, range_data in self._scan_data_ranges:
+      if (range_offset <= self._current_offset and
+          end_offset <= range_offset + len(range_data)):
+        relative_offset = self._current_offset - range_offset
+        data = range_data[relative_offset:relative_offset + size]
+        break
+
+    else:
+      self._file_object.seek(self._current_offset, os.SEEK_SET)
+      data = self._file_object.read(max(size, self._minimum_read_size))
+      self.number_of_reads += 1
+
+      self._scan_data_ranges.append((self._current_offset, data))
+      data = data[:size]
+
+    self._current_offset += len(data)
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an
+          absolute or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+
 class Analyzer(object):
   """Format analyzer."""
 
   _SCAN_BUFFER_SIZE = 33 * 1024
 
+  # The names of the class attributes of the format categories.
+  _FORMAT_CATEGORY_ATTRIBUTE_NAMES = {
+      definitions.FORMAT_CATEGORY_ARCHIVE: (
+          '_archive_remainder_list', '_archive_scanner', '_archive_store'),
+      definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: (
+          '_compressed_stream_remainder_list', '_compressed_stream_scanner',
+          '_compressed_stream_store'),
+      definitions.FORMAT_CATEGORY_FILE_SYSTEM: (
+          '_file_system_remainder_list', '_file_system_scanner',
+          '_file_system_store'),
+      definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: (
+          '_storage_media_image_remainder_list',
+          '_storage_media_image_scanner', '_storage_media_image_store'),
+      definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: (
+          '_volume_system_remainder_list', '_volume_system_scanner',
+          '_volume_system_store')}
+
+  # The names of the modules that register the analyzer helpers per format
+  # category and type indicator, used to import the analyzer helpers of
+  # a format category on first use. An analyzer helper is listed under every
+  # format category in its FORMAT_CATEGORIES.
+  _ANALYZER_HELPER_MODULES = {
+      definitions.FORMAT_CATEGORY_ARCHIVE: {
+          definitions.TYPE_INDICATOR_CPIO: (
+              'dfvfs.analyzer.cpio_analyzer_helper'),
+          definitions.TYPE_INDICATOR_EWF: (
+              'dfvfs.analyzer.ewf_analyzer_helper'),
+          definitions.TYPE_INDICATOR_TAR: (
+              'dfvfs.analyzer.tar_analyzer_helper'),
+          definitions.TYPE_INDICATOR_ZIP: (
+              'dfvfs.analyzer.zip_analyzer_helper')},
+      definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: {
+          definitions.TYPE_INDICATOR_BZIP2: (
+              'dfvfs.analyzer.bzip2_analyzer_helper'),
+          definitions.TYPE_INDICATOR_GZIP: (
+              'dfvfs.analyzer.gzip_analyzer_helper')},
+      definitions.FORMAT_CATEGORY_FILE_SYSTEM: {
+          definitions.TYPE_INDICATOR_APFS: (
+              'dfvfs.analyzer.apfs_analyzer_helper'),
+          definitions.TYPE_INDICATOR_NTFS: (
+              'dfvfs.analyzer.ntfs_analyzer_helper'),
+          definitions.TYPE_INDICATOR_TSK: (
+              'dfvfs.analyzer.tsk_analyzer_helper')},
+      definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: {
+          definitions.TYPE_INDICATOR_EWF: (
+              'dfvfs.analyzer.ewf_analyzer_helper'),
+          definitions.TYPE_INDICATOR_QCOW: (
+              'dfvfs.analyzer.qcow_analyzer_helper'),
+          definitions.TYPE_INDICATOR_VHDI: (
+              'dfvfs.analyzer.vhdi_analyzer_helper'),
+          definitions.TYPE_INDICATOR_VMDK: (
+              'dfvfs.analyzer.vmdk_analyzer_helper')},
+      definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: {
+          definitions.TYPE_INDICATOR_APFS_CONTAINER: (
+              'dfvfs.analyzer.apfs_container_analyzer_helper'),
+          definitions.TYPE_INDICATOR_BDE: (
+              'dfvfs.analyzer.bde_analyzer_helper'),
+          definitions.TYPE_INDICATOR_FVDE: (
+              'dfvfs.analyzer.fvde_analyzer_helper'),
+          definitions.TYPE_INDICATOR_LVM: (
+              'dfvfs.analyzer.lvm_analyzer_helper'),
+          definitions.TYPE_INDICATOR_TSK_PARTITION: (
+              'dfvfs.analyzer.tsk_partition_analyzer_helper'),
+          definitions.TYPE_INDICATOR_VSHADOW: (
+              'dfvfs.analyzer.vshadow_analyzer_helper')}}
+
+  # The maximum number of analysis results in the results cache.
+  _MAXIMUM_NUMBER_OF_CACHED_RESULTS = 1024
+
   _analyzer_helpers = {}
 
+  # The analysis results cache, that contains the type indicators per
+  # path specification comparable and format category, in least recently
+  # used order.
+  _results_cache = collections.OrderedDict()
+
   # The archive format category analyzer helpers that do not have
   # a format specification.
   _archive_remainder_list = None
@@ -74,6 +255,10 @@ class Analyzer(object):
     Args:
       format_categories (set[str]): format categories.
     """
+    for cache_key in list(cls._results_cache.keys()):
+      if cache_key[1] in format_categories:
+        del cls._results_cache[cache_key]
+
     if definitions.FORMAT_CATEGORY_ARCHIVE in format_categories:
       cls._archive_remainder_list = None
       cls._archive_scanner = None
@@ -130,10 +315,60 @@ class Analyzer(object):
 
     return signature_scanner
 
+  @classmethod
+  def _GetSignatureScannerByFormatCategory(cls, format_category):
+    """Retrieves the signature scanner of a format category.
+
+    Args:
+      format_category (int): format category.
+
+    Returns:
+      tuple[pysigscan.scanner, FormatSpecificationStore, list[AnalyzerHelper]]:
+          signature scanner, format specification store and remaining analyzer
+          helpers that do not have a format specification.
+    """
+    remainder_list_name, scanner_name, store_name = (
+        cls._FORMAT_CATEGORY_ATTRIBUTE_NAMES[format_category])
+
+    if (getattr(cls, remainder_list_name) is None or
+        getattr(cls, store_name) is None):
+      specification_store, remainder_list = cls._GetSpecificationStore(
+          format_category)
+      setattr(cls, remainder_list_name, remainder_list)
+      setattr(cls, store_name, specification_store)
+
+    if getattr(cls, scanner_name) is None:
+      setattr(cls, scanner_name, cls._GetSignatureScanner(
+          getattr(cls, store_name)))
+
+    return (
+        getattr(cls, scanner_name), getattr(cls, store_name),
+        getattr(cls, remainder_list_name))
+
+  @classmethod
+  def _ImportHelperModules(cls, format_category):
+    """Imports the modules that register the analyzer helpers of a category.
+
+    Modules of analyzer helpers that are already registered are not imported.
+
+    Args:
+      format_category (str): format category.
+    """
+    helper_modules = cls._ANALYZER_HELPER_MODULES.get(format_category, {})
+    for type_indicator, module_name in sorted(helper_modules.items()):
+      if type_indicator not in cls._analyzer_helpers:
+        try:
+          importlib.import_module(module_name)
+        except ImportError:
+          pass
+
   @classmethod
   def _GetSpecificationStore(cls, format_category):
     """Retrieves the specification store for specified format category.
 
+    The modules of analyzer helpers of the format category that are not
+    registered, for example in lazy import mode, are imported first.
+
     Args:
       format_category (str): format category.
 
@@ -142,6 +377,8 @@ class Analyzer(object):
           specification store and remaining analyzer helpers that do not have
           a format specification.
     """
+    cls._ImportHelperModules(format_category)
+
     specification_store = specification.FormatSpecificationStore()
     remainder_list = []
 
@@ -238,19 +475,12 @@ class Analyzer(object):
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._archive_remainder_list is None or
-        cls._archive_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_ARCHIVE)
-      cls._archive_remainder_list = remainder_list
-      cls._archive_store = specification_store
-
-    if cls._archive_scanner is None:
-      cls._archive_scanner = cls._GetSignatureScanner(cls._archive_store)
+    signature_scanner, specification_store, remainder_list = (
+        cls._GetSignatureScannerByFormatCategory(
+            definitions.FORMAT_CATEGORY_ARCHIVE))
 
     return cls._GetTypeIndicators(
-        cls._archive_scanner, cls._archive_store,
-        cls._archive_remainder_list, path_spec,
+        signature_scanner, specification_store, remainder_list, path_spec,
         resolver_context=resolver_context)
 
   @classmethod
@@ -265,20 +495,12 @@ class Analyzer(object):
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._compressed_stream_remainder_list is None or
-        cls._compressed_stream_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_COMPRESSED_STREAM)
-      cls._compressed_stream_remainder_list = remainder_list
-      cls._compressed_stream_store = specification_store
-
-    if cls._compressed_stream_scanner is None:
-      cls._compressed_stream_scanner = cls._GetSignatureScanner(
-          cls._compressed_stream_store)
+    signature_scanner, specification_store, remainder_list = (
+        cls._GetSignatureScannerByFormatCategory(
+            definitions.FORMAT_CATEGORY_COMPRESSED_STREAM))
 
     return cls._GetTypeIndicators(
-        cls._compressed_stream_scanner, cls._compressed_stream_store,
-        cls._compressed_stream_remainder_list, path_spec,
+        signature_scanner, specification_store, remainder_list, path_spec,
         resolver_context=resolver_context)
 
   @classmethod
@@ -293,20 +515,12 @@ class Analyzer(object):
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._file_system_remainder_list is None or
-        cls._file_system_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_FILE_SYSTEM)
-      cls._file_system_remainder_list = remainder_list
-      cls._file_system_store = specification_store
-
-    if cls._file_system_scanner is None:
-      cls._file_system_scanner = cls._GetSignatureScanner(
-          cls._file_system_store)
+    signature_scanner, specification_store, remainder_list = (
+        cls._GetSignatureScannerByFormatCategory(
+            definitions.FORMAT_CATEGORY_FILE_SYSTEM))
 
     return cls._GetTypeIndicators(
-        cls._file_system_scanner, cls._file_system_store,
-        cls._file_system_remainder_list, path_spec,
+        signature_scanner, specification_store, remainder_list, path_spec,
         resolver_context=resolver_context)
 
   @classmethod
@@ -321,22 +535,126 @@ class Analyzer(object):
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._storage_media_image_remainder_list is None or
-        cls._storage_media_image_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE)
-      cls._storage_media_image_remainder_list = remainder_list
-      cls._storage_media_image_store = specification_store
-
-    if cls._storage_media_image_scanner is None:
-      cls._storage_media_image_scanner = cls._GetSignatureScanner(
-          cls._storage_media_image_store)
+    signature_scanner, specification_store, remainder_list = (
+        cls._GetSignatureScannerByFormatCategory(
+            definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE))
 
     return cls._GetTypeIndicators(
-        cls._storage_media_image_scanner, cls._storage_media_image_store,
-        cls._storage_media_image_remainder_list, path_spec,
+        signature_scanner, specification_store, remainder_list, path_spec,
         resolver_context=resolver_context)
 
+  @classmethod
+  def EmptyResultsCache(cls):
+    """Empties the analysis results cache."""
+    cls._results_cache = collections.OrderedDict()
+
+  @classmethod
+  def GetTypeIndicatorsByFormatCategory(
+      cls, path_spec, format_categories, resolver_context=None,
+      use_cache=False):
+    """Determines if a file contains supported types of format categories.
+
+    The file is opened once and the data scanned for signatures, such as
+    the start and end of the file, is read once and shared by the signature
+    scanners of all format categories. This is more efficient than
+    determining the type indicators of every format category separately.
+
+    The results can be cached per path specification and format category,
+    which avoids analyzing the same data again, for example when a source is
+    scanned again. The results cache is bounded and flushed when analyzer
+    helpers are registered or deregistered. Since the path specification
+    does not necessarily define the data, such as of an encrypted volume that
+    was unlocked or a file that changed, the results cache is optional. Note
+    that the results cache is shared by all resolver contexts.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_categories (set[int]): format categories, such as
+          FORMAT_CATEGORY_FILE_SYSTEM.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents the built-in context which is not multi process safe.
+      use_cache (Optional[bool]): True if the analysis results cache should
+          be used.
+
+    Returns:
+      dict[int, list[str]]: supported format type indicators per format
+          category.
+
+    Raises:
+      ValueError: if a format category is not supported.
+    """
+    format_categories = sorted(set(format_categories))
+    for format_category in format_categories:
+      if format_category not in cls._FORMAT_CATEGORY_ATTRIBUTE_NAMES:
+        raise ValueError('Unsupported format category: {0!s}.'.format(
+            format_category))
+
+    type_indicators = {}
+
+    if use_cache:
+      comparable = path_spec.comparable
+
+      uncached_format_categories = []
+      for format_category in format_categories:
+        cache_key = (comparable, format_category)
+        type_indicator_list = cls._results_cache.get(cache_key, None)
+        if type_indicator_list is None:
+          uncached_format_categories.append(format_category)
+        else:
+          # Move the result to the end of the cache since it was recently used.
+          del cls._results_cache[cache_key]
+          cls._results_cache[cache_key] = type_indicator_list
+          type_indicators[format_category] = list(type_indicator_list)
+
+      format_categories = uncached_format_categories
+      if not format_categories:
+        return type_indicators
+
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=resolver_context)
+
+    try:
+      scan_data_file_object = _ScanDataFileObject(
+          file_object, cls._SCAN_BUFFER_SIZE)
+
+      for format_category in format_categories:
+        signature_scanner, specification_store, remainder_list = (
+            cls._GetSignatureScannerByFormatCategory(format_category))
+
+        type_indicator_list = []
+
+        scan_state = pysigscan.scan_state()
+        signature_scanner.scan_file_object(scan_state, scan_data_file_object)
+
+        for scan_result in iter(scan_state.scan_results):
+          format_specification = (
+              specification_store.GetSpecificationBySignature(
+                  scan_result.identifier))
+
+          if format_specification.identifier not in type_indicator_list:
+            type_indicator_list.append(format_specification.identifier)
+
+        for analyzer_helper in remainder_list:
+          result = analyzer_helper.AnalyzeFileObject(file_object)
+
+          if result is not None:
+            type_indicator_list.append(result)
+
+        type_indicators[format_category] = type_indicator_list
+
+    finally:
+      file_object.close()
+
+    if use_cache:
+      for format_category in format_categories:
+        cls._results_cache[(comparable, format_category)] = list(
+            type_indicators[format_category])
+
+      while len(cls._results_cache) > cls._MAXIMUM_NUMBER_OF_CACHED_RESULTS:
+        cls._results_cache.popitem(last=False)
+
+    return type_indicators
+
   @classmethod
   def GetVolumeSystemTypeIndicators(cls, path_spec, resolver_context=None):
     """Determines if a file contains a supported volume system types.
@@ -349,20 +667,12 @@ class Analyzer(object):
     Returns:
       list[str]: supported format type indicators.
     """
-    if (cls._volume_system_remainder_list is None or
-        cls._volume_system_store is None):
-      specification_store, remainder_list = cls._GetSpecificationStore(
-          definitions.FORMAT_CATEGORY_VOLUME_SYSTEM)
-      cls._volume_system_remainder_list = remainder_list
-      cls._volume_system_store = specification_store
-
-    if cls._volume_system_scanner is None:
-      cls._volume_system_scanner = cls._GetSignatureScanner(
-          cls._volume_system_store)
+    signature_scanner, specification_store, remainder_list = (
+        cls._GetSignatureScannerByFormatCategory(
+            definitions.FORMAT_CATEGORY_VOLUME_SYSTEM))
 
     return cls._GetTypeIndicators(
-        cls._volume_system_scanner, cls._volume_system_store,
-        cls._volume_system_remainder_list, path_spec,
+        signature_scanner, specification_store, remainder_list, path_spec,
         resolver_context=resolver_context)
 
   @classmethod
@@ -11,6 +11,18 @@ class Decompressor(object):
 
   # pylint: disable=redundant-returns-doc
 
+  def Copy(self):
+    """Copies the decompressor including its decompression state.
+
+    A copy of the decompressor can be used to resume decompression from
+    the point where the copy was made.
+
+    Returns:
+      Decompressor: copy of the decompressor or None if the decompressor
+          does not support copying its decompression state.
+    """
+    return None
+
   @abc.abstractmethod
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
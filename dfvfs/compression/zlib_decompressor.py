@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import copy
 import zlib
 
 from dfvfs.compression import decompressor
@@ -32,6 +33,17 @@ class ZlibDecompressor(decompressor.Decompressor):
     """bytes: data past the end of the compressed data."""
     return self._zlib_decompressor.unused_data
 
+  def Copy(self):
+    """Copies the decompressor including its decompression state.
+
+    Returns:
+      ZlibDecompressor: copy of the decompressor.
+    """
+    decompressor_copy = copy.copy(self)
+    # pylint: disable=protected-access
+    decompressor_copy._zlib_decompressor = self._zlib_decompressor.copy()
+    return decompressor_copy
+
   def Decompress(self, compressed_data):
     """Decompresses the compressed data.
 
@@ -15,6 +15,9 @@ from dfvfs.lib import errors
 class Base16Decoder(decoder.Decoder):
   """Base16 decoder using base64."""
 
+  _BITS_PER_CHARACTER = 4
+  _ENCODED_GROUP_SIZE = 2
+
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE16
 
   def Decode(self, encoded_data):
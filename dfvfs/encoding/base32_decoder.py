@@ -15,6 +15,9 @@ from dfvfs.lib import errors
 class Base32Decoder(decoder.Decoder):
   """Base32 decoder using base64."""
 
+  _BITS_PER_CHARACTER = 5
+  _ENCODED_GROUP_SIZE = 8
+
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE32
 
   def Decode(self, encoded_data):
@@ -15,6 +15,9 @@ from dfvfs.lib import errors
 class Base64Decoder(decoder.Decoder):
   """Base64 decoder using base64."""
 
+  _BITS_PER_CHARACTER = 6
+  _ENCODED_GROUP_SIZE = 4
+
   ENCODING_METHOD = definitions.ENCODING_METHOD_BASE64
 
   def Decode(self, encoded_data):
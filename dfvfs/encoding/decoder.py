@@ -7,7 +7,26 @@ import abc
 
 
 class Decoder(object):
-  """Decoder interface."""
+  """Decoder interface.
+
+  Decoders of encodings that map fixed-size groups of encoded characters
+  onto fixed-size groups of decoded bytes, such as base64, support random
+  access. The decoded data offset of any encoded character can be determined
+  without decoding the data that precedes it.
+  """
+
+  # The number of bits encoded by a character or None if the encoding does
+  # not support random access.
+  _BITS_PER_CHARACTER = None
+
+  # The number of characters of an encoded group.
+  _ENCODED_GROUP_SIZE = None
+
+  # The padding character.
+  PADDING_CHARACTER = b'='
+
+  # The characters that are ignored in the encoded data, such as line breaks.
+  WHITESPACE_CHARACTERS = b'\t\n\r '
 
   # pylint: disable=redundant-returns-doc
 
@@ -21,3 +40,79 @@ class Decoder(object):
     Returns:
       tuple(bytes, bytes): decoded data and remaining encoded data.
     """
+
+  def DecodeGroups(self, encoded_data):
+    """Decodes the encoded groups in the encoded data.
+
+    Whitespace is ignored and a trailing partial encoded group is returned
+    as remaining encoded data.
+
+    Args:
+      encoded_data (byte): encoded data.
+
+    Returns:
+      tuple(bytes, bytes): decoded data and remaining encoded data.
+
+    Raises:
+      ValueError: if the decoder does not support random access.
+    """
+    if not self.SupportsRandomAccess():
+      raise ValueError('Random access not supported.')
+
+    encoded_data = encoded_data.translate(None, self.WHITESPACE_CHARACTERS)
+
+    index_split = len(encoded_data) - (
+        len(encoded_data) % self._ENCODED_GROUP_SIZE)
+
+    decoded_data, _ = self.Decode(encoded_data[:index_split])
+    return decoded_data, encoded_data[index_split:]
+
+  def GetDecodedDataSize(self, number_of_characters):
+    """Retrieves the decoded data size.
+
+    Args:
+      number_of_characters (int): number of encoded characters, excluding
+          whitespace and padding.
+
+    Returns:
+      int: decoded data size.
+
+    Raises:
+      ValueError: if the decoder does not support random access.
+    """
+    if not self.SupportsRandomAccess():
+      raise ValueError('Random access not supported.')
+
+    return (number_of_characters * self._BITS_PER_CHARACTER) // 8
+
+  def GetEncodedGroup(self, decoded_data_offset):
+    """Retrieves the encoded group that contains a decoded data offset.
+
+    Args:
+      decoded_data_offset (int): decoded data offset.
+
+    Returns:
+      tuple[int, int]: offset of the first character of the encoded group,
+          excluding whitespace, and the decoded data offset relative to the
+          start of the group.
+
+    Raises:
+      ValueError: if the decoder does not support random access.
+    """
+    if not self.SupportsRandomAccess():
+      raise ValueError('Random access not supported.')
+
+    decoded_group_size = (
+        self._ENCODED_GROUP_SIZE * self._BITS_PER_CHARACTER) // 8
+
+    group_index, relative_offset = divmod(
+        decoded_data_offset, decoded_group_size)
+    return group_index * self._ENCODED_GROUP_SIZE, relative_offset
+
+  def SupportsRandomAccess(self):
+    """Determines if the decoder supports random access.
+
+    Returns:
+      bool: True if the decoder supports random access.
+    """
+    return self._BITS_PER_CHARACTER is not None
@@ -5,9 +5,18 @@ from __future__ import unicode_literals
 
 import abc
 
+from dfvfs.lib import definitions
+
 
 class Decrypter(object):
-  """Decrypter interface."""
+  """Decrypter interface.
+
+  Attributes:
+    block_size (int): size in bytes of the blocks that can be decrypted
+        independently, see ResetToBlock, or None if not supported.
+  """
+
+  block_size = None
 
   def __init__(self, **kwargs):
     """Initializes a decrypter.
@@ -35,3 +44,157 @@ class Decrypter(object):
     Returns:
       tuple[bytes, bytes]: decrypted data and remaining encrypted data.
     """
+
+  def ResetToBlock(self, previous_encrypted_block=None):
+    """Resets the decrypter to decrypt data starting at a block boundary.
+
+    Args:
+      previous_encrypted_block (Optional[bytes]): encrypted block that
+          precedes the block to decrypt next or None if decryption starts at
+          the first block.
+
+    Raises:
+      ValueError: if the decrypter does not support random access.
+    """
+    raise ValueError('Random access not supported.')
+
+  def SupportsRandomAccess(self):
+    """Determines if the decrypter supports random access.
+
+    A decrypter that supports random access can decrypt any block given
+    only the encrypted block that precedes it, see ResetToBlock.
+
+    Returns:
+      bool: True if the decrypter supports random access.
+    """
+    return False
+
+
+class BlockCipherDecrypter(Decrypter):
+  """Block cipher decrypter using pycrypto.
+
+  Attributes:
+    block_size (int): block size of the cipher in bytes.
+  """
+
+  # The pycrypto cipher module, such as Crypto.Cipher.AES.
+  _CIPHER_MODULE = None
+
+  # The block cipher modes that support decrypting a block independently of
+  # the blocks that precede it, except for the previous encrypted block.
+  _RANDOM_ACCESS_CIPHER_MODES = frozenset([
+      definitions.ENCRYPTION_MODE_CBC,
+      definitions.ENCRYPTION_MODE_ECB])
+
+  ENCRYPTION_MODES = {}
+
+  def __init__(
+      self, cipher_mode=None, initialization_vector=None, key=None, **kwargs):
+    """Initializes a decrypter.
+
+    Args:
+      cipher_mode (Optional[str]): cipher mode.
+      initialization_vector (Optional[bytes]): initialization vector.
+      key (Optional[bytes]): key.
+      kwargs (dict): keyword arguments depending on the decrypter.
+
+    Raises:
+      ValueError: when key is not set, block cipher mode is not supported,
+          or initialization_vector is required and not set.
+    """
+    if not key:
+      raise ValueError('Missing key.')
+
+    pycrypto_cipher_mode = self.ENCRYPTION_MODES.get(cipher_mode, None)
+    if pycrypto_cipher_mode is None:
+      raise ValueError('Unsupported cipher mode: {0!s}'.format(cipher_mode))
+
+    if (cipher_mode != definitions.ENCRYPTION_MODE_ECB and
+        not initialization_vector):
+      # Pycrypto does not create a meaningful error when initialization vector
+      # is missing. Therefore, we report it ourselves.
+      raise ValueError('Missing initialization vector.')
+
+    super(BlockCipherDecrypter, self).__init__()
+    self._cipher_mode = cipher_mode
+    self._initialization_vector = initialization_vector
+    self._key = key
+    self._cipher = self._CreateCipher(initialization_vector)
+
+    self.block_size = self._CIPHER_MODULE.block_size
+
+  def _CreateCipher(self, initialization_vector):
+    """Creates a cipher.
+
+    Args:
+      initialization_vector (bytes): initialization vector, which is ignored
+          for ECB.
+
+    Returns:
+      object: pycrypto cipher.
+    """
+    pycrypto_cipher_mode = self.ENCRYPTION_MODES[self._cipher_mode]
+    if self._cipher_mode == definitions.ENCRYPTION_MODE_ECB:
+      return self._CIPHER_MODULE.new(self._key, mode=pycrypto_cipher_mode)
+
+    return self._CIPHER_MODULE.new(
+        self._key, IV=initialization_vector, mode=pycrypto_cipher_mode)
+
+  def Decrypt(self, encrypted_data):
+    """Decrypts the encrypted data.
+
+    Args:
+      encrypted_data (bytes): encrypted data.
+
+    Returns:
+      tuple[bytes, bytes]: decrypted data and remaining encrypted data.
+    """
+    index_split = -(len(encrypted_data) % self.block_size)
+    if index_split:
+      remaining_encrypted_data = encrypted_data[index_split:]
+      encrypted_data = encrypted_data[:index_split]
+    else:
+      remaining_encrypted_data = b''
+
+    decrypted_data = self._cipher.decrypt(encrypted_data)
+
+    return decrypted_data, remaining_encrypted_data
+
+  def ResetToBlock(self, previous_encrypted_block=None):
+    """Resets the decrypter to decrypt data starting at a block boundary.
+
+    In CBC mode the previous encrypted block is the initialization vector of
+    the block to decrypt next. In ECB mode every block is decrypted
+    independently.
+
+    Args:
+      previous_encrypted_block (Optional[bytes]): encrypted block that
+          precedes the block to decrypt next or None if decryption starts at
+          the first block.
+
+    Raises:
+      ValueError: if the decrypter does not support random access or
+          the previous encrypted block is not of the block size.
+    """
+    if not self.SupportsRandomAccess():
+      raise ValueError(
+          'Random access not supported in cipher mode: {0!s}'.format(
+              self._cipher_mode))
+
+    if previous_encrypted_block is None:
+      initialization_vector = self._initialization_vector
+    elif len(previous_encrypted_block) != self.block_size:
+      raise ValueError('Invalid previous encrypted block size: {0:d}.'.format(
+          len(previous_encrypted_block)))
+    else:
+      initialization_vector = previous_encrypted_block
+
+    self._cipher = self._CreateCipher(initialization_vector)
+
+  def SupportsRandomAccess(self):
+    """Determines if the decrypter supports random access.
+
+    Returns:
+      bool: True if the cipher mode is CBC or ECB.
+    """
+    return self._cipher_mode in self._RANDOM_ACCESS_CIPHER_MODES
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import bisect
 import os
 
 from dfvfs.compression import manager as compression_manager
@@ -11,12 +12,54 @@ from dfvfs.lib import errors
 from dfvfs.resolver import resolver
 
 
+class _CompressedStreamSeekPoint(object):
+  """Compressed stream seek point.
+
+  A seek point stores the decompression state at a specific offset so that
+  decompression can be resumed from that offset.
+
+  Attributes:
+    compressed_data (bytes): compressed data that was read from the
+        file-like object but not yet consumed by the decompressor.
+    compressed_data_offset (int): offset in the compressed stream at which
+        to resume reading.
+    decompressor (Decompressor): decompressor with the decompression state
+        at the seek point.
+    uncompressed_data_offset (int): offset in the uncompressed stream that
+        corresponds with the seek point.
+  """
+
+  def __init__(
+      self, decompressor, compressed_data_offset, compressed_data,
+      uncompressed_data_offset):
+    """Initializes a compressed stream seek point.
+
+    Args:
+      decompressor (Decompressor): decompressor with the decompression state
+          at the seek point.
+      compressed_data_offset (int): offset in the compressed stream at which
+          to resume reading.
+      compressed_data (bytes): compressed data that was read from the
+          file-like object but not yet consumed by the decompressor.
+      uncompressed_data_offset (int): offset in the uncompressed stream that
+          corresponds with the seek point.
+    """
+    super(_CompressedStreamSeekPoint, self).__init__()
+    self.compressed_data = compressed_data
+    self.compressed_data_offset = compressed_data_offset
+    self.decompressor = decompressor
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+
 class CompressedStream(file_io.FileIO):
   """File-like object of a compressed stream."""
 
   # The size of the compressed data buffer.
   _COMPRESSED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
 
+  # The minimum distance in the uncompressed stream between seek points.
+  _SEEK_POINT_INTERVAL = 8 * 1024 * 1024
+
   def __init__(
       self, resolver_context, compression_method=None, file_object=None):
     """Initializes a file-like object.
@@ -42,12 +85,16 @@ class CompressedStream(file_io.FileIO):
     self._file_object = file_object
     self._file_object_set_in_init = bool(file_object)
     self._compressed_data = b''
+    self._compressed_data_offset = 0
     self._current_offset = 0
     self._decompressor = None
     self._realign_offset = True
+    self._seek_points = []
+    self._seek_point_offsets = []
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
     self._uncompressed_data_size = 0
+    self._uncompressed_data_stream_offset = 0
     self._uncompressed_stream_size = None
 
   def _Close(self):
@@ -64,6 +111,8 @@ class CompressedStream(file_io.FileIO):
     self._compressed_data = b''
     self._uncompressed_data = b''
     self._decompressor = None
+    self._seek_points = []
+    self._seek_point_offsets = []
 
   def _GetDecompressor(self):
     """Retrieves the decompressor.
@@ -80,24 +129,21 @@ class CompressedStream(file_io.FileIO):
     Returns:
       int: uncompressed stream size.
     """
-    self._file_object.seek(0, os.SEEK_SET)
+    seek_point = None
+    if self._seek_points:
+      seek_point = self._seek_points[-1]
 
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    self._ResetDecompressor(seek_point=seek_point)
+    self._realign_offset = True
 
-    compressed_data_offset = 0
     compressed_data_size = self._file_object.get_size()
-    uncompressed_stream_size = 0
 
-    while compressed_data_offset < compressed_data_size:
+    while self._compressed_data_offset < compressed_data_size:
       read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
       if read_count == 0:
         break
 
-      compressed_data_offset += read_count
-      uncompressed_stream_size += self._uncompressed_data_size
-
-    return uncompressed_stream_size
+    return self._uncompressed_data_stream_offset + self._uncompressed_data_size
 
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object.
@@ -133,29 +179,39 @@ class CompressedStream(file_io.FileIO):
   def _AlignUncompressedDataOffset(self, uncompressed_data_offset):
     """Aligns the compressed file with the uncompressed data offset.
 
+    Decompression is resumed from the current decompression state, when
+    the uncompressed data offset lies ahead of it, or from the nearest
+    preceding seek point, whichever is closer.
+
     Args:
       uncompressed_data_offset (int): uncompressed data offset.
     """
-    self._file_object.seek(0, os.SEEK_SET)
-
-    self._decompressor = self._GetDecompressor()
-    self._uncompressed_data = b''
+    seek_point = None
+    seek_point_index = bisect.bisect_right(
+        self._seek_point_offsets, uncompressed_data_offset)
+    if seek_point_index > 0:
+      seek_point = self._seek_points[seek_point_index - 1]
+
+    if (self._decompressor is None or
+        uncompressed_data_offset < self._uncompressed_data_stream_offset or (
+            seek_point and seek_point.uncompressed_data_offset > (
+                self._uncompressed_data_stream_offset +
+                self._uncompressed_data_size))):
+      self._ResetDecompressor(seek_point=seek_point)
 
-    compressed_data_offset = 0
     compressed_data_size = self._file_object.get_size()
 
-    while compressed_data_offset < compressed_data_size:
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      if read_count == 0:
+    while uncompressed_data_offset >= (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size):
+      if self._compressed_data_offset >= compressed_data_size:
         break
 
-      compressed_data_offset += read_count
-
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
+      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
+      if read_count == 0:
         break
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    self._uncompressed_data_offset = (
+        uncompressed_data_offset - self._uncompressed_data_stream_offset)
 
   def _ReadCompressedData(self, read_size):
     """Reads compressed data from the file-like object.
@@ -171,14 +227,75 @@ class CompressedStream(file_io.FileIO):
     read_count = len(compressed_data)
 
     self._compressed_data = b''.join([self._compressed_data, compressed_data])
+    self._compressed_data_offset += read_count
+
+    self._uncompressed_data_stream_offset += self._uncompressed_data_size
 
     self._uncompressed_data, self._compressed_data = (
         self._decompressor.Decompress(self._compressed_data))
 
     self._uncompressed_data_size = len(self._uncompressed_data)
 
+    self._StoreSeekPoint()
+
     return read_count
 
+  def _ResetDecompressor(self, seek_point=None):
+    """Resets the decompressor.
+
+    Args:
+      seek_point (Optional[_CompressedStreamSeekPoint]): seek point to resume
+          decompression from, where None represents the start of the
+          compressed stream.
+    """
+    if seek_point:
+      self._compressed_data = seek_point.compressed_data
+      self._compressed_data_offset = seek_point.compressed_data_offset
+      self._decompressor = seek_point.decompressor.Copy()
+      self._uncompressed_data_stream_offset = (
+          seek_point.uncompressed_data_offset)
+
+    else:
+      self._compressed_data = b''
+      self._compressed_data_offset = 0
+      self._decompressor = self._GetDecompressor()
+      self._uncompressed_data_stream_offset = 0
+
+    self._file_object.seek(self._compressed_data_offset, os.SEEK_SET)
+
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+
+  def _StoreSeekPoint(self):
+    """Stores a seek point for the current decompression state.
+
+    A seek point is only stored if the decompressor supports copying its
+    decompression state and the previous seek point lies at least the seek
+    point interval before the current uncompressed data offset.
+    """
+    uncompressed_data_offset = (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size)
+
+    last_seek_point_offset = 0
+    if self._seek_point_offsets:
+      last_seek_point_offset = self._seek_point_offsets[-1]
+
+    if (uncompressed_data_offset - last_seek_point_offset <
+        self._SEEK_POINT_INTERVAL):
+      return
+
+    decompressor = self._decompressor.Copy()
+    if not decompressor:
+      return
+
+    seek_point = _CompressedStreamSeekPoint(
+        decompressor, self._compressed_data_offset, self._compressed_data,
+        uncompressed_data_offset)
+
+    self._seek_points.append(seek_point)
+    self._seek_point_offsets.append(uncompressed_data_offset)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -217,51 +334,88 @@ class CompressedStream(file_io.FileIO):
     if self._current_offset >= self._uncompressed_stream_size:
       return b''
 
-    if self._realign_offset:
-      self._AlignUncompressedDataOffset(self._current_offset)
-      self._realign_offset = False
-
     if size is None:
       size = self._uncompressed_stream_size
     if self._current_offset + size > self._uncompressed_stream_size:
       size = self._uncompressed_stream_size - self._current_offset
 
-    uncompressed_data = b''
+    if size <= 0:
+      return b''
+
+    read_buffer = bytearray(size)
+    read_count = self.readinto(read_buffer)
+
+    del read_buffer[read_count:]
+    return bytes(read_buffer)
+
+  def readinto(self, buffer):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer, where the size of
+          the buffer is the maximum number of bytes to read.
+
+    Returns:
+      int: number of bytes read, where 0 represents no more data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._uncompressed_stream_size is None:
+      self._uncompressed_stream_size = self._GetUncompressedStreamSize()
 
-    if size == 0:
-      return uncompressed_data
+    if self._uncompressed_stream_size < 0:
+      raise IOError('Invalid uncompressed stream size.')
 
-    while size > self._uncompressed_data_size:
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[self._uncompressed_data_offset:]])
+    if self._current_offset >= self._uncompressed_stream_size:
+      return 0
 
+    if self._realign_offset:
+      self._AlignUncompressedDataOffset(self._current_offset)
+      self._realign_offset = False
+
+    buffer_view = memoryview(buffer)
+
+    size = len(buffer_view)
+    if self._current_offset + size > self._uncompressed_stream_size:
+      size = self._uncompressed_stream_size - self._current_offset
+
+    read_count = 0
+    while read_count < size:
       remaining_uncompressed_data_size = (
           self._uncompressed_data_size - self._uncompressed_data_offset)
 
-      self._current_offset += remaining_uncompressed_data_size
-      size -= remaining_uncompressed_data_size
+      if remaining_uncompressed_data_size <= 0:
+        compressed_read_count = self._ReadCompressedData(
+            self._COMPRESSED_DATA_BUFFER_SIZE)
+        self._uncompressed_data_offset = 0
+        if compressed_read_count == 0:
+          break
 
-      if self._current_offset >= self._uncompressed_stream_size:
-        break
+        continue
 
-      read_count = self._ReadCompressedData(self._COMPRESSED_DATA_BUFFER_SIZE)
-      self._uncompressed_data_offset = 0
-      if read_count == 0:
-        break
+      copy_size = min(remaining_uncompressed_data_size, size - read_count)
 
-    if size > 0:
       slice_start_offset = self._uncompressed_data_offset
-      slice_end_offset = slice_start_offset + size
+      slice_end_offset = slice_start_offset + copy_size
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+      buffer_view[read_count:read_count + copy_size] = memoryview(
+          self._uncompressed_data)[slice_start_offset:slice_end_offset]
 
-      self._uncompressed_data_offset += size
-      self._current_offset += size
+      self._uncompressed_data_offset += copy_size
+      self._current_offset += copy_size
+      read_count += copy_size
 
-    return uncompressed_data
+    return read_count
 
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
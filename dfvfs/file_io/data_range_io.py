@@ -169,6 +169,92 @@ class DataRange(file_io.FileIO):
 
     return data
 
+  def readinto(self, buffer):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer, where the size of
+          the buffer is the maximum number of bytes to read.
+
+    Returns:
+      int: number of bytes read, where 0 represents no more data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError('Invalid data range.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._current_offset >= self._range_size:
+      return 0
+
+    buffer_view = memoryview(buffer)
+
+    size = len(buffer_view)
+    if self._current_offset + size > self._range_size:
+      size = self._range_size - self._current_offset
+
+    self._file_object.seek(
+        self._range_offset + self._current_offset, os.SEEK_SET)
+
+    read_count = self._file_object.readinto(buffer_view[:size])
+
+    self._current_offset += read_count
+
+    return read_count
+
+  def read_ranges(self, ranges):
+    """Reads byte strings from the file-like object at multiple offsets.
+
+    The ranges are mapped onto the parent file-like object, which coalesces
+    adjacent and overlapping ranges. The current offset is not changed.
+
+    Args:
+      ranges (list[tuple[int, int]]): offsets and sizes of the ranges to
+          read.
+
+    Returns:
+      list[bytes]: data read per range, in the order of the ranges, where
+          the data is smaller than the size of the range if the range exceeds
+          the end of the data.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the read failed.
+      OSError: if the file-like object has not been opened or the read failed.
+      ValueError: if a range offset or range size is invalid.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._range_offset < 0 or self._range_size < 0:
+      raise IOError('Invalid data range.')
+
+    if not hasattr(self._file_object, 'read_ranges'):
+      return super(DataRange, self).read_ranges(ranges)
+
+    ranges = list(ranges)
+    self._CheckRanges(ranges)
+
+    parent_ranges = []
+    for range_offset, range_size in ranges:
+      if range_offset >= self._range_size:
+        range_size = 0
+      elif range_offset + range_size > self._range_size:
+        range_size = self._range_size - range_offset
+
+      parent_ranges.append((self._range_offset + range_offset, range_size))
+
+    return self._file_object.read_ranges(parent_ranges)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
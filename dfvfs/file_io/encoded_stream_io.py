@@ -3,7 +3,10 @@
 
 from __future__ import unicode_literals
 
+import array
+import bisect
 import os
+import re
 
 from dfvfs.encoding import manager as encoding_manager
 from dfvfs.file_io import file_io
@@ -12,7 +15,18 @@ from dfvfs.resolver import resolver
 
 
 class EncodedStream(file_io.FileIO):
-  """File-like object of a encoded stream."""
+  """File-like object of a encoded stream.
+
+  If the decoder supports random access, such as base16, base32 and base64,
+  an index of the file offsets of the runs of encoded characters between
+  whitespace is built on first use. This index is used to determine the
+  decoded stream size and to seek without decoding the preceding data.
+
+  Consecutive runs of the same size that are separated by the same amount
+  of whitespace, such as the lines of line-wrapped encoded data, are stored
+  as a single segment of the index, of which the file offsets of the runs
+  are calculated.
+  """
 
   # The size of the encoded data buffer.
   _ENCODED_DATA_BUFFER_SIZE = 8 * 1024 * 1024
@@ -37,6 +51,11 @@ class EncodedStream(file_io.FileIO):
           'File-like object provided without corresponding encoding method.')
 
     super(EncodedStream, self).__init__(resolver_context)
+    self._character_index_character_offsets = None
+    self._character_index_file_offsets = None
+    self._character_index_number_of_runs = None
+    self._character_index_run_sizes = None
+    self._character_index_run_strides = None
     self._current_offset = 0
     self._decoded_data = b''
     self._decoded_data_offset = 0
@@ -47,6 +66,8 @@ class EncodedStream(file_io.FileIO):
     self._encoding_method = encoding_method
     self._file_object = file_object
     self._file_object_set_in_init = bool(file_object)
+    self._number_of_characters = 0
+    self._number_of_padding_characters = 0
     self._realign_offset = True
 
   def _Close(self):
@@ -60,10 +81,146 @@ class EncodedStream(file_io.FileIO):
       self._file_object.close()
       self._file_object = None
 
+    self._character_index_character_offsets = None
+    self._character_index_file_offsets = None
+    self._character_index_number_of_runs = None
+    self._character_index_run_sizes = None
+    self._character_index_run_strides = None
     self._decoder = None
     self._decoded_data = b''
     self._encoded_data = b''
 
+  def _AddCharacterRun(self, character_offset, file_offset, run_size):
+    """Adds a run of encoded characters to the index.
+
+    The run is added to the last segment of the index if the runs of
+    the segment have the same size and the run follows at the same distance.
+    Only the last run of a segment can be smaller than the other runs.
+
+    Args:
+      character_offset (int): offset of the first encoded character of
+          the run, excluding whitespace.
+      file_offset (int): offset of the run in the file-like object.
+      run_size (int): number of encoded characters in the run.
+    """
+    segment_index = len(self._character_index_character_offsets) - 1
+    if segment_index >= 0:
+      segment_run_size = self._character_index_run_sizes[segment_index]
+      number_of_runs = self._character_index_number_of_runs[segment_index]
+
+      # A segment of which the last run is smaller is complete.
+      segment_size = segment_run_size * number_of_runs
+      is_complete = character_offset != (
+          self._character_index_character_offsets[segment_index] +
+          segment_size)
+
+      if not is_complete and run_size <= segment_run_size:
+        segment_file_offset = self._character_index_file_offsets[segment_index]
+        if number_of_runs == 1:
+          self._character_index_run_strides[segment_index] = (
+              file_offset - segment_file_offset)
+
+        run_stride = self._character_index_run_strides[segment_index]
+        if file_offset == segment_file_offset + number_of_runs * run_stride:
+          self._character_index_number_of_runs[segment_index] += 1
+          return
+
+    self._character_index_character_offsets.append(character_offset)
+    self._character_index_file_offsets.append(file_offset)
+    self._character_index_number_of_runs.append(1)
+    self._character_index_run_sizes.append(run_size)
+    self._character_index_run_strides.append(0)
+
+  def _BuildCharacterIndex(self):
+    """Builds the index of runs of encoded characters between whitespace."""
+    whitespace_characters = re.escape(self._decoder.WHITESPACE_CHARACTERS)
+    characters_run_regex = re.compile(
+        b''.join([b'[^', whitespace_characters, b']+']))
+
+    self._character_index_character_offsets = self._CreateIndexArray()
+    self._character_index_file_offsets = self._CreateIndexArray()
+    self._character_index_number_of_runs = self._CreateIndexArray()
+    self._character_index_run_sizes = self._CreateIndexArray()
+    self._character_index_run_strides = self._CreateIndexArray()
+    self._number_of_characters = 0
+    self._number_of_padding_characters = 0
+
+    self._file_object.seek(0, os.SEEK_SET)
+
+    file_offset = 0
+    last_run_end_offset = None
+    run_character_offset = 0
+    run_file_offset = None
+    run_size = 0
+
+    encoded_data = self._file_object.read(self._ENCODED_DATA_BUFFER_SIZE)
+    while encoded_data:
+      for match in characters_run_regex.finditer(encoded_data):
+        run_start_offset = file_offset + match.start()
+
+        # A run that continues in the next buffer is added once complete.
+        if run_start_offset != last_run_end_offset:
+          if run_file_offset is not None:
+            self._AddCharacterRun(
+                run_character_offset, run_file_offset, run_size)
+
+          run_character_offset = self._number_of_characters
+          run_file_offset = run_start_offset
+          run_size = 0
+
+        run_size += match.end() - match.start()
+        self._number_of_characters += match.end() - match.start()
+        last_run_end_offset = file_offset + match.end()
+
+      self._number_of_padding_characters += encoded_data.count(
+          self._decoder.PADDING_CHARACTER)
+
+      file_offset += len(encoded_data)
+      encoded_data = self._file_object.read(self._ENCODED_DATA_BUFFER_SIZE)
+
+    if run_file_offset is not None:
+      self._AddCharacterRun(run_character_offset, run_file_offset, run_size)
+
+  def _CreateIndexArray(self):
+    """Creates an array to store the values of a column of the index.
+
+    Returns:
+      array.array|list[int]: array of 64-bit unsigned integers or a list
+          if the array type is not supported, such as on Python 2.
+    """
+    try:
+      return array.array('Q')
+    except ValueError:
+      return []
+
+  def _GetCharacterFileOffset(self, character_offset):
+    """Retrieves the file offset of an encoded character.
+
+    Args:
+      character_offset (int): offset of the encoded character, excluding
+          whitespace.
+
+    Returns:
+      int: offset of the encoded character in the file-like object.
+    """
+    index = bisect.bisect_right(
+        self._character_index_character_offsets, character_offset) - 1
+    if index < 0:
+      return character_offset
+
+    relative_offset = (
+        character_offset - self._character_index_character_offsets[index])
+
+    run_size = self._character_index_run_sizes[index]
+    run_index = min(
+        relative_offset // run_size,
+        self._character_index_number_of_runs[index] - 1)
+
+    return (
+        self._character_index_file_offsets[index] +
+        run_index * self._character_index_run_strides[index] +
+        relative_offset - run_index * run_size)
+
   def _GetDecoder(self):
     """Retrieves the decoder.
 
@@ -75,13 +232,29 @@ class EncodedStream(file_io.FileIO):
   def _GetDecodedStreamSize(self):
     """Retrieves the decoded stream size.
 
+    If the decoder supports random access the decoded stream size is
+    determined from the number of encoded characters. Otherwise all encoded
+    data needs to be decoded.
+
     Returns:
       int: decoded stream size.
     """
+    if not self._decoder:
+      self._decoder = self._GetDecoder()
+
+    if self._decoder.SupportsRandomAccess():
+      if self._character_index_character_offsets is None:
+        self._BuildCharacterIndex()
+        self._realign_offset = True
+
+      return self._decoder.GetDecodedDataSize(
+          self._number_of_characters - self._number_of_padding_characters)
+
     self._file_object.seek(0, os.SEEK_SET)
 
     self._decoder = self._GetDecoder()
     self._decoded_data = b''
+    self._encoded_data = b''
 
     encoded_data_offset = 0
     encoded_data_size = self._file_object.get_size()
@@ -131,13 +304,44 @@ class EncodedStream(file_io.FileIO):
   def _AlignDecodedDataOffset(self, decoded_data_offset):
     """Aligns the encoded file with the decoded data offset.
 
+    If the decoder supports random access decoding starts at the encoded
+    group that contains the decoded data offset. Otherwise decoding starts at
+    the beginning of the encoded data.
+
     Args:
       decoded_data_offset (int): decoded data offset.
     """
+    if not self._decoder:
+      self._decoder = self._GetDecoder()
+
+    self._decoded_data = b''
+    self._decoded_data_offset = 0
+    self._decoded_data_size = 0
+    self._encoded_data = b''
+
+    if self._decoder.SupportsRandomAccess():
+      if self._character_index_character_offsets is None:
+        self._BuildCharacterIndex()
+
+      character_offset, relative_offset = self._decoder.GetEncodedGroup(
+          decoded_data_offset)
+      file_offset = self._GetCharacterFileOffset(character_offset)
+
+      self._file_object.seek(file_offset, os.SEEK_SET)
+
+      # Encoded data that only contains whitespace or a partial encoded group
+      # does not decode into data.
+      read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
+      while read_count > 0 and relative_offset >= self._decoded_data_size:
+        read_count = self._ReadEncodedData(self._ENCODED_DATA_BUFFER_SIZE)
+
+      if read_count > 0:
+        self._decoded_data_offset = relative_offset
+      return
+
     self._file_object.seek(0, os.SEEK_SET)
 
     self._decoder = self._GetDecoder()
-    self._decoded_data = b''
 
     encoded_data_offset = 0
     encoded_data_size = self._file_object.get_size()
@@ -170,8 +374,12 @@ class EncodedStream(file_io.FileIO):
 
     self._encoded_data = b''.join([self._encoded_data, encoded_data])
 
-    self._decoded_data, self._encoded_data = (
-        self._decoder.Decode(self._encoded_data))
+    if self._decoder.SupportsRandomAccess():
+      self._decoded_data, self._encoded_data = (
+          self._decoder.DecodeGroups(self._encoded_data))
+    else:
+      self._decoded_data, self._encoded_data = (
+          self._decoder.Decode(self._encoded_data))
 
     self._decoded_data_size = len(self._decoded_data)
 
@@ -253,14 +461,14 @@ class EncodedStream(file_io.FileIO):
     if size == 0:
       return decoded_data
 
-    while size > self._decoded_data_size:
+    remaining_decoded_data_size = (
+        self._decoded_data_size - self._decoded_data_offset)
+
+    while size > remaining_decoded_data_size:
       decoded_data = b''.join([
           decoded_data,
           self._decoded_data[self._decoded_data_offset:]])
 
-      remaining_decoded_data_size = (
-          self._decoded_data_size - self._decoded_data_offset)
-
       self._current_offset += remaining_decoded_data_size
       size -= remaining_decoded_data_size
 
@@ -272,6 +480,8 @@ class EncodedStream(file_io.FileIO):
       if read_count == 0:
         break
 
+      remaining_decoded_data_size = self._decoded_data_size
+
     if size > 0:
       slice_start_offset = self._decoded_data_offset
       slice_end_offset = slice_start_offset + size
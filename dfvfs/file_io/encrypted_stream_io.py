@@ -87,16 +87,28 @@ class EncryptedStream(file_io.FileIO):
   def _GetDecryptedStreamSize(self):
     """Retrieves the decrypted stream size.
 
+    If the decrypter supports random access the decrypted stream size is
+    the encrypted data size without the trailing partial block, which cannot
+    be decrypted. Otherwise all encrypted data needs to be decrypted.
+
     Returns:
       int: decrypted stream size.
     """
+    if not self._decrypter:
+      self._decrypter = self._GetDecrypter()
+
+    encrypted_data_size = self._file_object.get_size()
+    if self._decrypter.SupportsRandomAccess():
+      block_size = self._decrypter.block_size
+      return encrypted_data_size - (encrypted_data_size % block_size)
+
     self._file_object.seek(0, os.SEEK_SET)
 
     self._decrypter = self._GetDecrypter()
     self._decrypted_data = b''
+    self._encrypted_data = b''
 
     encrypted_data_offset = 0
-    encrypted_data_size = self._file_object.get_size()
     decrypted_stream_size = 0
 
     while encrypted_data_offset < encrypted_data_size:
@@ -145,13 +157,28 @@ class EncryptedStream(file_io.FileIO):
   def _AlignDecryptedDataOffset(self, decrypted_data_offset):
     """Aligns the encrypted file with the decrypted data offset.
 
+    If the decrypter supports random access decryption starts at the block
+    that contains the decrypted data offset. Otherwise decryption starts at
+    the beginning of the encrypted data.
+
     Args:
       decrypted_data_offset (int): decrypted data offset.
     """
+    if not self._decrypter:
+      self._decrypter = self._GetDecrypter()
+
+    self._decrypted_data = b''
+    self._decrypted_data_offset = 0
+    self._decrypted_data_size = 0
+    self._encrypted_data = b''
+
+    if self._decrypter.SupportsRandomAccess():
+      self._AlignDecryptedDataOffsetWithBlock(decrypted_data_offset)
+      return
+
     self._file_object.seek(0, os.SEEK_SET)
 
     self._decrypter = self._GetDecrypter()
-    self._decrypted_data = b''
 
     encrypted_data_offset = 0
     encrypted_data_size = self._file_object.get_size()
@@ -169,6 +196,29 @@ class EncryptedStream(file_io.FileIO):
 
       decrypted_data_offset -= self._decrypted_data_size
 
+  def _AlignDecryptedDataOffsetWithBlock(self, decrypted_data_offset):
+    """Aligns the encrypted file with the block of the decrypted data offset.
+
+    Args:
+      decrypted_data_offset (int): decrypted data offset.
+    """
+    block_size = self._decrypter.block_size
+    block_offset = decrypted_data_offset - (decrypted_data_offset % block_size)
+
+    previous_encrypted_block = None
+    if block_offset > 0:
+      self._file_object.seek(block_offset - block_size, os.SEEK_SET)
+      previous_encrypted_block = self._file_object.read(block_size)
+    else:
+      self._file_object.seek(0, os.SEEK_SET)
+
+    self._decrypter.ResetToBlock(
+        previous_encrypted_block=previous_encrypted_block)
+
+    read_count = self._ReadEncryptedData(self._ENCRYPTED_DATA_BUFFER_SIZE)
+    if read_count > 0:
+      self._decrypted_data_offset = decrypted_data_offset - block_offset
+
   def _ReadEncryptedData(self, read_size):
     """Reads encrypted data from the file-like object.
 
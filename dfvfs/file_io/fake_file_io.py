@@ -96,6 +96,45 @@ class FakeFile(file_io.FileIO):
     self._current_offset += size
     return self._file_data[start_offset:self._current_offset]
 
+  def readinto(self, buffer):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer, where the size of
+          the buffer is the maximum number of bytes to read.
+
+    Returns:
+      int: number of bytes read, where 0 represents no more data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._file_data is None or self._current_offset >= self._size:
+      return 0
+
+    buffer_view = memoryview(buffer)
+
+    size = len(buffer_view)
+    if self._current_offset + size > self._size:
+      size = self._size - self._current_offset
+
+    start_offset = self._current_offset
+    self._current_offset += size
+
+    buffer_view[:size] = memoryview(self._file_data)[
+        start_offset:self._current_offset]
+
+    return size
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
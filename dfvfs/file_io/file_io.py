@@ -12,6 +12,9 @@ class FileIO(object):
 
   # pylint: disable=redundant-returns-doc
 
+  # The maximum size of a single read of coalesced ranges.
+  _MAXIMUM_COALESCED_READ_SIZE = 16 * 1024 * 1024
+
   def __init__(self, resolver_context):
     """Initializes a file-like object.
 
@@ -48,6 +51,96 @@ class FileIO(object):
       ValueError: if the path specification is invalid.
     """
 
+  def _CheckRanges(self, ranges):
+    """Checks the offsets and sizes of ranges to read.
+
+    Args:
+      ranges (list[tuple[int, int]]): offsets and sizes of the ranges.
+
+    Raises:
+      ValueError: if a range offset or range size is invalid.
+    """
+    for range_offset, range_size in ranges:
+      if range_offset < 0:
+        raise ValueError(
+            'Invalid range offset: {0:d} value out of bounds.'.format(
+                range_offset))
+
+      if range_size < 0:
+        raise ValueError(
+            'Invalid range size: {0:d} value out of bounds.'.format(
+                range_size))
+
+  def _CoalesceRanges(self, ranges):
+    """Coalesces adjacent and overlapping ranges.
+
+    Args:
+      ranges (list[tuple[int, int]]): offsets and sizes of the ranges.
+
+    Returns:
+      list[tuple[int, int, list[int]]]: offset and size of every coalesced
+          range and the indexes of the ranges it contains. Empty ranges are
+          not contained in any coalesced range.
+    """
+    coalesced_ranges = []
+
+    range_indexes = sorted(
+        range(len(ranges)), key=lambda range_index: ranges[range_index])
+
+    coalesced_offset = None
+    coalesced_end_offset = None
+    coalesced_range_indexes = []
+
+    for range_index in range_indexes:
+      range_offset, range_size = ranges[range_index]
+      if not range_size:
+        continue
+
+      range_end_offset = range_offset + range_size
+      if coalesced_offset is not None and range_offset <= coalesced_end_offset:
+        end_offset = max(coalesced_end_offset, range_end_offset)
+        if end_offset - coalesced_offset <= self._MAXIMUM_COALESCED_READ_SIZE:
+          coalesced_end_offset = end_offset
+          coalesced_range_indexes.append(range_index)
+          continue
+
+      if coalesced_offset is not None:
+        coalesced_ranges.append((
+            coalesced_offset, coalesced_end_offset - coalesced_offset,
+            coalesced_range_indexes))
+
+      coalesced_offset = range_offset
+      coalesced_end_offset = range_end_offset
+      coalesced_range_indexes = [range_index]
+
+    if coalesced_offset is not None:
+      coalesced_ranges.append((
+          coalesced_offset, coalesced_end_offset - coalesced_offset,
+          coalesced_range_indexes))
+
+    return coalesced_ranges
+
+  def _ReadRange(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    Subclasses that can read at an offset without seeking should override
+    this function.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read, which is smaller than size if the range exceeds
+          the end of the data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    self.seek(offset, os.SEEK_SET)
+    return self.read(size)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -80,6 +173,12 @@ class FileIO(object):
         self._resolver_context.CacheFileObject(path_spec, self)
         self._is_cached = True
 
+    elif (self._is_cached and
+          self._resolver_context.GetFileObjectReferenceCount(path_spec) == 0):
+      # A dereferenced file-like object that was kept open by the resolver
+      # context is reused as if it was newly opened.
+      self.seek(0, os.SEEK_SET)
+
     if self._is_cached:
       self._resolver_context.GrabFileObject(path_spec)
 
@@ -124,6 +223,73 @@ class FileIO(object):
       OSError: if the read failed.
     """
 
+  def readinto(self, buffer):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer, where the size of
+          the buffer is the maximum number of bytes to read.
+
+    Returns:
+      int: number of bytes read, where 0 represents no more data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    buffer_view = memoryview(buffer)
+    data = self.read(len(buffer_view))
+
+    read_count = len(data)
+    buffer_view[:read_count] = data
+
+    return read_count
+
+  def read_ranges(self, ranges):
+    """Reads byte strings from the file-like object at multiple offsets.
+
+    Adjacent and overlapping ranges are coalesced into a single read of
+    the underlying data. The current offset is not changed.
+
+    Args:
+      ranges (list[tuple[int, int]]): offsets and sizes of the ranges to
+          read.
+
+    Returns:
+      list[bytes]: data read per range, in the order of the ranges, where
+          the data is smaller than the size of the range if the range exceeds
+          the end of the data.
+
+    Raises:
+      IOError: if the file-like object has not been opened or the read failed.
+      OSError: if the file-like object has not been opened or the read failed.
+      ValueError: if a range offset or range size is invalid.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    ranges = list(ranges)
+    self._CheckRanges(ranges)
+
+    data_per_range = [b''] * len(ranges)
+
+    current_offset = self.get_offset()
+    try:
+      for coalesced_offset, coalesced_size, range_indexes in (
+          self._CoalesceRanges(ranges)):
+        data = self._ReadRange(coalesced_offset, coalesced_size)
+
+        for range_index in range_indexes:
+          range_offset, range_size = ranges[range_index]
+          data_offset = range_offset - coalesced_offset
+          data_per_range[range_index] = data[
+              data_offset:data_offset + range_size]
+
+    finally:
+      self.seek(current_offset, os.SEEK_SET)
+
+    return data_per_range
+
   @abc.abstractmethod
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
@@ -80,6 +80,27 @@ class FileObjectIO(file_io.FileIO):
       PathSpecError: if the path specification is incorrect.
     """
 
+  def _ReadRange(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read, which is smaller than size if the range exceeds
+          the end of the data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    # The libyal file objects support reading at an offset in a single call.
+    if not hasattr(self._file_object, 'read_buffer_at_offset'):
+      return super(FileObjectIO, self)._ReadRange(offset, size)
+
+    return self._file_object.read_buffer_at_offset(size, offset)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 
 import collections
+import json
 import os
 
 from dfvfs.file_io import file_io
@@ -17,11 +18,18 @@ class GzipFile(file_io.FileIO):
 
   The gzip file format is defined in RFC1952: http://www.zlib.org/rfc-gzip.html
 
+  Determining the members of a gzip file requires all of its data to be
+  decompressed. The member index can be saved to a sidecar file with
+  SaveIndex and loaded with LoadIndex, before the file-like object is opened,
+  to prevent decompressing the gzip file again when it is reopened.
+
   Attributes:
     uncompressed_data_size (int): total size of the decompressed data stored
         in the gzip file.
   """
 
+  _INDEX_FORMAT_VERSION = 1
+
   def __init__(self, resolver_context):
     """Initializes a file-like object.
 
@@ -35,6 +43,7 @@ class GzipFile(file_io.FileIO):
     self._compressed_data_size = -1
     self._current_offset = 0
     self._gzip_file_object = None
+    self._member_index = {}
     self._members_by_end_offset = collections.OrderedDict()
 
     self.uncompressed_data_size = 0
@@ -87,6 +96,72 @@ class GzipFile(file_io.FileIO):
 
     return None
 
+  def LoadIndex(self, path):
+    """Loads the member index from a sidecar file.
+
+    The index is used when the file-like object is opened and is ignored if
+    it does not match the size of the gzip file.
+
+    Args:
+      path (str): path of the index file.
+
+    Raises:
+      IOError: if the file-like object is already opened or the index file
+          cannot be read.
+      OSError: if the file-like object is already opened or the index file
+          cannot be read.
+    """
+    if self._gzip_file_object:
+      raise IOError('Already open.')
+
+    with open(path, 'r') as file_object:
+      try:
+        json_dict = json.load(file_object)
+      except ValueError as exception:
+        raise IOError('Unable to read index with error: {0!s}'.format(
+            exception))
+
+    format_version = json_dict.get('format_version', None)
+    if format_version != self._INDEX_FORMAT_VERSION:
+      raise IOError('Unsupported index format version: {0!s}'.format(
+          format_version))
+
+    self._compressed_data_size = json_dict.get('compressed_data_size', -1)
+    self._member_index = {}
+    for member_values in json_dict.get('members', []):
+      member_start_offset = member_values.get('member_start_offset', None)
+      self._member_index[member_start_offset] = (
+          member_values.get('member_end_offset', None),
+          member_values.get('uncompressed_data_size', None))
+
+  def SaveIndex(self, path):
+    """Saves the member index to a sidecar file.
+
+    Args:
+      path (str): path of the index file.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._gzip_file_object:
+      raise IOError('Not opened.')
+
+    members = []
+    for member in self._members_by_end_offset.values():
+      members.append({
+          'member_end_offset': member.member_end_offset,
+          'member_start_offset': member.member_start_offset,
+          'uncompressed_data_size': member.uncompressed_data_size})
+
+    json_dict = {
+        'compressed_data_size': self._compressed_data_size,
+        'format_version': self._INDEX_FORMAT_VERSION,
+        'members': members}
+
+    with open(path, 'w') as file_object:
+      json.dump(json_dict, file_object)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
@@ -131,17 +206,50 @@ class GzipFile(file_io.FileIO):
       IOError: if the read failed.
       OSError: if the read failed.
     """
-    data = b''
-    while ((size and len(data) < size) and
+    if size is None or (
+        self._current_offset + size > self.uncompressed_data_size):
+      size = self.uncompressed_data_size - self._current_offset
+
+    if size <= 0:
+      return b''
+
+    read_buffer = bytearray(size)
+    read_count = self.readinto(read_buffer)
+
+    del read_buffer[read_count:]
+    return bytes(read_buffer)
+
+  def readinto(self, buffer):
+    """Reads data from the gzip file at the current offset into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer, where the size of
+          the buffer is the maximum number of bytes to read.
+
+    Returns:
+      int: number of bytes read, where 0 represents no more data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    buffer_view = memoryview(buffer)
+
+    size = len(buffer_view)
+    read_count = 0
+
+    while (read_count < size and
            self._current_offset < self.uncompressed_data_size):
       member = self._GetMemberForOffset(self._current_offset)
       member_offset = self._current_offset - member.uncompressed_data_offset
-      data_read = member.ReadAtOffset(member_offset, size)
+      data_read = member.ReadAtOffset(member_offset, size - read_count)
       if data_read:
-        self._current_offset += len(data_read)
-        data = b''.join([data, data_read])
+        data_read_size = len(data_read)
+        self._current_offset += data_read_size
+        buffer_view[read_count:read_count + data_read_size] = data_read
+        read_count += data_read_size
 
-    return data
+    return read_count
 
   def get_offset(self):
     """Retrieves the current offset into the file-like object.
@@ -202,14 +310,24 @@ class GzipFile(file_io.FileIO):
         path_spec.parent, resolver_context=self._resolver_context)
     file_size = self._gzip_file_object.get_size()
 
+    if file_size != self._compressed_data_size:
+      self._member_index = {}
+
+    self._compressed_data_size = file_size
+
     self._gzip_file_object.seek(0, os.SEEK_SET)
 
     uncompressed_data_offset = 0
     next_member_offset = 0
 
     while next_member_offset < file_size:
+      member_end_offset, member_uncompressed_data_size = (
+          self._member_index.get(next_member_offset, (None, None)))
+
       member = gzipfile.GzipMember(
-          self._gzip_file_object, next_member_offset, uncompressed_data_offset)
+          self._gzip_file_object, next_member_offset, uncompressed_data_offset,
+          member_end_offset=member_end_offset,
+          uncompressed_data_size=member_uncompressed_data_size)
       uncompressed_data_offset = (
           uncompressed_data_offset + member.uncompressed_data_size)
       self._members_by_end_offset[uncompressed_data_offset] = member
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import mmap
 import stat
 import os
 
@@ -13,8 +14,132 @@ from dfvfs.lib import errors
 from dfvfs.lib import py2to3
 
 
+class _MemoryMappedFile(object):
+  """Memory mapped regular file.
+
+  Provides the subset of the Python file object interface used by OSFile,
+  where data is sliced from the memory map instead of being read with
+  a system call.
+  """
+
+  def __init__(self, file_object):
+    """Initializes a memory mapped file.
+
+    Args:
+      file_object (file): Python file object of a regular file.
+
+    Raises:
+      EnvironmentError: if the file cannot be memory mapped.
+      OverflowError: if the file is too large to be memory mapped.
+      ValueError: if the file cannot be memory mapped.
+    """
+    super(_MemoryMappedFile, self).__init__()
+    self._current_offset = 0
+    self._file_object = file_object
+    self._memory_map = mmap.mmap(
+        file_object.fileno(), 0, access=mmap.ACCESS_READ)
+    self._size = len(self._memory_map)
+
+  def ReadAtOffset(self, offset, size):
+    """Reads data at a specific offset.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read.
+    """
+    if offset >= self._size or size <= 0:
+      return b''
+
+    return self._memory_map[offset:offset + size]
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def close(self):
+    """Closes the memory map and the file."""
+    self._memory_map.close()
+    self._file_object.close()
+
+  def read(self, size=-1):
+    """Reads data at the current offset.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where a negative value
+          represents all remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    if size < 0:
+      size = self._size - self._current_offset
+
+    data = self.ReadAtOffset(self._current_offset, size)
+    self._current_offset += len(data)
+    return data
+
+  def readinto(self, buffer):
+    """Reads data at the current offset into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer.
+
+    Returns:
+      int: number of bytes read.
+    """
+    buffer_view = memoryview(buffer)
+
+    data = self.ReadAtOffset(self._current_offset, len(buffer_view))
+
+    read_count = len(data)
+    buffer_view[:read_count] = data
+    self._current_offset += read_count
+
+    return read_count
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional[int]): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed, because whence is not supported or
+          the resulting offset is less than zero.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def tell(self):
+    """Retrieves the current offset.
+
+    Returns:
+      int: current offset.
+    """
+    return self._current_offset
+
+
 class OSFile(file_io.FileIO):
-  """File-like object using os."""
+  """File-like object using os.
+
+  Regular files of at least the memory map threshold of the resolver context
+  are memory mapped, to read data without system calls. Devices are never
+  memory mapped.
+  """
 
   def __init__(self, resolver_context):
     """Initializes a file-like object.
@@ -23,13 +148,17 @@ class OSFile(file_io.FileIO):
       resolver_context (Context): resolver context.
     """
     super(OSFile, self).__init__(resolver_context)
+    self._file_descriptor = None
     self._file_object = None
+    self._is_memory_mapped = False
     self._size = 0
 
   def _Close(self):
     """Closes the file-like object."""
     self._file_object.close()
+    self._file_descriptor = None
     self._file_object = None
+    self._is_memory_mapped = False
 
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
@@ -99,6 +228,55 @@ class OSFile(file_io.FileIO):
       self._file_object = open(location, mode=mode)
       self._size = stat_info.st_size
 
+      memory_map_threshold = self._resolver_context.GetMemoryMapThreshold()
+      if (memory_map_threshold is not None and self._size > 0 and
+          self._size >= memory_map_threshold):
+        try:
+          self._file_object = _MemoryMappedFile(self._file_object)
+          self._is_memory_mapped = True
+        except (EnvironmentError, OverflowError, ValueError):
+          # Fall back to regular reads if the file cannot be memory mapped.
+          pass
+
+      # Positional reads are not supported on all platforms, such as Windows.
+      if not self._is_memory_mapped and hasattr(os, 'pread'):
+        self._file_descriptor = self._file_object.fileno()
+
+  def _ReadRange(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read, which is smaller than size if the range exceeds
+          the end of the data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if self._is_memory_mapped:
+      return self._file_object.ReadAtOffset(offset, size)
+
+    if self._file_descriptor is None:
+      return super(OSFile, self)._ReadRange(offset, size)
+
+    # A positional read can return less data than requested, for example
+    # when the size exceeds the maximum size of a single read.
+    data_segments = []
+    while size > 0:
+      data = os.pread(self._file_descriptor, size, offset)
+      if not data:
+        break
+
+      data_segments.append(data)
+      offset += len(data)
+      size -= len(data)
+
+    return b''.join(data_segments)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -128,6 +306,29 @@ class OSFile(file_io.FileIO):
 
     return self._file_object.read(size)
 
+  def readinto(self, buffer):
+    """Reads data from the file-like object at the current offset into a buffer.
+
+    Args:
+      buffer (bytearray|memoryview): writable buffer, where the size of
+          the buffer is the maximum number of bytes to read.
+
+    Returns:
+      int: number of bytes read, where 0 represents no more data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    # The libsmdev handle used for devices does not support readinto.
+    if not hasattr(self._file_object, 'readinto'):
+      return super(OSFile, self).readinto(buffer)
+
+    return self._file_object.readinto(buffer)
+
   def seek(self, offset, whence=os.SEEK_SET):
     """Seeks to an offset within the file-like object.
 
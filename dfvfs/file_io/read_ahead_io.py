@@ -0,0 +1,495 @@
+# -*- coding: utf-8 -*-
+"""The read-ahead file-like object."""
+
+from __future__ import unicode_literals
+
+import os
+import threading
+import weakref
+
+try:
+  import queue
+except ImportError:
+  import Queue as queue  # pylint: disable=import-error
+
+from dfvfs.file_io import file_io
+from dfvfs.lib import errors
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+
+class ReadAheadFile(file_io.FileIO):
+  """File-like object that reads ahead the data of its parent.
+
+  The data of the parent file-like object is read in chunks. When the data
+  is read sequentially, the chunks that follow the chunk being read are read
+  ahead by a separate thread, so that reading and decompressing the data in
+  the parent, such as an EWF or QCOW image, overlaps with processing the data
+  by the consumer.
+
+  The parent file-like object is opened in a private resolver context, since
+  reading ahead changes its current offset. Hence the parent is not shared
+  with other consumers of the resolver context.
+  """
+
+  _DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+  _DEFAULT_NUMBER_OF_CHUNKS = 4
+
+  def __init__(
+      self, resolver_context, file_object=None, chunk_size=None,
+      number_of_chunks=None):
+    """Initializes a file-like object.
+
+    If the file-like object is chained do not separately use the parent
+    file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+      file_object (Optional[FileIO]): parent file-like object.
+      chunk_size (Optional[int]): size of the chunks that are read ahead,
+          where None represents the chunk size of the path specification
+          or the default chunk size.
+      number_of_chunks (Optional[int]): maximum number of chunks that are
+          read ahead, where None represents the number of chunks of the path
+          specification or the default number of chunks.
+
+    Raises:
+      ValueError: if the chunk size or number of chunks is invalid.
+    """
+    if chunk_size is not None and chunk_size <= 0:
+      raise ValueError('Invalid chunk size: {0:d}.'.format(chunk_size))
+
+    if number_of_chunks is not None and number_of_chunks <= 0:
+      raise ValueError('Invalid number of chunks: {0:d}.'.format(
+          number_of_chunks))
+
+    super(ReadAheadFile, self).__init__(resolver_context)
+    self._chunk_size = chunk_size
+    self._chunks = {}
+    self._condition = threading.Condition()
+    self._current_offset = 0
+    self._file_object = file_object
+    self._file_object_lock = threading.Lock()
+    self._file_object_set_in_init = bool(file_object)
+    self._last_read_end_offset = 0
+    self._number_of_chunks = number_of_chunks
+    self._number_of_hits = 0
+    self._number_of_misses = 0
+    self._number_of_wasted_chunks = 0
+    self._parent_resolver_context = None
+    self._pending_chunk_indexes = set()
+    self._read_ahead_chunk_index = None
+    self._read_ahead_queue = None
+    self._read_ahead_thread = None
+    self._size = 0
+    self._used_chunk_indexes = set()
+
+  def __del__(self):
+    """Cleans up the file-like object."""
+    # __del__ can be invoked before __init__ has completed.
+    read_ahead_queue = getattr(self, '_read_ahead_queue', None)
+    if read_ahead_queue:
+      # Stop the read-ahead thread if the file-like object was not closed.
+      read_ahead_queue.put(None)
+
+  @property
+  def number_of_hits(self):
+    """int: number of chunks read that were read ahead."""
+    with self._condition:
+      return self._number_of_hits
+
+  @property
+  def number_of_misses(self):
+    """int: number of chunks read that were not read ahead."""
+    with self._condition:
+      return self._number_of_misses
+
+  @property
+  def number_of_wasted_chunks(self):
+    """int: number of chunks read ahead that were discarded without use."""
+    with self._condition:
+      return self._number_of_wasted_chunks
+
+  def _CancelReadAhead(self):
+    """Cancels reading ahead and discards the chunks that were read ahead.
+
+    Chunks that were read ahead or are pending but were not used are counted
+    as wasted.
+    """
+    with self._condition:
+      if self._read_ahead_queue:
+        try:
+          while True:
+            self._read_ahead_queue.get_nowait()
+        except queue.Empty:
+          pass
+
+      self._number_of_wasted_chunks += len(self._pending_chunk_indexes)
+      self._number_of_wasted_chunks += len(
+          set(self._chunks) - self._used_chunk_indexes)
+
+      self._chunks = {}
+      self._pending_chunk_indexes = set()
+      self._read_ahead_chunk_index = None
+      self._used_chunk_indexes = set()
+
+      self._condition.notify_all()
+
+  def _Close(self):
+    """Closes the file-like object.
+
+    If the file-like object was passed in the init function the read-ahead
+    file-like object does not control the file-like object and should not
+    actually close it.
+    """
+    if self._read_ahead_thread:
+      self._CancelReadAhead()
+      self._read_ahead_queue.put(None)
+      self._read_ahead_thread.join()
+
+      self._read_ahead_queue = None
+      self._read_ahead_thread = None
+
+    self._chunks = {}
+    self._pending_chunk_indexes = set()
+    self._read_ahead_chunk_index = None
+    self._used_chunk_indexes = set()
+
+    if not self._file_object_set_in_init:
+      self._file_object.close()
+      self._file_object = None
+
+      self._parent_resolver_context.Empty()
+      self._parent_resolver_context = None
+
+  def _GetChunk(self, chunk_index):
+    """Retrieves the data of a chunk.
+
+    Args:
+      chunk_index (int): index of the chunk.
+
+    Returns:
+      bytes: data of the chunk.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    with self._condition:
+      while chunk_index in self._pending_chunk_indexes:
+        self._condition.wait()
+
+      chunk_data = self._chunks.get(chunk_index, None)
+      if chunk_data is not None:
+        if chunk_index not in self._used_chunk_indexes:
+          self._number_of_hits += 1
+          self._used_chunk_indexes.add(chunk_index)
+        return chunk_data
+
+    chunk_data = self._ReadChunk(chunk_index)
+
+    with self._condition:
+      self._number_of_misses += 1
+      self._chunks[chunk_index] = chunk_data
+      self._used_chunk_indexes.add(chunk_index)
+
+    return chunk_data
+
+  def _Open(self, path_spec=None, mode='rb'):
+    """Opens the file-like object.
+
+    Args:
+      path_spec (Optional[PathSpec]): path specification.
+      mode (Optional[str]): file access mode.
+
+    Raises:
+      AccessError: if the access to open the file was denied.
+      IOError: if the file-like object could not be opened.
+      OSError: if the file-like object could not be opened.
+      PathSpecError: if the path specification is incorrect.
+      ValueError: if the path specification is invalid.
+    """
+    if not self._file_object_set_in_init and not path_spec:
+      raise ValueError('Missing path specification.')
+
+    if not self._file_object_set_in_init:
+      if not path_spec.HasParent():
+        raise errors.PathSpecError(
+            'Unsupported path specification without parent.')
+
+      if self._chunk_size is None:
+        self._chunk_size = getattr(path_spec, 'chunk_size', None)
+      if self._number_of_chunks is None:
+        self._number_of_chunks = getattr(path_spec, 'number_of_chunks', None)
+
+      self._parent_resolver_context = context.Context(
+          memory_map_threshold=(
+              self._resolver_context.GetMemoryMapThreshold()))
+      self._file_object = resolver.Resolver.OpenFileObject(
+          path_spec.parent, resolver_context=self._parent_resolver_context)
+
+    if self._chunk_size is None:
+      self._chunk_size = self._DEFAULT_CHUNK_SIZE
+    if self._number_of_chunks is None:
+      self._number_of_chunks = self._DEFAULT_NUMBER_OF_CHUNKS
+
+    self._current_offset = 0
+    self._last_read_end_offset = 0
+    self._size = self._file_object.get_size()
+
+  @classmethod
+  def _ReadAhead(cls, file_object_reference, read_ahead_queue):
+    """Reads chunks ahead until there are no more chunks to read.
+
+    The read-ahead thread only keeps a weak reference to the read-ahead
+    file-like object, so that the file-like object can be cleaned up when
+    it is no longer referenced without being closed.
+
+    Args:
+      file_object_reference (weakref.ref): weak reference to the read-ahead
+          file-like object.
+      read_ahead_queue (queue.Queue): queue of the indexes of the chunks to
+          read ahead, where None represents there are no more chunks.
+    """
+    # pylint: disable=protected-access
+    chunk_index = read_ahead_queue.get()
+    while chunk_index is not None:
+      file_object = file_object_reference()
+      if not file_object:
+        break
+
+      file_object._ReadAheadChunk(chunk_index)
+      file_object = None
+
+      chunk_index = read_ahead_queue.get()
+
+  def _ReadAheadChunk(self, chunk_index):
+    """Reads a chunk ahead if it is still pending.
+
+    Args:
+      chunk_index (int): index of the chunk.
+    """
+    with self._condition:
+      is_pending = chunk_index in self._pending_chunk_indexes
+
+    if is_pending:
+      try:
+        chunk_data = self._ReadChunk(chunk_index)
+      except Exception:  # pylint: disable=broad-except
+        # The chunk is read again by the consumer, which then raises
+        # the error.
+        chunk_data = None
+
+      with self._condition:
+        # A chunk that is no longer pending was cancelled while being read.
+        if chunk_index in self._pending_chunk_indexes:
+          self._pending_chunk_indexes.remove(chunk_index)
+          if chunk_data is not None:
+            self._chunks[chunk_index] = chunk_data
+
+        self._condition.notify_all()
+
+  def _ReadChunk(self, chunk_index):
+    """Reads the data of a chunk from the parent file-like object.
+
+    Args:
+      chunk_index (int): index of the chunk.
+
+    Returns:
+      bytes: data of the chunk.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    data_segments = []
+    size = self._chunk_size
+
+    with self._file_object_lock:
+      self._file_object.seek(chunk_index * self._chunk_size, os.SEEK_SET)
+
+      # The parent file-like object can return less data than requested.
+      while size > 0:
+        data_segment = self._file_object.read(size)
+        if not data_segment:
+          break
+
+        data_segments.append(data_segment)
+        size -= len(data_segment)
+
+    return b''.join(data_segments)
+
+  def _ScheduleReadAhead(self, chunk_index):
+    """Schedules reading ahead the chunks that follow a chunk.
+
+    Chunks before the chunk are discarded, where chunks that were read ahead
+    but not used are counted as wasted.
+
+    Args:
+      chunk_index (int): index of the chunk.
+    """
+    # Reading ahead was already scheduled for consecutive reads of
+    # the same chunk.
+    if chunk_index == self._read_ahead_chunk_index:
+      return
+
+    self._read_ahead_chunk_index = chunk_index
+
+    last_chunk_index, _ = divmod(self._size - 1, self._chunk_size)
+    last_chunk_index = min(
+        last_chunk_index, chunk_index + self._number_of_chunks)
+
+    with self._condition:
+      for discarded_chunk_index in [
+          index for index in self._chunks if index < chunk_index]:
+        del self._chunks[discarded_chunk_index]
+        if discarded_chunk_index in self._used_chunk_indexes:
+          self._used_chunk_indexes.remove(discarded_chunk_index)
+        else:
+          self._number_of_wasted_chunks += 1
+
+      for read_ahead_chunk_index in range(
+          chunk_index + 1, last_chunk_index + 1):
+        if (read_ahead_chunk_index in self._chunks or
+            read_ahead_chunk_index in self._pending_chunk_indexes):
+          continue
+
+        if not self._read_ahead_thread:
+          self._read_ahead_queue = queue.Queue()
+          self._read_ahead_thread = threading.Thread(
+              target=self._ReadAhead,
+              args=(weakref.ref(self), self._read_ahead_queue))
+          self._read_ahead_thread.daemon = True
+          self._read_ahead_thread.start()
+
+        self._pending_chunk_indexes.add(read_ahead_chunk_index)
+        self._read_ahead_queue.put(read_ahead_chunk_index)
+
+  # Note: that the following functions do not follow the style guide
+  # because they are part of the file-like object interface.
+  # pylint: disable=invalid-name
+
+  def read(self, size=None):
+    """Reads a byte string from the file-like object at the current offset.
+
+    The function will read a byte string of the specified size or
+    all of the remaining data if no size was specified.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if self._current_offset < 0:
+      raise IOError(
+          'Invalid current offset: {0:d} value less than zero.'.format(
+              self._current_offset))
+
+    if self._current_offset >= self._size:
+      return b''
+
+    if size is None or self._current_offset + size > self._size:
+      size = self._size - self._current_offset
+
+    if size <= 0:
+      return b''
+
+    chunk_index, chunk_offset = divmod(self._current_offset, self._chunk_size)
+
+    is_sequential = self._current_offset == self._last_read_end_offset
+    if not is_sequential:
+      with self._condition:
+        is_read_ahead = (
+            chunk_index in self._chunks or
+            chunk_index in self._pending_chunk_indexes)
+
+      if not is_read_ahead:
+        self._CancelReadAhead()
+
+    data_segments = []
+    while size > 0:
+      chunk_data = self._GetChunk(chunk_index)
+      if is_sequential:
+        self._ScheduleReadAhead(chunk_index)
+
+      data_segment = chunk_data[chunk_offset:chunk_offset + size]
+      if not data_segment:
+        break
+
+      data_segments.append(data_segment)
+      size -= len(data_segment)
+      self._current_offset += len(data_segment)
+
+      chunk_index += 1
+      chunk_offset = 0
+
+    self._last_read_end_offset = self._current_offset
+
+    return b''.join(data_segments)
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the file-like object.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the file.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def get_offset(self):
+    """Retrieves the current offset into the file-like object.
+
+    Returns:
+      int: current offset into the file-like object.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the file-like object.
+
+    Returns:
+      int: size of the file-like object data.
+
+    Raises:
+      IOError: if the file-like object has not been opened.
+      OSError: if the file-like object has not been opened.
+    """
+    if not self._is_open:
+      raise IOError('Not opened.')
+
+    return self._size
@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 
 import os
+import threading
 
 from dfvfs.file_io import file_io
 from dfvfs.lib import errors
@@ -13,10 +14,23 @@ from dfvfs.resolver import resolver
 
 
 class SQLiteBlobFile(file_io.FileIO):
-  """Class that implements a file-like object using sqlite."""
+  """Class that implements a file-like object using sqlite.
+
+  Opening a database file makes a temporary copy of the database. Therefore
+  database file objects are shared, with a reference count, by the blob
+  file-like objects that have the same parent path specification and
+  resolver context. A database file object that is no longer referenced is
+  kept open by the resolver context, so that successive blob file-like
+  objects reuse the same temporary copy.
+  """
 
   _OPERATORS = frozenset(['==', '=', 'IS'])
 
+  # Lock to prevent that the same database file is opened and cached by
+  # multiple threads. Note that a reentrant lock is used since the parent
+  # of the database file can be a SQLite blob itself.
+  _database_lock = threading.RLock()
+
   def __init__(self, resolver_context):
     """Initializes the file-like object.
 
@@ -25,19 +39,81 @@ class SQLiteBlobFile(file_io.FileIO):
     """
     super(SQLiteBlobFile, self).__init__(resolver_context)
     self._blob = None
+    self._blob_object = None
     self._current_offset = 0
+    self._database_is_shared = False
     self._database_object = None
     self._number_of_rows = None
     self._size = 0
     self._table_name = None
 
+  def _CloseDatabase(self):
+    """Releases the shared database file object.
+
+    The shared database file object is closed by the resolver context when
+    it is evicted. A database file object that is not shared is closed.
+    """
+    if self._database_is_shared:
+      with self._database_lock:
+        self._resolver_context.ReleaseSQLiteDatabase(self._database_object)
+    else:
+      self._database_object.Close()
+
+    self._database_is_shared = False
+    self._database_object = None
+
+  def _OpenDatabase(self, path_spec):
+    """Opens the shared database file object.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      SQLiteDatabaseFile: database file object.
+
+    Raises:
+      IOError: if the database file object could not be opened.
+      OSError: if the database file object could not be opened.
+    """
+    with self._database_lock:
+      is_shared = True
+      database_object = self._resolver_context.GetSQLiteDatabase(path_spec)
+      if not database_object:
+        file_object = resolver.Resolver.OpenFileObject(
+            path_spec, resolver_context=self._resolver_context)
+
+        try:
+          database_object = sqlite_database.SQLiteDatabaseFile()
+          database_object.Open(file_object)
+        finally:
+          file_object.close()
+
+        try:
+          self._resolver_context.CacheSQLiteDatabase(
+              path_spec, database_object)
+        except errors.CacheFullError:
+          # Fall back to a database file object that is not shared.
+          is_shared = False
+
+      if is_shared:
+        self._resolver_context.GrabSQLiteDatabase(path_spec)
+
+    self._database_is_shared = is_shared
+    self._database_object = database_object
+    return database_object
+
   def _Close(self):
     """Closes the file-like object."""
+    if self._blob_object:
+      self._blob_object.close()
+
     if self._database_object:
-      self._database_object.Close()
+      self._CloseDatabase()
 
     self._blob = None
+    self._blob_object = None
     self._current_offset = 0
+    self._number_of_rows = None
     self._size = 0
     self._table_name = None
 
@@ -90,15 +166,40 @@ class SQLiteBlobFile(file_io.FileIO):
     if self._database_object:
       raise IOError('Database file already set.')
 
-    file_object = resolver.Resolver.OpenFileObject(
-        path_spec.parent, resolver_context=self._resolver_context)
+    database_object = self._OpenDatabase(path_spec.parent)
 
     try:
-      database_object = sqlite_database.SQLiteDatabaseFile()
-      database_object.Open(file_object)
-    finally:
-      file_object.close()
+      self._OpenValue(
+          database_object, table_name, column_name, row_condition, row_index)
 
+    except Exception:
+      if self._blob_object:
+        self._blob_object.close()
+        self._blob_object = None
+
+      self._CloseDatabase()
+      raise
+
+    self._current_offset = 0
+    self._table_name = table_name
+
+  def _OpenValue(
+      self, database_object, table_name, column_name, row_condition,
+      row_index):
+    """Opens the value of the blob.
+
+    Args:
+      database_object (SQLiteDatabaseFile): database file object.
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+      row_condition (tuple[str, str, object]): row condition, consisting of
+          a column name, operator and value, or None if not set.
+      row_index (int): row index or None if not set.
+
+    Raises:
+      IOError: if the value could not be opened.
+      OSError: if the value could not be opened.
+    """
     # Sanity check the table and column names.
     error_string = ''
     if not database_object.HasTable(table_name):
@@ -108,29 +209,43 @@ class SQLiteBlobFile(file_io.FileIO):
       error_string = 'Missing column: {0:s} in table: {1:s}'.format(
           column_name, table_name)
 
-    elif not row_condition:
-      query = 'SELECT {0:s} FROM {1:s} LIMIT 1 OFFSET {2:d}'.format(
-          column_name, table_name, row_index)
-      rows = database_object.Query(query)
-
-    elif not database_object.HasColumn(table_name, row_condition[0]):
+    elif row_condition and not database_object.HasColumn(
+        table_name, row_condition[0]):
       error_string = (
           'Missing row condition column: {0:s} in table: {1:s}'.format(
               row_condition[0], table_name))
 
-    elif row_condition[1] not in self._OPERATORS:
+    elif row_condition and row_condition[1] not in self._OPERATORS:
       error_string = (
           'Unsupported row condition operator: {0:s}.'.format(
               row_condition[1]))
 
+    if error_string:
+      raise IOError(error_string)
+
+    # Only the row identifier and the type of the value are queried, so that
+    # a blob can be read incrementally. The rows of a table declared
+    # "WITHOUT ROWID" have no row identifier, hence the whole value is
+    # queried.
+    has_row_identifier = database_object.HasRowIdentifier(table_name)
+    if has_row_identifier:
+      select_expression = '_ROWID_, typeof({0:s})'.format(column_name)
+    else:
+      select_expression = column_name
+
+    if not row_condition:
+      query = 'SELECT {0:s} FROM {1:s} LIMIT 1 OFFSET {2:d}'.format(
+          select_expression, table_name, row_index)
+      rows = database_object.Query(query)
+
     else:
       query = 'SELECT {0:s} FROM {1:s} WHERE {2:s} {3:s} ?'.format(
-          column_name, table_name, row_condition[0], row_condition[1])
+          select_expression, table_name, row_condition[0], row_condition[1])
       rows = database_object.Query(query, parameters=(row_condition[2], ))
 
     # Make sure the query returns a single row, using cursor.rowcount
     # is not reliable for this purpose.
-    if not error_string and (len(rows) != 1 or len(rows[0]) != 1):
+    if len(rows) != 1:
       if not row_condition:
         error_string = (
             'Unable to open blob in table: {0:s} and column: {1:s} '
@@ -144,15 +259,36 @@ class SQLiteBlobFile(file_io.FileIO):
             'where: {2:s}.').format(
                 table_name, column_name, row_condition_string)
 
-    if error_string:
-      database_object.Close()
       raise IOError(error_string)
 
-    self._blob = rows[0][0]
-    self._current_offset = 0
-    self._database_object = database_object
-    self._size = len(self._blob)
-    self._table_name = table_name
+    if not has_row_identifier:
+      self._blob = rows[0][0]
+      self._size = len(self._blob)
+      return
+
+    row_identifier, value_type = rows[0]
+
+    if isinstance(value_type, bytes):
+      value_type = value_type.decode('utf-8')
+
+    # Incremental blob I/O reads the raw data of a value, which for text
+    # corresponds to the value returned by a query for UTF-8 encoded text.
+    if value_type == 'blob' or (
+        value_type == 'text' and database_object.GetEncoding() == 'UTF-8'):
+      self._blob_object = database_object.OpenBlob(
+          table_name, column_name, row_identifier)
+
+    if self._blob_object is not None:
+      self._size = len(self._blob_object)
+
+    else:
+      # Fall back to reading the whole value, for example if the value is
+      # not a blob or incremental blob I/O is not supported.
+      query = 'SELECT {0:s} FROM {1:s} WHERE _ROWID_ = ?'.format(
+          column_name, table_name)
+      rows = database_object.Query(query, parameters=(row_identifier, ))
+      self._blob = rows[0][0]
+      self._size = len(self._blob)
 
   # TODO: remove this when there is a move this to a central temp file
   # manager. https://github.com/log2timeline/dfvfs/issues/92
@@ -212,6 +348,11 @@ class SQLiteBlobFile(file_io.FileIO):
 
     start_offset = self._current_offset
     self._current_offset += size
+
+    if self._blob_object:
+      self._blob_object.seek(start_offset, os.SEEK_SET)
+      return self._blob_object.read(size)
+
     return self._blob[start_offset:self._current_offset]
 
   def seek(self, offset, whence=os.SEEK_SET):
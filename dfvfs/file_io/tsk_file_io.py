@@ -140,6 +140,36 @@ class TSKFile(file_io.FileIO):
     else:
       self._size = self._tsk_file.info.meta.size
 
+  def _ReadRange(self, offset, size):
+    """Reads a byte string from the file-like object at a specific offset.
+
+    Args:
+      offset (int): offset of the data.
+      size (int): number of bytes to read.
+
+    Returns:
+      bytes: data read, which is smaller than size if the range exceeds
+          the end of the data.
+
+    Raises:
+      IOError: if the read failed.
+      OSError: if the read failed.
+    """
+    # The SleuthKit is not POSIX compliant in its read behavior. Therefore
+    # pytsk3 will raise an IOError if the read offset is beyond the data size.
+    if offset >= self._size:
+      return b''
+
+    if offset + size > self._size:
+      size = self._size - offset
+
+    if self._tsk_attribute:
+      return self._tsk_file.read_random(
+          offset, size, self._tsk_attribute.info.type,
+          self._tsk_attribute.info.id)
+
+    return self._tsk_file.read_random(offset, size)
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
   # pylint: disable=invalid-name
@@ -167,20 +197,10 @@ class TSKFile(file_io.FileIO):
     if self._current_offset < 0:
       raise IOError('Invalid current offset value less than zero.')
 
-    # The SleuthKit is not POSIX compliant in its read behavior. Therefore
-    # pytsk3 will raise an IOError if the read offset is beyond the data size.
-    if self._current_offset >= self._size:
-      return b''
-
-    if size is None or self._current_offset + size > self._size:
+    if size is None:
       size = self._size - self._current_offset
 
-    if self._tsk_attribute:
-      data = self._tsk_file.read_random(
-          self._current_offset, size, self._tsk_attribute.info.type,
-          self._tsk_attribute.info.id)
-    else:
-      data = self._tsk_file.read_random(self._current_offset, size)
+    data = self._ReadRange(self._current_offset, size)
 
     # It is possible the that returned data size is not the same as the
     # requested data size. At this layer we don't care and this discrepancy
@@ -49,8 +49,8 @@ class TSKPartitionFile(data_range_io.DataRange):
 
     self._file_system = resolver.Resolver.OpenFileSystem(
         path_spec, resolver_context=self._resolver_context)
-    tsk_volume = self._file_system.GetTSKVolume()
-    tsk_vs, _ = tsk_partition.GetTSKVsPartByPathSpec(tsk_volume, path_spec)
+    partition_table = self._file_system.GetTSKPartitionTable()
+    tsk_vs, _ = partition_table.GetTSKVsPartByPathSpec(path_spec)
 
     if tsk_vs is None:
       raise errors.PathSpecError(
@@ -65,9 +65,8 @@ class TSKPartitionFile(data_range_io.DataRange):
           'Unable to retrieve TSK volume system part data range from path '
           'specification.')
 
-    bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(tsk_volume)
-    range_offset *= bytes_per_sector
-    range_size *= bytes_per_sector
+    range_offset *= partition_table.bytes_per_sector
+    range_size *= partition_table.bytes_per_sector
 
     self.SetRange(range_offset, range_size)
     self._file_object = resolver.Resolver.OpenFileObject(
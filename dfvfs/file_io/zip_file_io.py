@@ -6,15 +6,82 @@ from __future__ import unicode_literals
 # Note: that zipfile.ZipExtFile is not seekable, hence it is wrapped in
 # an instance of file_io.FileIO.
 
+import bisect
 import os
+import struct
 import zipfile
+import zlib
 
+from dfvfs.compression import zlib_decompressor
 from dfvfs.file_io import file_io
 from dfvfs.resolver import resolver
 
 
+class _ZipFileSeekPoint(object):
+  """ZIP member seek point.
+
+  A seek point stores the decompression state at a specific offset so that
+  decompression can be resumed from that offset.
+
+  Attributes:
+    compressed_data (bytes): compressed data that was read but not yet
+        consumed by the decompressor.
+    compressed_data_offset (int): offset of the compressed data, relative to
+        the start of the compressed data of the member, at which to resume
+        reading.
+    decompressor (DeflateDecompressor): decompressor with the decompression
+        state at the seek point.
+    uncompressed_data_offset (int): offset in the uncompressed data that
+        corresponds with the seek point.
+  """
+
+  def __init__(
+      self, decompressor, compressed_data_offset, compressed_data,
+      uncompressed_data_offset):
+    """Initializes a ZIP member seek point.
+
+    Args:
+      decompressor (DeflateDecompressor): decompressor with the decompression
+          state at the seek point.
+      compressed_data_offset (int): offset of the compressed data, relative
+          to the start of the compressed data of the member, at which to
+          resume reading.
+      compressed_data (bytes): compressed data that was read but not yet
+          consumed by the decompressor.
+      uncompressed_data_offset (int): offset in the uncompressed data that
+          corresponds with the seek point.
+    """
+    super(_ZipFileSeekPoint, self).__init__()
+    self.compressed_data = compressed_data
+    self.compressed_data_offset = compressed_data_offset
+    self.decompressor = decompressor
+    self.uncompressed_data_offset = uncompressed_data_offset
+
+
 class ZipFile(file_io.FileIO):
-  """File-like object using zipfile."""
+  """File-like object using zipfile.
+
+  The data of stored and deflate compressed members, that are not encrypted,
+  is read directly from the ZIP file. While decompressing a deflate
+  compressed member seek points are stored at regular intervals, so that
+  seeking backwards resumes decompression from the nearest preceding seek
+  point. The seek points are shared by the file-like objects of the same
+  member, via the ZIP file system. Other members are read using zipfile.
+
+  The CRC-32 of a member that is read directly is checked once its data
+  has been read sequentially from the start to the end, which is where
+  zipfile would check it.
+  """
+
+  # The size of the compressed data buffer.
+  _COMPRESSED_DATA_BUFFER_SIZE = 1024 * 1024
+
+  _LOCAL_FILE_HEADER_SIGNATURE = b'PK\x03\x04'
+
+  _LOCAL_FILE_HEADER_SIZE = 30
+
+  # The minimum distance in the uncompressed data between seek points.
+  _SEEK_POINT_INTERVAL = 4 * 1024 * 1024
 
   # The size of the uncompressed data buffer.
   _UNCOMPRESSED_DATA_BUFFER_SIZE = 16 * 1024 * 1024
@@ -27,12 +94,22 @@ class ZipFile(file_io.FileIO):
     """
     super(ZipFile, self).__init__(resolver_context)
     self._compressed_data = b''
+    self._compressed_data_offset = 0
+    self._compressed_data_size = 0
+    self._compressed_data_start = 0
+    self._crc32 = 0
+    self._crc32_offset = 0
     self._current_offset = 0
+    self._decompressor = None
+    self._file_object = None
     self._file_system = None
     self._realign_offset = True
+    self._seek_point_offsets = []
+    self._seek_points = []
     self._uncompressed_data = b''
     self._uncompressed_data_offset = 0
     self._uncompressed_data_size = 0
+    self._uncompressed_data_stream_offset = 0
     self._uncompressed_stream_size = None
     self._zip_ext_file = None
     self._zip_file = None
@@ -44,12 +121,50 @@ class ZipFile(file_io.FileIO):
       self._zip_ext_file.close()
       self._zip_ext_file = None
 
+    if self._file_object:
+      self._file_object.close()
+      self._file_object = None
+
+    self._compressed_data = b''
+    self._crc32 = 0
+    self._crc32_offset = 0
+    self._decompressor = None
+    self._seek_point_offsets = []
+    self._seek_points = []
+    self._uncompressed_data = b''
     self._zip_file = None
     self._zip_info = None
 
     self._file_system.Close()
     self._file_system = None
 
+  def _GetCompressedDataStart(self, file_object):
+    """Determines the start of the compressed data of the member.
+
+    Args:
+      file_object (FileIO): file-like object of the ZIP file.
+
+    Returns:
+      int: offset of the compressed data in the ZIP file.
+
+    Raises:
+      IOError: if the local file header could not be read.
+      OSError: if the local file header could not be read.
+    """
+    file_object.seek(self._zip_info.header_offset, os.SEEK_SET)
+    local_file_header = file_object.read(self._LOCAL_FILE_HEADER_SIZE)
+
+    if (len(local_file_header) != self._LOCAL_FILE_HEADER_SIZE or
+        not local_file_header.startswith(self._LOCAL_FILE_HEADER_SIGNATURE)):
+      raise IOError('Unable to read local file header.')
+
+    filename_size, extra_field_size = struct.unpack(
+        '<HH', local_file_header[26:30])
+
+    return (
+        self._zip_info.header_offset + self._LOCAL_FILE_HEADER_SIZE +
+        filename_size + extra_field_size)
+
   def _Open(self, path_spec=None, mode='rb'):
     """Opens the file-like object defined by path specification.
 
@@ -83,6 +198,28 @@ class ZipFile(file_io.FileIO):
     self._zip_file = self._file_system.GetZipFile()
     self._zip_info = file_entry.GetZipInfo()
 
+    is_encrypted = bool(self._zip_info.flag_bits & 0x1)
+    if not is_encrypted and self._zip_info.compress_type in (
+        zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED):
+      file_object = resolver.Resolver.OpenFileObject(
+          path_spec.parent, resolver_context=self._resolver_context)
+
+      try:
+        self._compressed_data_start = self._GetCompressedDataStart(
+            file_object)
+      except IOError:
+        file_object.close()
+        self._file_system.Close()
+        self._file_system = None
+        raise
+
+      self._compressed_data_size = self._zip_info.compress_size
+      self._file_object = file_object
+
+    if self._zip_info.compress_type == zipfile.ZIP_DEFLATED:
+      self._seek_point_offsets, self._seek_points = (
+          self._file_system.GetSeekPoints(self._zip_info))
+
     self._current_offset = 0
     self._uncompressed_stream_size = self._zip_info.file_size
 
@@ -92,6 +229,136 @@ class ZipFile(file_io.FileIO):
     Args:
       uncompressed_data_offset (int): uncompressed data offset.
 
+    Raises:
+      IOError: if the ZIP file could not be opened.
+      OSError: if the ZIP file could not be opened.
+    """
+    if self._file_object and self._zip_info.compress_type == zipfile.ZIP_STORED:
+      # Stored data can be read directly at any offset.
+      if (uncompressed_data_offset < self._uncompressed_data_stream_offset or
+          uncompressed_data_offset >= (
+              self._uncompressed_data_stream_offset +
+              self._uncompressed_data_size)):
+        self._uncompressed_data = b''
+        self._uncompressed_data_size = 0
+        self._uncompressed_data_stream_offset = uncompressed_data_offset
+
+    elif self._file_object:
+      seek_point = None
+      seek_point_index = bisect.bisect_right(
+          self._seek_point_offsets, uncompressed_data_offset)
+      if seek_point_index > 0:
+        seek_point = self._seek_points[seek_point_index - 1]
+
+      if (self._decompressor is None or
+          uncompressed_data_offset < self._uncompressed_data_stream_offset or (
+              seek_point and seek_point.uncompressed_data_offset > (
+                  self._uncompressed_data_stream_offset +
+                  self._uncompressed_data_size))):
+        self._ResetDecompressor(seek_point=seek_point)
+
+    elif (self._zip_ext_file is None or
+          uncompressed_data_offset < self._uncompressed_data_stream_offset):
+      self._ResetZipExtFile()
+
+    while uncompressed_data_offset >= (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size):
+      read_count = self._ReadCompressedData(
+          self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+      if read_count == 0:
+        break
+
+    self._uncompressed_data_offset = (
+        uncompressed_data_offset - self._uncompressed_data_stream_offset)
+
+  def _ReadCompressedData(self, read_size):
+    """Reads compressed data from the file-like object.
+
+    Args:
+      read_size (int): number of bytes of uncompressed data to read, which
+          is ignored for deflate compressed data read directly from the ZIP
+          file.
+
+    Returns:
+      int: number of bytes of data read.
+
+    Raises:
+      IOError: if the CRC-32 of the member does not match.
+      OSError: if the CRC-32 of the member does not match.
+    """
+    self._uncompressed_data_stream_offset += self._uncompressed_data_size
+
+    if self._file_object and self._zip_info.compress_type == zipfile.ZIP_STORED:
+      read_size = min(
+          read_size, self._uncompressed_stream_size -
+          self._uncompressed_data_stream_offset)
+
+      self._file_object.seek(
+          self._compressed_data_start + self._uncompressed_data_stream_offset,
+          os.SEEK_SET)
+      self._uncompressed_data = self._file_object.read(read_size)
+      read_count = len(self._uncompressed_data)
+
+    elif self._file_object:
+      read_size = min(
+          self._COMPRESSED_DATA_BUFFER_SIZE,
+          self._compressed_data_size - self._compressed_data_offset)
+
+      self._file_object.seek(
+          self._compressed_data_start + self._compressed_data_offset,
+          os.SEEK_SET)
+      compressed_data = self._file_object.read(read_size)
+      read_count = len(compressed_data)
+
+      self._compressed_data = b''.join([
+          self._compressed_data, compressed_data])
+      self._compressed_data_offset += read_count
+
+      self._uncompressed_data, self._compressed_data = (
+          self._decompressor.Decompress(self._compressed_data))
+
+    else:
+      self._uncompressed_data = self._zip_ext_file.read(read_size)
+      read_count = len(self._uncompressed_data)
+
+    self._uncompressed_data_size = len(self._uncompressed_data)
+
+    if self._file_object:
+      self._UpdateCRC32()
+
+    if self._decompressor:
+      self._StoreSeekPoint()
+
+    return read_count
+
+  def _ResetDecompressor(self, seek_point=None):
+    """Resets the decompressor.
+
+    Args:
+      seek_point (Optional[_ZipFileSeekPoint]): seek point to resume
+          decompression from, where None represents the start of the
+          compressed data.
+    """
+    if seek_point:
+      self._compressed_data = seek_point.compressed_data
+      self._compressed_data_offset = seek_point.compressed_data_offset
+      self._decompressor = seek_point.decompressor.Copy()
+      self._uncompressed_data_stream_offset = (
+          seek_point.uncompressed_data_offset)
+
+    else:
+      self._compressed_data = b''
+      self._compressed_data_offset = 0
+      self._decompressor = zlib_decompressor.DeflateDecompressor()
+      self._uncompressed_data_stream_offset = 0
+
+    self._uncompressed_data = b''
+    self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+
+  def _ResetZipExtFile(self):
+    """Reopens the ZIP member using zipfile.
+
     Raises:
       IOError: if the ZIP file could not be opened.
       OSError: if the ZIP file could not be opened.
@@ -110,26 +377,59 @@ class ZipFile(file_io.FileIO):
           'Unable to open ZIP file with error: {0!s}'.format(exception))
 
     self._uncompressed_data = b''
-    self._uncompressed_data_size = 0
     self._uncompressed_data_offset = 0
+    self._uncompressed_data_size = 0
+    self._uncompressed_data_stream_offset = 0
 
-    while uncompressed_data_offset > 0:
-      self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
+  def _StoreSeekPoint(self):
+    """Stores a seek point for the current decompression state.
 
-      if uncompressed_data_offset < self._uncompressed_data_size:
-        self._uncompressed_data_offset = uncompressed_data_offset
-        break
+    A seek point is only stored if the previous seek point lies at least
+    the seek point interval before the current uncompressed data offset.
+    """
+    uncompressed_data_offset = (
+        self._uncompressed_data_stream_offset + self._uncompressed_data_size)
 
-      uncompressed_data_offset -= self._uncompressed_data_size
+    last_seek_point_offset = 0
+    if self._seek_point_offsets:
+      last_seek_point_offset = self._seek_point_offsets[-1]
 
-  def _ReadCompressedData(self, read_size):
-    """Reads compressed data from the file-like object.
+    if (uncompressed_data_offset - last_seek_point_offset <
+        self._SEEK_POINT_INTERVAL):
+      return
 
-    Args:
-      read_size (int): number of bytes of compressed data to read.
+    seek_point = _ZipFileSeekPoint(
+        self._decompressor.Copy(), self._compressed_data_offset,
+        self._compressed_data, uncompressed_data_offset)
+
+    self._seek_points.append(seek_point)
+    self._seek_point_offsets.append(uncompressed_data_offset)
+
+  def _UpdateCRC32(self):
+    """Updates the CRC-32 with the uncompressed data read directly.
+
+    Only uncompressed data that continues the data covered by the CRC-32 is
+    added, such that the CRC-32 can be checked when the end of the member is
+    reached.
+
+    Raises:
+      IOError: if the CRC-32 of the member does not match.
+      OSError: if the CRC-32 of the member does not match.
     """
-    self._uncompressed_data = self._zip_ext_file.read(read_size)
-    self._uncompressed_data_size = len(self._uncompressed_data)
+    if (not self._uncompressed_data_size or
+        self._uncompressed_data_stream_offset != self._crc32_offset):
+      return
+
+    self._crc32 = zlib.crc32(self._uncompressed_data, self._crc32)
+    self._crc32_offset += self._uncompressed_data_size
+
+    if self._crc32_offset >= self._uncompressed_stream_size:
+      crc32 = self._crc32 & 0xffffffff
+      if crc32 != self._zip_info.CRC:
+        raise IOError((
+            'CRC-32 mismatch of ZIP member: {0:s}, expected: 0x{1:08x}, '
+            'calculated: 0x{2:08x}').format(
+                self._zip_info.filename, self._zip_info.CRC, crc32))
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
@@ -171,8 +471,12 @@ class ZipFile(file_io.FileIO):
 
     uncompressed_data = b''
 
+    if size == 0:
+      return uncompressed_data
+
     # Read in full blocks of uncompressed data.
-    while self._uncompressed_data_offset + size > self._uncompressed_data_size:
+    while size > (
+        self._uncompressed_data_size - self._uncompressed_data_offset):
       uncompressed_data = b''.join([
           uncompressed_data,
           self._uncompressed_data[self._uncompressed_data_offset:]])
@@ -183,22 +487,22 @@ class ZipFile(file_io.FileIO):
       self._current_offset += remaining_uncompressed_data_size
       size -= remaining_uncompressed_data_size
 
-      self._ReadCompressedData(self._UNCOMPRESSED_DATA_BUFFER_SIZE)
-
+      read_count = self._ReadCompressedData(
+          self._UNCOMPRESSED_DATA_BUFFER_SIZE)
       self._uncompressed_data_offset = 0
+      if read_count == 0:
+        break
 
     # Read in partial block of uncompressed data.
-    if (size > 0 and
-        self._uncompressed_data_offset + size <= self._uncompressed_data_size):
+    if size > 0:
       slice_start_offset = self._uncompressed_data_offset
       slice_end_offset = slice_start_offset + size
 
-      uncompressed_data = b''.join([
-          uncompressed_data,
-          self._uncompressed_data[slice_start_offset:slice_end_offset]])
+      slice_data = self._uncompressed_data[slice_start_offset:slice_end_offset]
+      uncompressed_data = b''.join([uncompressed_data, slice_data])
 
-      self._uncompressed_data_offset += size
-      self._current_offset += size
+      self._uncompressed_data_offset += len(slice_data)
+      self._current_offset += len(slice_data)
 
     return uncompressed_data
 
@@ -21,6 +21,23 @@ class DataSlice(object):
     self._file_object = file_object
     self._file_object_size = file_object.get_size()
 
+  def _ReadData(self, read_size):
+    """Reads data from the current offset of the file-like object.
+
+    Args:
+      read_size (int): number of bytes to read, where a negative value or
+          a value that exceeds the file data size represents all remaining
+          data.
+
+    Returns:
+      bytes: data read.
+    """
+    remaining_size = self._file_object_size - self._file_object.get_offset()
+    if read_size < 0 or read_size > remaining_size:
+      read_size = max(remaining_size, 0)
+
+    return self._file_object.read(read_size)
+
   # Since this class implements Python interface functions, the following
   # functions are in lower case as an exception to the normal naming
   # convention.
@@ -74,7 +91,7 @@ class DataSlice(object):
       self._file_object.seek(start_offset, os.SEEK_SET)
       read_size = end_offset - start_offset
 
-    return self._file_object.read(read_size)
+    return self._ReadData(read_size)
 
   def __len__(self):
     """Retrieves the file data size.
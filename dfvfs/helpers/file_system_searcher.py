@@ -3,14 +3,80 @@
 
 from __future__ import unicode_literals
 
+import multiprocessing
 import re
 import sre_constants
 
+try:
+  import queue
+except ImportError:
+  import Queue as queue  # pylint: disable=import-error
+
 from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.lib import glob2regex
 from dfvfs.lib import py2to3
 from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+from dfvfs.serializer import json_serializer
+
+
+def _FindInSubFileEntriesWorker(
+    mount_point_json, find_specs, task_queue, result_queue):
+  """Searches for matching file entries in the tasks of a parallel find.
+
+  Every task consists of a JSON serialized path specification of a top-level
+  file entry and the find specifications to match against it. The worker
+  opens the file entry using its own resolver context and streams the JSON
+  serialized path specifications of matching file entries back to the result
+  queue. A task of None indicates the worker should stop. The worker always
+  acknowledges that it stops with a result of None, also if it fails.
+
+  Args:
+    mount_point_json (str): JSON serialized mount point path specification.
+    find_specs (list[FindSpec]): find specifications.
+    task_queue (multiprocessing.Queue): queue with the tasks.
+    result_queue (multiprocessing.Queue): queue with the results, where
+        every result is a tuple of a JSON serialized path specification and
+        an error message or None.
+  """
+  try:
+    serializer = json_serializer.JsonPathSpecSerializer
+    mount_point = serializer.ReadSerialized(mount_point_json)
+    resolver_context = context.Context()
+
+    task = task_queue.get()
+    while task is not None:
+      path_spec_json, find_spec_indexes = task
+      sub_find_specs = [find_specs[index] for index in find_spec_indexes]
+
+      try:
+        path_spec = serializer.ReadSerialized(path_spec_json)
+        file_entry = resolver.Resolver.OpenFileEntry(
+            path_spec, resolver_context=resolver_context)
+
+        if file_entry:
+          searcher = FileSystemSearcher(
+              file_entry.GetFileSystem(), mount_point)
+          # pylint: disable=protected-access
+          for matching_path_spec in searcher._FindInFileEntry(
+              file_entry, sub_find_specs, 1):
+            result_queue.put(
+                (serializer.WriteSerialized(matching_path_spec), None))
+
+      except Exception as exception:  # pylint: disable=broad-except
+        result_queue.put((None, '{0:s} with error: {1!s}'.format(
+            path_spec_json, exception)))
+
+      task = task_queue.get()
+
+  except Exception as exception:  # pylint: disable=broad-except
+    result_queue.put((None, 'worker failed with error: {0!s}'.format(
+        exception)))
+
+  finally:
+    result_queue.put(None)
 
 
 class FindSpec(object):
@@ -395,6 +461,10 @@ class FindSpec(object):
 class FileSystemSearcher(object):
   """Searcher to find file entries within a file system."""
 
+  # The number of seconds to wait for a result of a parallel find before
+  # checking if the worker processes are still alive.
+  _RESULT_QUEUE_TIMEOUT = 1.0
+
   def __init__(self, file_system, mount_point):
     """Initializes a file system searcher.
 
@@ -476,6 +546,134 @@ class FileSystemSearcher(object):
     for matching_path_spec in self._FindInFileEntry(file_entry, find_specs, 0):
       yield matching_path_spec
 
+  def FindParallel(self, find_specs=None, number_of_workers=None):
+    """Searches for matching file entries using multiple worker processes.
+
+    The search is partitioned by the top-level file entries, which are
+    searched by worker processes that open the file system with their own
+    resolver context. Hence the file system must be resolvable from its path
+    specifications, for example a fake file system is not supported.
+
+    Note that the order of the matching file entries differs from that of
+    Find, since the results of the workers are returned as they arrive.
+
+    Args:
+      find_specs (Optional[list[FindSpec]]): find specifications, where None
+          will return all allocated file entries.
+      number_of_workers (Optional[int]): number of worker processes, where
+          None represents the number of CPUs.
+
+    Yields:
+      PathSpec: path specification of a matching file entry.
+
+    Raises:
+      BackEndError: if a worker process could not search a file entry or
+          terminated unexpectedly.
+      ValueError: if the number of workers is less than 1.
+    """
+    if number_of_workers is None:
+      number_of_workers = multiprocessing.cpu_count()
+
+    if number_of_workers < 1:
+      raise ValueError('Invalid number of workers value: {0!s}.'.format(
+          number_of_workers))
+
+    if not find_specs:
+      find_specs = [FindSpec()]
+
+    if path_spec_factory.Factory.IsSystemLevelTypeIndicator(
+        self._file_system.type_indicator):
+      file_entry = self._file_system.GetFileEntryByPathSpec(self._mount_point)
+    else:
+      file_entry = self._file_system.GetRootFileEntry()
+
+    find_spec_indexes = []
+    for find_spec_index, find_spec in enumerate(find_specs):
+      match, location_match = find_spec.Matches(file_entry, search_depth=0)
+      if match:
+        yield file_entry.path_spec
+
+      # pylint: disable=singleton-comparison
+      if location_match != False and not find_spec.AtMaximumDepth(0):
+        find_spec_indexes.append(find_spec_index)
+
+    if not find_spec_indexes:
+      return
+
+    serializer = json_serializer.JsonPathSpecSerializer
+
+    tasks = []
+    try:
+      for sub_file_entry in file_entry.sub_file_entries:
+        tasks.append((
+            serializer.WriteSerialized(sub_file_entry.path_spec),
+            find_spec_indexes))
+    except errors.AccessError:
+      pass
+
+    if not tasks:
+      return
+
+    number_of_workers = min(number_of_workers, len(tasks))
+
+    task_queue = multiprocessing.Queue()
+    for task in tasks:
+      task_queue.put(task)
+    for _ in range(number_of_workers):
+      task_queue.put(None)
+
+    result_queue = multiprocessing.Queue()
+    mount_point_json = serializer.WriteSerialized(self._mount_point)
+
+    workers = []
+    try:
+      for _ in range(number_of_workers):
+        worker = multiprocessing.Process(
+            target=_FindInSubFileEntriesWorker, args=(
+                mount_point_json, find_specs, task_queue, result_queue))
+        worker.daemon = True
+        worker.start()
+        workers.append(worker)
+
+      has_terminated_worker = False
+      number_of_active_workers = number_of_workers
+      while number_of_active_workers > 0:
+        try:
+          result = result_queue.get(timeout=self._RESULT_QUEUE_TIMEOUT)
+        except queue.Empty:
+          # A worker that terminated without acknowledging that it stops,
+          # for example because it was killed, will not return any more
+          # results. The results a worker returned before it terminated are
+          # available after one more attempt.
+          if has_terminated_worker:
+            raise errors.BackEndError(
+                'Unable to search file entries: worker terminated.')
+
+          number_of_alive_workers = len([
+              worker for worker in workers if worker.is_alive()])
+          has_terminated_worker = (
+              number_of_alive_workers < number_of_active_workers)
+          continue
+
+        has_terminated_worker = False
+
+        if result is None:
+          number_of_active_workers -= 1
+          continue
+
+        path_spec_json, error_message = result
+        if error_message:
+          raise errors.BackEndError(
+              'Unable to search file entry: {0:s}'.format(error_message))
+
+        yield serializer.ReadSerialized(path_spec_json)
+
+    finally:
+      for worker in workers:
+        if worker.is_alive():
+          worker.terminate()
+        worker.join()
+
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
 
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""Helpers to calculate message digest hashes of data streams."""
+
+from __future__ import unicode_literals
+
+import hashlib
+import threading
+import time
+
+try:
+  import queue
+except ImportError:
+  import Queue as queue  # pylint: disable=import-error
+
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+
+class HashingStatistics(object):
+  """Hashing throughput statistics per back-end.
+
+  The back-end of a data stream is the type indicator of the path
+  specification of its file entry, such as TSK or OS.
+  """
+
+  _BYTES_PER_MEGABYTE = 1024 * 1024
+
+  def __init__(self):
+    """Initializes hashing statistics."""
+    super(HashingStatistics, self).__init__()
+    self._durations = {}
+    self._lock = threading.Lock()
+    self._number_of_bytes = {}
+    self._number_of_data_streams = {}
+
+  @property
+  def type_indicators(self):
+    """list[str]: type indicators of the back-ends with statistics."""
+    with self._lock:
+      return sorted(self._number_of_bytes.keys())
+
+  def AddDataStream(self, type_indicator, number_of_bytes, duration):
+    """Adds the statistics of a hashed data stream.
+
+    Args:
+      type_indicator (str): type indicator of the back-end.
+      number_of_bytes (int): number of bytes hashed.
+      duration (float): duration of reading and hashing, in seconds.
+    """
+    with self._lock:
+      self._durations[type_indicator] = (
+          self._durations.get(type_indicator, 0.0) + duration)
+      self._number_of_bytes[type_indicator] = (
+          self._number_of_bytes.get(type_indicator, 0) + number_of_bytes)
+      self._number_of_data_streams[type_indicator] = (
+          self._number_of_data_streams.get(type_indicator, 0) + 1)
+
+  def GetNumberOfBytes(self, type_indicator):
+    """Retrieves the number of bytes hashed of a back-end.
+
+    Args:
+      type_indicator (str): type indicator of the back-end.
+
+    Returns:
+      int: number of bytes hashed.
+    """
+    with self._lock:
+      return self._number_of_bytes.get(type_indicator, 0)
+
+  def GetNumberOfDataStreams(self, type_indicator):
+    """Retrieves the number of data streams hashed of a back-end.
+
+    Args:
+      type_indicator (str): type indicator of the back-end.
+
+    Returns:
+      int: number of data streams hashed.
+    """
+    with self._lock:
+      return self._number_of_data_streams.get(type_indicator, 0)
+
+  def GetThroughput(self, type_indicator):
+    """Retrieves the hashing throughput of a back-end.
+
+    Since data streams can be hashed concurrently, the throughput is that of
+    a single worker.
+
+    Args:
+      type_indicator (str): type indicator of the back-end.
+
+    Returns:
+      float: throughput in megabytes (1024 x 1024 bytes) per second or None
+          if not available.
+    """
+    with self._lock:
+      duration = self._durations.get(type_indicator, None)
+      number_of_bytes = self._number_of_bytes.get(type_indicator, 0)
+
+    if not duration:
+      return None
+
+    return float(number_of_bytes) / (duration * self._BYTES_PER_MEGABYTE)
+
+
+class DataStreamHasher(object):
+  """Calculates multiple message digest hashes of data streams.
+
+  All hashes are calculated in a single pass over the data. Reading and
+  hashing overlap, since the data is read ahead by a separate thread and
+  hashlib releases the global interpreter lock while hashing large buffers.
+
+  Attributes:
+    statistics (HashingStatistics): hashing throughput statistics.
+  """
+
+  _DEFAULT_HASH_NAMES = ['md5', 'sha1', 'sha256']
+
+  # The maximum number of buffers that are read ahead.
+  _MAXIMUM_NUMBER_OF_READ_AHEAD_BUFFERS = 4
+
+  _READ_BUFFER_SIZE = 1024 * 1024
+
+  def __init__(
+      self, hash_names=None, read_ahead=True, read_buffer_size=None,
+      resolver_context=None):
+    """Initializes a data stream hasher.
+
+    Args:
+      hash_names (Optional[list[str]]): names of the hashes to calculate,
+          as supported by hashlib, where None represents MD5, SHA-1 and
+          SHA-256.
+      read_ahead (Optional[bool]): True if data should be read ahead in
+          a separate thread.
+      read_buffer_size (Optional[int]): read buffer size, in bytes, where
+          None represents the default read buffer size.
+      resolver_context (Optional[Context]): resolver context, where None
+          represents a thread-safe resolver context.
+
+    Raises:
+      ValueError: if a hash is not supported or the read buffer size is
+          invalid.
+    """
+    hash_names = hash_names or self._DEFAULT_HASH_NAMES
+    for hash_name in hash_names:
+      try:
+        hashlib.new(hash_name)
+      except ValueError:
+        raise ValueError('Unsupported hash: {0!s}'.format(hash_name))
+
+    if read_buffer_size is None:
+      read_buffer_size = self._READ_BUFFER_SIZE
+    elif read_buffer_size <= 0:
+      raise ValueError('Invalid read buffer size: {0:d}.'.format(
+          read_buffer_size))
+
+    super(DataStreamHasher, self).__init__()
+    self._hash_names = list(hash_names)
+    self._read_ahead = read_ahead
+    self._read_buffer_size = read_buffer_size
+    self._resolver_context = resolver_context or context.ThreadSafeContext()
+
+    self.statistics = HashingStatistics()
+
+  def _HashDataStreamsWorker(self, task_queue, result_queue):
+    """Hashes data streams until there are no more tasks.
+
+    Args:
+      task_queue (queue.Queue): queue of tasks, where a task is a tuple of
+          the path specification of a file entry and the name of the data
+          stream and None represents there are no more tasks.
+      result_queue (queue.Queue): queue of results, where a result is a tuple
+          of the path specification, the name of the data stream, the hashes
+          or None if not available and the exception raised while hashing
+          or None if no error occurred.
+    """
+    task = task_queue.get()
+    while task is not None:
+      path_spec, data_stream_name = task
+
+      error = None
+      hashes = None
+      try:
+        file_entry = resolver.Resolver.OpenFileEntry(
+            path_spec, resolver_context=self._resolver_context)
+        if file_entry:
+          hashes = self.HashDataStream(
+              file_entry, data_stream_name=data_stream_name)
+
+      except Exception as exception:  # pylint: disable=broad-except
+        error = exception
+
+      result_queue.put((path_spec, data_stream_name, hashes, error))
+      task = task_queue.get()
+
+  def _ReadAhead(self, file_object, data_queue, stop_event):
+    """Reads the data of a file-like object into a queue.
+
+    Args:
+      file_object (FileIO): file-like object.
+      data_queue (queue.Queue): queue of data, where an empty byte string
+          represents the end of the data and an exception a read error.
+      stop_event (threading.Event): event that signals to stop reading.
+    """
+    try:
+      data = file_object.read(self._read_buffer_size)
+      while data and not stop_event.is_set():
+        data_queue.put(data)
+        data = file_object.read(self._read_buffer_size)
+
+    except Exception as exception:  # pylint: disable=broad-except
+      data_queue.put(exception)
+      return
+
+    data_queue.put(b'')
+
+  def _ReadData(self, file_object):
+    """Reads the data of a file-like object.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Yields:
+      bytes: data.
+
+    Raises:
+      IOError: if the data cannot be read.
+      OSError: if the data cannot be read.
+    """
+    if not self._read_ahead:
+      data = file_object.read(self._read_buffer_size)
+      while data:
+        yield data
+        data = file_object.read(self._read_buffer_size)
+      return
+
+    data_queue = queue.Queue(
+        maxsize=self._MAXIMUM_NUMBER_OF_READ_AHEAD_BUFFERS)
+    stop_event = threading.Event()
+    read_ahead_thread = threading.Thread(
+        target=self._ReadAhead, args=(file_object, data_queue, stop_event))
+    read_ahead_thread.daemon = True
+    read_ahead_thread.start()
+
+    try:
+      data = data_queue.get()
+      while data:
+        if isinstance(data, Exception):
+          raise IOError('Unable to read data with error: {0!s}'.format(data))
+
+        yield data
+        data = data_queue.get()
+
+    finally:
+      # Drain the queue so that the read ahead thread can finish.
+      stop_event.set()
+      while read_ahead_thread.is_alive():
+        try:
+          data_queue.get(timeout=0.1)
+        except queue.Empty:
+          pass
+
+      read_ahead_thread.join()
+
+  def HashDataStream(self, file_entry, data_stream_name=''):
+    """Calculates the message digest hashes of a data stream.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      data_stream_name (Optional[str]): name of the data stream, where an
+          empty string represents the default data stream.
+
+    Returns:
+      dict[str, str]: hexadecimal digests per hash name or None if the file
+          entry has no such data stream.
+
+    Raises:
+      IOError: if the data stream cannot be read.
+      OSError: if the data stream cannot be read.
+    """
+    start_time = time.time()
+
+    file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
+    if not file_object:
+      return None
+
+    try:
+      hashes, number_of_bytes = self.HashFileObject(file_object)
+    finally:
+      file_object.close()
+
+    duration = time.time() - start_time
+    self.statistics.AddDataStream(
+        file_entry.type_indicator, number_of_bytes, duration)
+
+    return hashes
+
+  def HashDataStreams(self, data_streams, number_of_workers=4):
+    """Calculates the message digest hashes of data streams concurrently.
+
+    Args:
+      data_streams (iterable[tuple[PathSpec, str]]): path specifications of
+          file entries and the names of the data streams to hash.
+      number_of_workers (Optional[int]): number of worker threads.
+
+    Yields:
+      tuple[PathSpec, str, dict[str, str], Exception]: path specification,
+          name of the data stream, hexadecimal digests per hash name or None
+          if the data stream could not be hashed and the exception raised
+          while hashing or None if no error occurred. A data stream or file
+          entry that does not exist has no hashes and no error. Results are
+          generated in order of completion.
+
+    Raises:
+      ValueError: if the number of workers is invalid.
+    """
+    if number_of_workers < 1:
+      raise ValueError('Invalid number of workers: {0:d}.'.format(
+          number_of_workers))
+
+    task_queue = queue.Queue(maxsize=number_of_workers * 2)
+    result_queue = queue.Queue()
+
+    workers = []
+    for _ in range(number_of_workers):
+      worker = threading.Thread(
+          target=self._HashDataStreamsWorker, args=(task_queue, result_queue))
+      worker.daemon = True
+      worker.start()
+      workers.append(worker)
+
+    number_of_tasks = 0
+    workers_stopped = False
+    try:
+      for path_spec, data_stream_name in data_streams:
+        task_queue.put((path_spec, data_stream_name))
+        number_of_tasks += 1
+
+        while not result_queue.empty():
+          number_of_tasks -= 1
+          yield result_queue.get()
+
+      for _ in workers:
+        task_queue.put(None)
+      workers_stopped = True
+
+      while number_of_tasks > 0:
+        number_of_tasks -= 1
+        yield result_queue.get()
+
+    finally:
+      # Stop the workers when the results are not consumed to the end or
+      # the data streams could not be iterated, by discarding the pending
+      # tasks so that the workers receive the sentinels.
+      if not workers_stopped:
+        while not task_queue.empty():
+          try:
+            task_queue.get_nowait()
+          except queue.Empty:
+            break
+
+        for _ in workers:
+          task_queue.put(None)
+
+      for worker in workers:
+        worker.join()
+
+  def HashFileObject(self, file_object):
+    """Calculates the message digest hashes of a file-like object.
+
+    The data is read from the current offset.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      tuple[dict[str, str], int]: hexadecimal digests per hash name and
+          the number of bytes hashed.
+
+    Raises:
+      IOError: if the data cannot be read.
+      OSError: if the data cannot be read.
+    """
+    hash_contexts = [
+        hashlib.new(hash_name) for hash_name in self._hash_names]
+
+    number_of_bytes = 0
+    for data in self._ReadData(file_object):
+      for hash_context in hash_contexts:
+        hash_context.update(data)
+
+      number_of_bytes += len(data)
+
+    hashes = {
+        hash_name: hash_context.hexdigest()
+        for hash_name, hash_context in zip(self._hash_names, hash_contexts)}
+    return hashes, number_of_bytes
@@ -378,6 +378,12 @@ class SourceScannerContext(object):
 class SourceScanner(object):
   """Searcher to find volumes within a volume system."""
 
+  # The format categories that are scanned for.
+  _SCAN_FORMAT_CATEGORIES = frozenset([
+      definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+      definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE,
+      definitions.FORMAT_CATEGORY_VOLUME_SYSTEM])
+
   def __init__(self, resolver_context=None):
     """Initializes a source scanner.
 
@@ -388,6 +394,40 @@ class SourceScanner(object):
     """
     super(SourceScanner, self).__init__()
     self._resolver_context = resolver_context
+    self._type_indicators_cache = None
+
+  def _GetTypeIndicators(self, path_spec, format_category):
+    """Determines the supported format types of a format category.
+
+    The format types of all format categories that are scanned for are
+    determined at once, with a single read of the scan data. During a scan
+    the results are cached per path specification, so that the same data is
+    not analyzed again. The cache is emptied at the end of the scan since
+    the data of a path specification can change between scans, for example
+    when an encrypted volume was unlocked.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      format_category (int): format category, such as
+          FORMAT_CATEGORY_FILE_SYSTEM.
+
+    Returns:
+      list[str]: supported format type indicators.
+    """
+    type_indicators = None
+    if self._type_indicators_cache is not None:
+      type_indicators = self._type_indicators_cache.get(
+          path_spec.comparable, None)
+
+    if type_indicators is None:
+      type_indicators = analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(
+          path_spec, self._SCAN_FORMAT_CATEGORIES,
+          resolver_context=self._resolver_context)
+
+      if self._type_indicators_cache is not None:
+        self._type_indicators_cache[path_spec.comparable] = type_indicators
+
+    return list(type_indicators[format_category])
 
   # TODO: add functions to check if path spec type is a storage media image
   # type, file system type, etc.
@@ -659,7 +699,11 @@ class SourceScanner(object):
       scan_node = scan_context.GetUnscannedScanNode()
 
     if scan_node:
-      self._ScanNode(scan_context, scan_node, auto_recurse=auto_recurse)
+      self._type_indicators_cache = {}
+      try:
+        self._ScanNode(scan_context, scan_node, auto_recurse=auto_recurse)
+      finally:
+        self._type_indicators_cache = None
 
   def ScanForFileSystem(self, source_path_spec):
     """Scans the path specification for a supported file system format.
@@ -685,8 +729,8 @@ class SourceScanner(object):
           parent=source_path_spec)
 
     try:
-      type_indicators = analyzer.Analyzer.GetFileSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_FILE_SYSTEM)
     except RuntimeError as exception:
       raise errors.BackEndError((
           'Unable to process source path specification with error: '
@@ -739,8 +783,8 @@ class SourceScanner(object):
           media image type is found.
     """
     try:
-      type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE)
     except RuntimeError as exception:
       raise errors.BackEndError((
           'Unable to process source path specification with error: '
@@ -805,8 +849,8 @@ class SourceScanner(object):
       return None
 
     try:
-      type_indicators = analyzer.Analyzer.GetVolumeSystemTypeIndicators(
-          source_path_spec, resolver_context=self._resolver_context)
+      type_indicators = self._GetTypeIndicators(
+          source_path_spec, definitions.FORMAT_CATEGORY_VOLUME_SYSTEM)
     except (IOError, RuntimeError) as exception:
       raise errors.BackEndError((
           'Unable to process source path specification with error: '
@@ -99,9 +99,14 @@ class TextFile(object):
         read_size = self._file_object_size - self._lines_buffer_offset
 
       self._file_object.seek(self._lines_buffer_offset, os.SEEK_SET)
-      read_buffer = self._file_object.read(read_size)
 
-      self._lines_buffer_offset += len(read_buffer)
+      # Read directly into a buffer to prevent the file-like object from
+      # creating intermediate byte strings.
+      read_buffer = bytearray(read_size)
+      read_count = self._file_object.readinto(read_buffer)
+      del read_buffer[read_count:]
+
+      self._lines_buffer_offset += read_count
 
       self._lines = read_buffer.split(self._end_of_line)
       if self._lines_buffer:
@@ -100,6 +100,7 @@ class CPIOArchiveFile(data_format.DataFormat):
     """Initializes a CPIO archive file."""
     super(CPIOArchiveFile, self).__init__()
     self._file_entries = None
+    self._file_entries_by_parent_path = None
     self._file_object = None
     self._file_object_opened_in_object = False
     self._file_size = 0
@@ -235,6 +236,7 @@ class CPIOArchiveFile(data_format.DataFormat):
       file_object (FileIO): file-like object.
     """
     self._file_entries = {}
+    self._file_entries_by_parent_path = {}
 
     file_offset = 0
     while file_offset < self._file_size or self._file_size == 0:
@@ -249,9 +251,14 @@ class CPIOArchiveFile(data_format.DataFormat):
 
       self._file_entries[file_entry.path] = file_entry
 
+      parent_path, _, _ = file_entry.path.rpartition('/')
+      self._file_entries_by_parent_path.setdefault(parent_path, []).append(
+          file_entry)
+
   def Close(self):
     """Closes the CPIO archive file."""
     self._file_entries = None
+    self._file_entries_by_parent_path = None
     self._file_object = None
     self._file_size = None
 
@@ -280,6 +287,21 @@ class CPIOArchiveFile(data_format.DataFormat):
         if path.startswith(path_prefix):
           yield file_entry
 
+  def GetSubFileEntries(self, path):
+    """Retrieves the file entries that are direct children of a path.
+
+    Args:
+      path (str): path of the parent, where an empty string represents
+          the root.
+
+    Returns:
+      list[CPIOArchiveFileEntry]: CPIO archive file entries.
+    """
+    if not self._file_entries_by_parent_path:
+      return []
+
+    return self._file_entries_by_parent_path.get(path.rstrip('/'), [])
+
   def GetFileEntryByPath(self, path):
     """Retrieves a file entry for a specific path.
 
@@ -4,6 +4,9 @@
 from __future__ import unicode_literals
 
 
+# The resolver cache eviction policy definitions.
+CACHE_EVICTION_POLICY_LRU = 'lru'
+
 # The compression method definitions.
 COMPRESSION_METHOD_BZIP2 = 'bzip2'
 COMPRESSION_METHOD_DEFLATE = 'deflate'
@@ -48,6 +51,7 @@ TYPE_INDICATOR_NTFS = 'NTFS'
 TYPE_INDICATOR_OS = 'OS'
 TYPE_INDICATOR_QCOW = 'QCOW'
 TYPE_INDICATOR_RAW = 'RAW'
+TYPE_INDICATOR_READ_AHEAD = 'READ_AHEAD'
 TYPE_INDICATOR_SQLITE_BLOB = 'SQLITE_BLOB'
 TYPE_INDICATOR_TAR = 'TAR'
 TYPE_INDICATOR_TSK = 'TSK'
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""Helper functions for indexing the directory entries of archive files."""
+
+from __future__ import unicode_literals
+
+import collections
+
+
+class DirectoryIndex(object):
+  """Index of the directory entries of an archive file, such as TAR or ZIP.
+
+  Archive files can lack directories, hence the index also contains virtual
+  directories for the parents of all paths. The locations in the index are
+  prefixed with the path separator and do not have a trailing path separator,
+  except for the root location.
+  """
+
+  def __init__(self, path_separator='/', mark_directories=False):
+    """Initializes a directory index.
+
+    Args:
+      path_separator (Optional[str]): path segment separator.
+      mark_directories (Optional[bool]): True if the locations of directory
+          entries that are directories should have a trailing path separator.
+    """
+    super(DirectoryIndex, self).__init__()
+    self._mark_directories = mark_directories
+    self._path_separator = path_separator
+    self._sub_locations_by_location = {}
+
+  def AddPath(self, path):
+    """Adds a path and the virtual directories of its parents.
+
+    Args:
+      path (str): path in the archive file, which does not have the leading
+          path separator as the location does. A path with a trailing path
+          separator represents a directory.
+    """
+    path_segments = [
+        path_segment for path_segment in path.split(self._path_separator)
+        if path_segment]
+
+    parent_location = self._path_separator
+    last_path_segment_index = len(path_segments) - 1
+    for path_segment_index in range(len(path_segments)):
+      location = '{0:s}{1:s}'.format(
+          self._path_separator,
+          self._path_separator.join(path_segments[:path_segment_index + 1]))
+
+      sub_location = location
+      if self._mark_directories and (
+          path_segment_index < last_path_segment_index or
+          path.endswith(self._path_separator)):
+        sub_location += self._path_separator
+
+      sub_locations = self._sub_locations_by_location.get(
+          parent_location, None)
+      if sub_locations is None:
+        sub_locations = collections.OrderedDict()
+        self._sub_locations_by_location[parent_location] = sub_locations
+
+      sub_locations[sub_location] = True
+      parent_location = location
+
+  def GetIndexLocation(self, location):
+    """Retrieves the location as stored in the index.
+
+    Args:
+      location (str): location.
+
+    Returns:
+      str: location without trailing path separators.
+    """
+    if len(location) > 1:
+      location = location.rstrip(self._path_separator) or self._path_separator
+    return location
+
+  def GetSubLocations(self, location):
+    """Retrieves the locations of the entries of a directory.
+
+    Args:
+      location (str): location of the directory.
+
+    Returns:
+      list[str]: locations of the directory entries, including virtual
+          directories.
+    """
+    sub_locations = self._sub_locations_by_location.get(
+        self.GetIndexLocation(location), None)
+    if not sub_locations:
+      return []
+
+    return list(sub_locations.keys())
+
+  def HasDirectory(self, location):
+    """Determines if the location is a directory that has entries.
+
+    Args:
+      location (str): location.
+
+    Returns:
+      bool: True if the location is a directory, including virtual
+          directories, that has entries.
+    """
+    return self.GetIndexLocation(location) in self._sub_locations_by_location
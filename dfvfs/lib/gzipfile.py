@@ -7,6 +7,7 @@
 
 from __future__ import unicode_literals
 
+import bisect
 import os
 
 from dtfabric.runtime import fabric as dtfabric_fabric
@@ -31,18 +32,36 @@ class _GzipDecompressorState(object):
 
   _MAXIMUM_READ_SIZE = 1024 * 1024
 
-  def __init__(self, stream_start):
+  def __init__(self, stream_start, maximum_read_size=None):
     """Initializes a gzip member decompressor wrapper.
 
     Args:
       stream_start (int): offset to the compressed stream within the containing
           file object.
+      maximum_read_size (Optional[int]): maximum number of bytes of compressed
+          data to read at once, where None represents the default.
     """
     self._decompressor = zlib_decompressor.DeflateDecompressor()
+    self._maximum_read_size = maximum_read_size or self._MAXIMUM_READ_SIZE
     self.last_read = stream_start
     self.uncompressed_offset = 0
     self._compressed_data = b''
 
+  def Copy(self):
+    """Copies the decompressor state.
+
+    Returns:
+      _GzipDecompressorState: copy of the decompressor state, which can be
+          used to resume decompression from the current position.
+    """
+    decompressor_state = _GzipDecompressorState(
+        self.last_read, maximum_read_size=self._maximum_read_size)
+    # pylint: disable=protected-access
+    decompressor_state._compressed_data = self._compressed_data
+    decompressor_state._decompressor = self._decompressor.Copy()
+    decompressor_state.uncompressed_offset = self.uncompressed_offset
+    return decompressor_state
+
   def Read(self, file_object):
     """Reads the next uncompressed data from the gzip stream.
 
@@ -53,7 +72,7 @@ class _GzipDecompressorState(object):
       bytes: next uncompressed data from the compressed stream.
     """
     file_object.seek(self.last_read, os.SEEK_SET)
-    read_data = file_object.read(self._MAXIMUM_READ_SIZE)
+    read_data = file_object.read(self._maximum_read_size)
     self.last_read = file_object.get_offset()
     compressed_data = b''.join([self._compressed_data, read_data])
     decompressed, extra_compressed = self._decompressor.Decompress(
@@ -83,6 +102,11 @@ class GzipMember(data_format.DataFormat):
   sequentially before metadata and random seeks are possible. This class
   provides caching of gzip member data during the initial read of each member.
 
+  While decompressing, access points are stored at regular intervals of
+  uncompressed data. An access point contains a copy of the decompressor
+  state, so that a read can resume decompression from the nearest preceding
+  access point instead of from the start of the member.
+
   Attributes:
     comment (str): comment stored in the member.
     member_end_offset (int): offset to the end of the member in the parent file
@@ -136,16 +160,31 @@ class GzipMember(data_format.DataFormat):
   # The maximum size of the uncompressed data cache.
   _UNCOMPRESSED_DATA_CACHE_SIZE = 2 * 1024 * 1024
 
+  # The minimum distance in the uncompressed data between access points.
+  _ACCESS_POINT_SPACING = 4 * 1024 * 1024
+
+  # The maximum number of bytes of compressed data to decompress at once.
+  _COMPRESSED_DATA_READ_SIZE = 1024 * 1024
+
   def __init__(
-      self, file_object, member_start_offset, uncompressed_data_offset):
+      self, file_object, member_start_offset, uncompressed_data_offset,
+      member_end_offset=None, uncompressed_data_size=None):
     """Initializes a gzip member.
 
+    If both the member end offset and uncompressed data size are provided,
+    for example from a previously stored index, the member data is not
+    decompressed to determine them.
+
     Args:
       file_object (FileIO): file-like object, containing the gzip member.
       member_start_offset (int): offset to the beginning of the gzip member
           in the containing file.
       uncompressed_data_offset (int): current offset into the uncompressed data
           in the containing file.
+      member_end_offset (Optional[int]): offset to the end of the gzip member
+          in the containing file.
+      uncompressed_data_size (Optional[int]): total size of the data in this
+          gzip member after decompression.
     """
     self.comment = None
     self.modification_time = None
@@ -160,6 +199,11 @@ class GzipMember(data_format.DataFormat):
     self._cache_end_offset = None
     self._cache = b''
 
+    # Access points sorted by their offset into this member's uncompressed
+    # data.
+    self._access_points = []
+    self._access_point_offsets = []
+
     # Total size of the data in this gzip member after decompression.
     self.uncompressed_data_size = None
     # Offset of the start of the uncompressed data in this member relative to
@@ -178,15 +222,22 @@ class GzipMember(data_format.DataFormat):
     self._compressed_data_start = file_object.get_offset()
 
     self._decompressor_state = _GzipDecompressorState(
-        self._compressed_data_start)
+        self._compressed_data_start,
+        maximum_read_size=self._COMPRESSED_DATA_READ_SIZE)
+
+    if member_end_offset is not None and uncompressed_data_size is not None:
+      self.uncompressed_data_size = uncompressed_data_size
+
+    else:
+      self._LoadDataIntoCache(file_object, 0, read_all_data=True)
 
-    self._LoadDataIntoCache(file_object, 0, read_all_data=True)
+      # TODO: gracefully handle missing footer.
+      self._ReadMemberFooter(file_object)
 
-    # TODO: gracefully handle missing footer.
-    self._ReadMemberFooter(file_object)
+      member_end_offset = file_object.get_offset()
 
     # Offset to the end of the member in the parent file object.
-    self.member_end_offset = file_object.get_offset()
+    self.member_end_offset = member_end_offset
 
   def _ReadMemberHeader(self, file_object):
     """Reads a member header.
@@ -255,10 +306,55 @@ class GzipMember(data_format.DataFormat):
 
     self.uncompressed_data_size = member_footer.uncompressed_data_size
 
+  def _GetAccessPoint(self, offset):
+    """Retrieves the nearest access point at or before an offset.
+
+    Args:
+      offset (int): offset into this member's uncompressed data.
+
+    Returns:
+      _GzipDecompressorState: decompressor state of the access point or None
+          if no access point precedes the offset.
+    """
+    access_point_index = bisect.bisect_right(
+        self._access_point_offsets, offset)
+    if access_point_index == 0:
+      return None
+
+    return self._access_points[access_point_index - 1]
+
   def _ResetDecompressorState(self):
     """Resets the state of the internal decompression object."""
     self._decompressor_state = _GzipDecompressorState(
-        self._compressed_data_start)
+        self._compressed_data_start,
+        maximum_read_size=self._COMPRESSED_DATA_READ_SIZE)
+
+  def _StoreAccessPoint(self):
+    """Stores an access point for the current decompressor state.
+
+    An access point is only stored if the previous access point lies at least
+    the access point spacing before the current uncompressed offset.
+    """
+    uncompressed_offset = self._decompressor_state.uncompressed_offset
+
+    last_access_point_offset = 0
+    if self._access_point_offsets:
+      last_access_point_offset = self._access_point_offsets[-1]
+
+    if (uncompressed_offset - last_access_point_offset <
+        self._ACCESS_POINT_SPACING):
+      return
+
+    self._access_points.append(self._decompressor_state.Copy())
+    self._access_point_offsets.append(uncompressed_offset)
+
+  def GetNumberOfAccessPoints(self):
+    """Retrieves the number of access points.
+
+    Returns:
+      int: number of access points.
+    """
+    return len(self._access_points)
 
   def FlushCache(self):
     """Empties the cache that holds cached decompressed data."""
@@ -273,7 +369,7 @@ class GzipMember(data_format.DataFormat):
     Returns:
       int: number of cached bytes.
     """
-    if not self._cache_start_offset or not self._cache_end_offset:
+    if self._cache_start_offset is None or self._cache_end_offset is None:
       return 0
     return self._cache_end_offset - self._cache_start_offset
 
@@ -317,7 +413,7 @@ class GzipMember(data_format.DataFormat):
     if self._cache_start_offset is None:
       self._LoadDataIntoCache(self._file_object, offset)
 
-    if offset > self._cache_end_offset or offset < self._cache_start_offset:
+    if offset >= self._cache_end_offset or offset < self._cache_start_offset:
       self.FlushCache()
       self._LoadDataIntoCache(self._file_object, offset)
 
@@ -349,9 +445,17 @@ class GzipMember(data_format.DataFormat):
     # Decompression can only be performed from beginning to end of the stream.
     # So, if data before the current position of the decompressor in the stream
     # is required, it's necessary to throw away the current decompression
-    # state and start again.
-    if minimum_offset < self._decompressor_state.uncompressed_offset:
-      self._ResetDecompressorState()
+    # state and resume from the nearest preceding access point, or start again
+    # if there is none. An access point ahead of the current position of the
+    # decompressor is also used to skip decompressing data.
+    access_point = self._GetAccessPoint(minimum_offset)
+    if (minimum_offset < self._decompressor_state.uncompressed_offset or (
+        access_point and access_point.uncompressed_offset >
+        self._decompressor_state.uncompressed_offset)):
+      if access_point:
+        self._decompressor_state = access_point.Copy()
+      else:
+        self._ResetDecompressorState()
 
     while not self.IsCacheFull() or read_all_data:
       decompressed_data = self._decompressor_state.Read(file_object)
@@ -373,7 +477,7 @@ class GzipMember(data_format.DataFormat):
 
       if decompressed_start_offset < minimum_offset < decompressed_end_offset:
         data_add_offset = decompressed_end_offset - minimum_offset
-        data_to_add = decompressed_data[-data_add_offset]
+        data_to_add = decompressed_data[-data_add_offset:]
         added_data_start_offset = decompressed_end_offset - data_add_offset
 
       if not self.IsCacheFull() and data_to_add:
@@ -394,3 +498,5 @@ class GzipMember(data_format.DataFormat):
         file_object.seek(seek_offset, os.SEEK_CUR)
         self._ResetDecompressorState()
         break
+
+      self._StoreAccessPoint()
@@ -5,6 +5,7 @@ from __future__ import unicode_literals
 
 import os
 import tempfile
+import threading
 
 try:
   from pysqlite2 import dbapi2 as sqlite3
@@ -19,8 +20,12 @@ class SQLiteDatabaseFile(object):
 
   _COPY_BUFFER_SIZE = 65536
 
+  _ENCODING_QUERY = 'PRAGMA encoding'
+
   _HAS_COLUMN_QUERY = 'PRAGMA table_info("{0:s}")'
 
+  _HAS_ROW_IDENTIFIER_QUERY = 'SELECT _ROWID_ FROM {0:s} LIMIT 0'
+
   _HAS_TABLE_QUERY = (
       'SELECT name FROM sqlite_master WHERE type = "table"')
 
@@ -34,6 +39,9 @@ class SQLiteDatabaseFile(object):
     self._column_names_per_table = {}
     self._connection = None
     self._cursor = None
+    self._encoding = None
+    self._lock = threading.Lock()
+    self._row_identifier_per_table = {}
     self._table_names = None
     self._temp_file_path = ''
 
@@ -58,6 +66,32 @@ class SQLiteDatabaseFile(object):
 
     self._temp_file_path = ''
 
+  def GetEncoding(self):
+    """Retrieves the text encoding of the database.
+
+    Returns:
+      str: text encoding, such as "UTF-8" or "UTF-16le".
+
+    Raises:
+      IOError: if the database file is not opened.
+      OSError: if the database file is not opened.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    if self._encoding is None:
+      with self._lock:
+        self._cursor.execute(self._ENCODING_QUERY)
+        row = self._cursor.fetchone()
+
+      encoding = row[0] if row else ''
+      if isinstance(encoding, bytes):
+        encoding = encoding.decode('utf-8')
+
+      self._encoding = encoding
+
+    return self._encoding
+
   def GetNumberOfRows(self, table_name):
     """Retrieves the number of rows in the table.
 
@@ -74,8 +108,9 @@ class SQLiteDatabaseFile(object):
     if not self._connection:
       raise IOError('Not opened.')
 
-    self._cursor.execute(self._NUMBER_OF_ROWS_QUERY.format(table_name))
-    row = self._cursor.fetchone()
+    with self._lock:
+      self._cursor.execute(self._NUMBER_OF_ROWS_QUERY.format(table_name))
+      row = self._cursor.fetchone()
     if not row:
       raise IOError(
           'Unable to retrieve number of rows of table: {0:s}'.format(
@@ -117,8 +152,11 @@ class SQLiteDatabaseFile(object):
     if column_names is None:
       column_names = []
 
-      self._cursor.execute(self._HAS_COLUMN_QUERY.format(table_name))
-      for row in self._cursor.fetchall():
+      with self._lock:
+        self._cursor.execute(self._HAS_COLUMN_QUERY.format(table_name))
+        rows = self._cursor.fetchall()
+
+      for row in rows:
         if not row[1]:
           continue
 
@@ -155,8 +193,11 @@ class SQLiteDatabaseFile(object):
     if self._table_names is None:
       self._table_names = []
 
-      self._cursor.execute(self._HAS_TABLE_QUERY)
-      for row in self._cursor.fetchall():
+      with self._lock:
+        self._cursor.execute(self._HAS_TABLE_QUERY)
+        rows = self._cursor.fetchall()
+
+      for row in rows:
         if not row[0]:
           continue
 
@@ -169,6 +210,72 @@ class SQLiteDatabaseFile(object):
     table_name = table_name.lower()
     return table_name in self._table_names
 
+  def HasRowIdentifier(self, table_name):
+    """Determines if the rows of a specific table have a row identifier.
+
+    The rows of a table declared "WITHOUT ROWID" do not have a row identifier
+    (rowid). A column named "_rowid_" hides the row identifier.
+
+    Args:
+      table_name (str): name of the table.
+
+    Returns:
+      bool: True if the rows have a row identifier.
+
+    Raises:
+      IOError: if the database file is not opened.
+      OSError: if the database file is not opened.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    table_name = table_name.lower()
+    has_row_identifier = self._row_identifier_per_table.get(table_name, None)
+    if has_row_identifier is None:
+      has_row_identifier = not self.HasColumn(table_name, '_rowid_')
+      if has_row_identifier:
+        try:
+          with self._lock:
+            self._cursor.execute(
+                self._HAS_ROW_IDENTIFIER_QUERY.format(table_name))
+        except sqlite3.OperationalError:
+          has_row_identifier = False
+
+      self._row_identifier_per_table[table_name] = has_row_identifier
+
+    return has_row_identifier
+
+  def OpenBlob(self, table_name, column_name, row_identifier):
+    """Opens a blob for incremental I/O.
+
+    Args:
+      table_name (str): name of the table.
+      column_name (str): name of the column.
+      row_identifier (int): row identifier (rowid) of the row that contains
+          the blob.
+
+    Returns:
+      sqlite3.Blob: blob or None if incremental blob I/O is not supported.
+
+    Raises:
+      IOError: if the database file is not opened or the blob cannot be
+          opened.
+      OSError: if the database file is not opened or the blob cannot be
+          opened.
+    """
+    if not self._connection:
+      raise IOError('Not opened.')
+
+    # Incremental blob I/O is supported as of Python 3.11.
+    blob_open = getattr(self._connection, 'blobopen', None)
+    if not blob_open:
+      return None
+
+    try:
+      return blob_open(table_name, column_name, row_identifier, readonly=True)
+    except sqlite3.Error as exception:
+      raise IOError('Unable to open blob with error: {0!s}'.format(exception))
+
   def Open(self, file_object):
     """Opens the database file object.
 
@@ -194,15 +301,22 @@ class SQLiteDatabaseFile(object):
       file_object.close()
       raise IOError('Unsupported SQLite database signature.')
 
-    with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-      self._temp_file_path = temp_file.name
-      while data:
-        temp_file.write(data)
-        data = file_object.read(self._COPY_BUFFER_SIZE)
-
-    self._connection = sqlite3.connect(self._temp_file_path)
-    self._connection.text_factory = bytes
-    self._cursor = self._connection.cursor()
+    try:
+      with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+        self._temp_file_path = temp_file.name
+        while data:
+          temp_file.write(data)
+          data = file_object.read(self._COPY_BUFFER_SIZE)
+
+      # The connection is shared by file-like objects of different threads.
+      self._connection = sqlite3.connect(
+          self._temp_file_path, check_same_thread=False)
+      self._connection.text_factory = bytes
+      self._cursor = self._connection.cursor()
+
+    except Exception:
+      self.Close()
+      raise
 
   def Query(self, query, parameters=None):
     """Queries the database file.
@@ -217,9 +331,11 @@ class SQLiteDatabaseFile(object):
     # TODO: catch Warning and return None.
     # Note that we cannot pass parameters as a keyword argument here.
     # A parameters value of None is not supported.
-    if parameters:
-      self._cursor.execute(query, parameters)
-    else:
-      self._cursor.execute(query)
-
-    return self._cursor.fetchall()
+    # The cursor is shared by file-like objects of different threads.
+    with self._lock:
+      if parameters:
+        self._cursor.execute(query, parameters)
+      else:
+        self._cursor.execute(query)
+
+      return self._cursor.fetchall()
@@ -3,27 +3,70 @@
 
 from __future__ import unicode_literals
 
+import collections
 import os
+
 import pytsk3
 
 
 class TSKFileSystemImage(pytsk3.Img_Info):
-  """Pytsk3 image object using a file-like object."""
+  """Pytsk3 image object using a file-like object.
+
+  libtsk issues many small and repeated reads of the same data, such as
+  the superblock, inode tables or MFT. Since reading from the file-like
+  object can be expensive, for example when it is a storage media image or
+  an encrypted stream, the data can be read in aligned blocks that are kept
+  in a least recently used (LRU) cache. The cache is disabled by default.
+  Blocks that are smaller than the block size, such as the last block of
+  the file-like object or reads beyond its end, are not cached.
+
+  Attributes:
+    number_of_cache_hits (int): number of blocks read from the cache.
+    number_of_cache_misses (int): number of blocks read from the file-like
+        object.
+  """
 
-  def __init__(self, file_object):
+  _DEFAULT_BLOCK_SIZE = 32 * 1024
+
+  def __init__(
+      self, file_object, block_size=None, maximum_number_of_cached_blocks=None):
     """Initializes an image object.
 
     Args:
       file_object (FileIO): file-like object.
+      block_size (Optional[int]): size of the cached blocks, where None
+          represents the default.
+      maximum_number_of_cached_blocks (Optional[int]): maximum number of
+          cached blocks, where None or 0 represents blocks are not cached.
 
     Raises:
-      ValueError: if the file-like object is invalid.
+      ValueError: if the file-like object, block size or maximum number of
+          cached blocks is invalid.
     """
     if not file_object:
       raise ValueError('Missing file-like object.')
 
+    if block_size is None:
+      block_size = self._DEFAULT_BLOCK_SIZE
+
+    if block_size <= 0:
+      raise ValueError('Invalid block size value: {0:d}.'.format(block_size))
+
+    if maximum_number_of_cached_blocks is None:
+      maximum_number_of_cached_blocks = 0
+
+    if maximum_number_of_cached_blocks < 0:
+      raise ValueError(
+          'Invalid maximum number of cached blocks value: {0:d}.'.format(
+              maximum_number_of_cached_blocks))
+
     # pytsk3.Img_Info does not let you set attributes after initialization.
+    self._block_size = block_size
+    self._cached_blocks = collections.OrderedDict()
     self._file_object = file_object
+    self._maximum_number_of_cached_blocks = maximum_number_of_cached_blocks
+    self.number_of_cache_hits = 0
+    self.number_of_cache_misses = 0
     # Using the old parent class invocation style otherwise some versions
     # of pylint complain also setting type to RAW or EXTERNAL to make sure
     # Img_Info does not do detection.
@@ -33,12 +76,82 @@ class TSKFileSystemImage(pytsk3.Img_Info):
     # string in Python 3. Hence the string is not prefixed.
     pytsk3.Img_Info.__init__(self, url='', type=tsk_img_type)
 
+  def _CacheBlock(self, block_number, block_data):
+    """Caches a block as the most recently used block.
+
+    Args:
+      block_number (int): number of the block.
+      block_data (bytes): block data.
+    """
+    if len(self._cached_blocks) >= self._maximum_number_of_cached_blocks:
+      self._cached_blocks.popitem(last=False)
+
+    self._cached_blocks[block_number] = block_data
+
+  def _ReadBlocks(self, first_block_number, last_block_number):
+    """Reads blocks from the cache or the file-like object.
+
+    Consecutive blocks that are not cached are read from the file-like object
+    at once.
+
+    Args:
+      first_block_number (int): number of the first block.
+      last_block_number (int): number of the last block.
+
+    Returns:
+      list[bytes]: data of the blocks, where the data of the last block of
+          the file-like object is smaller than the block size.
+    """
+    blocks = []
+    block_number = first_block_number
+    while block_number <= last_block_number:
+      block_data = self._cached_blocks.pop(block_number, None)
+      if block_data is not None:
+        self.number_of_cache_hits += 1
+
+        # Re-inserting the block marks it as the most recently used.
+        self._cached_blocks[block_number] = block_data
+        blocks.append(block_data)
+
+        block_number += 1
+        continue
+
+      end_block_number = block_number + 1
+      while (end_block_number <= last_block_number and
+             end_block_number not in self._cached_blocks):
+        end_block_number += 1
+
+      read_size = (end_block_number - block_number) * self._block_size
+      self._file_object.seek(block_number * self._block_size, os.SEEK_SET)
+      data = self._file_object.read(read_size)
+
+      for data_offset in range(0, len(data), self._block_size):
+        block_data = data[data_offset:data_offset + self._block_size]
+        self.number_of_cache_misses += 1
+
+        # A short block could change if the file-like object grows.
+        if len(block_data) == self._block_size:
+          self._CacheBlock(block_number, block_data)
+
+        blocks.append(block_data)
+        block_number += 1
+
+      if len(data) < read_size:
+        break
+
+    return blocks
+
+  def EmptyCache(self):
+    """Empties the block cache."""
+    self._cached_blocks = collections.OrderedDict()
+
   # Note: that the following functions do not follow the style guide
   # because they are part of the pytsk3.Img_Info object interface.
   # pylint: disable=invalid-name
 
   def close(self):
     """Closes the volume IO object."""
+    self._cached_blocks = collections.OrderedDict()
     self._file_object = None
 
   def read(self, offset, size):
@@ -51,8 +164,21 @@ class TSKFileSystemImage(pytsk3.Img_Info):
     Returns:
       bytes: data read.
     """
-    self._file_object.seek(offset, os.SEEK_SET)
-    return self._file_object.read(size)
+    if not self._maximum_number_of_cached_blocks:
+      self._file_object.seek(offset, os.SEEK_SET)
+      return self._file_object.read(size)
+
+    if size <= 0:
+      return b''
+
+    first_block_number, block_offset = divmod(offset, self._block_size)
+    last_block_number = (offset + size - 1) // self._block_size
+
+    blocks = self._ReadBlocks(first_block_number, last_block_number)
+    if len(blocks) == 1:
+      return blocks[0][block_offset:block_offset + size]
+
+    return b''.join(blocks)[block_offset:block_offset + size]
 
   def get_size(self):
     """Retrieves the size."""
@@ -6,83 +6,186 @@ from __future__ import unicode_literals
 import pytsk3
 
 
-def GetTSKVsPartByPathSpec(tsk_volume, path_spec):
-  """Retrieves the TSK volume system part object from the TSK volume object.
+class TSKPartitionTable(object):
+  """Table of the volume system parts of a TSK volume.
 
-  Args:
-    tsk_volume (pytsk3.Volume_Info): TSK volume information.
-    path_spec (PathSpec): path specification.
+  The table is built once from the TSK volume, since iterating the TSK volume
+  is expensive, and provides lookups of the volume system parts by part
+  index, location and start offset.
 
-  Returns:
-    tuple: contains:
-
-      pytsk3.TSK_VS_PART_INFO: TSK volume system part information or
-          None on error.
-      int: partition index or None if not available.
+  Attributes:
+    bytes_per_sector (int): number of bytes per sector.
   """
-  location = getattr(path_spec, 'location', None)
-  part_index = getattr(path_spec, 'part_index', None)
-  start_offset = getattr(path_spec, 'start_offset', None)
-  partition_index = None
-
-  if part_index is None:
-    if location is not None:
-      if location.startswith('/p'):
-        try:
-          partition_index = int(location[2:], 10) - 1
-        except ValueError:
-          pass
-
-      if partition_index is None or partition_index < 0:
-        location = None
-
-    if location is None and start_offset is None:
+
+  def __init__(self, tsk_volume):
+    """Initializes a partition table.
+
+    Args:
+      tsk_volume (pytsk3.Volume_Info): TSK volume information.
+    """
+    super(TSKPartitionTable, self).__init__()
+    self._locations = []
+    # The number of allocated volume system parts up to and including
+    # the volume system part, per part index.
+    self._numbers_of_allocated_parts = []
+    self._part_indexes_by_partition_index = {}
+    self._part_indexes_by_start_offset = {}
+    self._start_offsets = []
+
+    self.bytes_per_sector = TSKVolumeGetBytesPerSector(tsk_volume)
+
+    # pytsk3 does not handle the Volume_Info iterator correctly therefore
+    # the explicit cast to tuple is needed to prevent the iterator terminating
+    # too soon or looping forever.
+    self._tsk_vs_parts = tuple(tsk_volume)
+
+    number_of_allocated_parts = 0
+    for part_index, tsk_vs_part in enumerate(self._tsk_vs_parts):
+      location = None
+      if TSKVsPartIsAllocated(tsk_vs_part):
+        self._part_indexes_by_partition_index[number_of_allocated_parts] = (
+            part_index)
+        number_of_allocated_parts += 1
+        location = '/p{0:d}'.format(number_of_allocated_parts)
+
+      start_offset = TSKVsPartGetStartSector(tsk_vs_part)
+      if start_offset is not None:
+        start_offset *= self.bytes_per_sector
+        self._part_indexes_by_start_offset.setdefault(start_offset, part_index)
+
+      self._locations.append(location)
+      self._numbers_of_allocated_parts.append(number_of_allocated_parts)
+      self._start_offsets.append(start_offset)
+
+  @property
+  def number_of_parts(self):
+    """int: number of volume system parts."""
+    return len(self._tsk_vs_parts)
+
+  def GetLocation(self, part_index):
+    """Retrieves the location of a volume system part.
+
+    Args:
+      part_index (int): index of the volume system part.
+
+    Returns:
+      str: location, such as "/p1", or None if the volume system part is
+          not allocated.
+    """
+    return self._locations[part_index]
+
+  def GetStartOffset(self, part_index):
+    """Retrieves the start offset of a volume system part.
+
+    Args:
+      part_index (int): index of the volume system part.
+
+    Returns:
+      int: start offset, in bytes, or None if not available.
+    """
+    return self._start_offsets[part_index]
+
+  def GetTSKVsPart(self, part_index):
+    """Retrieves a volume system part.
+
+    Args:
+      part_index (int): index of the volume system part.
+
+    Returns:
+      pytsk3.TSK_VS_PART_INFO: TSK volume system part information.
+    """
+    return self._tsk_vs_parts[part_index]
+
+  def GetTSKVsPartByPathSpec(self, path_spec):
+    """Retrieves a volume system part by path specification.
+
+    The first volume system part that matches the part index or, if no part
+    index is specified, the location, or the start offset is returned.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      tuple: contains:
+
+        pytsk3.TSK_VS_PART_INFO: TSK volume system part information or
+            None on error.
+        int: partition index or None if not available.
+    """
+    location = getattr(path_spec, 'location', None)
+    part_index = getattr(path_spec, 'part_index', None)
+    start_offset = getattr(path_spec, 'start_offset', None)
+    partition_index = None
+
+    if part_index is None:
+      if location is not None:
+        if location.startswith('/p'):
+          try:
+            partition_index = int(location[2:], 10) - 1
+          except ValueError:
+            pass
+
+        if partition_index is None or partition_index < 0:
+          partition_index = None
+          location = None
+
+      if location is None and start_offset is None:
+        return None, None
+
+    elif part_index < 0 or part_index >= len(self._tsk_vs_parts):
       return None, None
 
-  bytes_per_sector = TSKVolumeGetBytesPerSector(tsk_volume)
-  current_part_index = 0
-  current_partition_index = 0
-  tsk_vs_part = None
+    part_indexes = []
+    if part_index is not None:
+      part_indexes.append(part_index)
+
+    location_part_index = None
+    if partition_index is not None:
+      location_part_index = self._part_indexes_by_partition_index.get(
+          partition_index, None)
+      if location_part_index is not None:
+        part_indexes.append(location_part_index)
 
-  # pytsk3 does not handle the Volume_Info iterator correctly therefore
-  # the explicit cast to list is needed to prevent the iterator terminating
-  # too soon or looping forever.
-  tsk_vs_part_list = list(tsk_volume)
-  number_of_tsk_vs_parts = len(tsk_vs_part_list)
+    if start_offset is not None:
+      start_offset_part_index = self._part_indexes_by_start_offset.get(
+          start_offset, None)
+      if start_offset_part_index is not None:
+        part_indexes.append(start_offset_part_index)
 
-  if number_of_tsk_vs_parts > 0:
-    if (part_index is not None and
-        (part_index < 0 or part_index >= number_of_tsk_vs_parts)):
+    if not part_indexes:
       return None, None
 
-    for tsk_vs_part in tsk_vs_part_list:
-      if TSKVsPartIsAllocated(tsk_vs_part):
-        if partition_index is not None:
-          if partition_index == current_partition_index:
-            break
-        current_partition_index += 1
+    matching_part_index = min(part_indexes)
+    tsk_vs_part = self._tsk_vs_parts[matching_part_index]
 
-      if part_index is not None and part_index == current_part_index:
-        break
+    if matching_part_index == location_part_index:
+      return tsk_vs_part, partition_index
 
-      if start_offset is not None:
-        start_sector = TSKVsPartGetStartSector(tsk_vs_part)
+    if not TSKVsPartIsAllocated(tsk_vs_part):
+      return tsk_vs_part, None
+
+    return tsk_vs_part, self._numbers_of_allocated_parts[matching_part_index]
 
-        if start_sector is not None:
-          start_sector *= bytes_per_sector
-          if start_sector == start_offset:
-            break
 
-      current_part_index += 1
+def GetTSKVsPartByPathSpec(tsk_volume, path_spec):
+  """Retrieves the TSK volume system part object from the TSK volume object.
 
-  # Note that here we cannot solely rely on testing if tsk_vs_part is set
-  # since the for loop will exit with tsk_vs_part set.
-  if tsk_vs_part is None or current_part_index >= number_of_tsk_vs_parts:
-    return None, None
+  Note that this function builds a partition table of the TSK volume on
+  every call, use TSKPartitionTable for repeated lookups.
 
-  if not TSKVsPartIsAllocated(tsk_vs_part):
-    current_partition_index = None
-  return tsk_vs_part, current_partition_index
+  Args:
+    tsk_volume (pytsk3.Volume_Info): TSK volume information.
+    path_spec (PathSpec): path specification.
+
+  Returns:
+    tuple: contains:
+
+      pytsk3.TSK_VS_PART_INFO: TSK volume system part information or
+          None on error.
+      int: partition index or None if not available.
+  """
+  partition_table = TSKPartitionTable(tsk_volume)
+  return partition_table.GetTSKVsPartByPathSpec(path_spec)
 
 
 def TSKVolumeGetBytesPerSector(tsk_volume):
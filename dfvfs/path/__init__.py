@@ -20,6 +20,7 @@ from dfvfs.path import os_path_spec
 from dfvfs.path import path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import raw_path_spec
+from dfvfs.path import read_ahead_path_spec
 from dfvfs.path import sqlite_blob_path_spec
 from dfvfs.path import tar_path_spec
 from dfvfs.path import tsk_path_spec
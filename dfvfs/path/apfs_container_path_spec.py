@@ -39,9 +39,12 @@ class APFSContainerPathSpec(path_spec.PathSpec):
     self.location = location
     self.volume_index = volume_index
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     string_parts = []
 
     if self.location is not None:
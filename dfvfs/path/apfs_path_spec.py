@@ -39,9 +39,12 @@ class APFSPathSpec(path_spec.PathSpec):
     self.identifier = identifier
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     string_parts = []
 
     if self.identifier is not None:
@@ -43,9 +43,12 @@ class BDEPathSpec(path_spec.PathSpec):
     self.recovery_password = recovery_password
     self.startup_key = startup_key
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     string_parts = []
 
     if self.password:
@@ -35,9 +35,12 @@ class CompressedStreamPathSpec(path_spec.PathSpec):
     super(CompressedStreamPathSpec, self).__init__(parent=parent, **kwargs)
     self.compression_method = compression_method
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     sub_comparable_string = (
         'compression_method: {0:s}').format(self.compression_method)
     return self._GetComparable(sub_comparable_string=sub_comparable_string)
@@ -38,9 +38,12 @@ class DataRangePathSpec(path_spec.PathSpec):
     self.range_offset = range_offset
     self.range_size = range_size
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     sub_comparable_string = (
         'range_offset: 0x{0:08x}, range_size: 0x{1:08x}').format(
             self.range_offset, self.range_size)
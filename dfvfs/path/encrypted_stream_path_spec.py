@@ -48,9 +48,12 @@ class EncryptedStreamPathSpec(path_spec.PathSpec):
     self.initialization_vector = initialization_vector
     self.key = key
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     string_parts = []
 
     if self.cipher_mode:
@@ -44,9 +44,12 @@ class FVDEPathSpec(path_spec.PathSpec):
     self.password = password
     self.recovery_password = recovery_password
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     string_parts = []
 
     if self.encrypted_root_plist:
@@ -29,8 +29,11 @@ class LocationPathSpec(path_spec.PathSpec):
     super(LocationPathSpec, self).__init__(parent=parent, **kwargs)
     self.location = location
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     sub_comparable_string = 'location: {0:s}'.format(self.location)
     return self._GetComparable(sub_comparable_string=sub_comparable_string)
@@ -34,9 +34,12 @@ class MountPathSpec(path_spec.PathSpec):
     super(MountPathSpec, self).__init__(parent=None, **kwargs)
     self.identifier = identifier
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     sub_comparable_string = 'identifier: {0:s}'.format(self.identifier)
     return self._GetComparable(sub_comparable_string=sub_comparable_string)
 
@@ -51,9 +51,12 @@ class NTFSPathSpec(path_spec.PathSpec):
     self.mft_attribute = mft_attribute
     self.mft_entry = mft_entry
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     string_parts = []
 
     if self.data_stream:
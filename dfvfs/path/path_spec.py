@@ -9,6 +9,10 @@ from dfvfs.lib import definitions
 class PathSpec(object):
   """Path specification interface.
 
+  A path specification can be frozen, after which it and its parents can no
+  longer be changed. The comparable and hash of a frozen path specification
+  are determined only once.
+
   Attributes:
     parent (PathSpec): parent path specification.
   """
@@ -34,6 +38,9 @@ class PathSpec(object):
           ', '.join(kwargs)))
 
     super(PathSpec, self).__init__()
+    self._comparable = None
+    self._hash = None
+    self._is_frozen = False
     self.parent = parent
 
     if not getattr(self, 'TYPE_INDICATOR', None):
@@ -45,7 +52,37 @@ class PathSpec(object):
 
   def __hash__(self):
     """Returns the hash of a path specification."""
-    return hash(self.comparable)
+    if not self._is_frozen:
+      return hash(self.comparable)
+
+    if self._hash is None:
+      object.__setattr__(self, '_hash', hash(self.comparable))
+    return self._hash
+
+  def __setattr__(self, name, value):
+    """Sets an attribute of the path specification.
+
+    Args:
+      name (str): name of the attribute.
+      value (object): value of the attribute.
+
+    Raises:
+      AttributeError: if the path specification is frozen.
+    """
+    if getattr(self, '_is_frozen', False):
+      raise AttributeError(
+          'Unable to set attribute: {0:s} of frozen path specification.'.format(
+              name))
+
+    super(PathSpec, self).__setattr__(name, value)
+
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
+    return self._GetComparable()
 
   def _GetComparable(self, sub_comparable_string=''):
     """Retrieves the comparable representation.
@@ -72,7 +109,13 @@ class PathSpec(object):
   @property
   def comparable(self):
     """str: comparable representation of the path specification."""
-    return self._GetComparable()
+    if not self._is_frozen:
+      return self._BuildComparable()
+
+    if self._comparable is None:
+      # Note that object.__setattr__ is used to bypass the frozen check.
+      object.__setattr__(self, '_comparable', self._BuildComparable())
+    return self._comparable
 
   @property
   def type_indicator(self):
@@ -88,7 +131,7 @@ class PathSpec(object):
     """
     path_spec_dict = {}
     for attribute_name, attribute_value in iter(self.__dict__.items()):
-      if attribute_value is None:
+      if attribute_value is None or attribute_name.startswith('_'):
         continue
 
       if attribute_name == 'parent':
@@ -98,6 +141,21 @@ class PathSpec(object):
 
     return path_spec_dict
 
+  def Freeze(self):
+    """Freezes the path specification and its parents.
+
+    A frozen path specification can no longer be changed, which allows its
+    comparable and hash to be cached.
+
+    Returns:
+      PathSpec: the path specification itself.
+    """
+    if self.parent:
+      self.parent.Freeze()
+
+    object.__setattr__(self, '_is_frozen', True)
+    return self
+
   def HasParent(self):
     """Determines if the path specification has a parent.
 
@@ -106,6 +164,14 @@ class PathSpec(object):
     """
     return self.parent is not None
 
+  def IsFrozen(self):
+    """Determines if the path specification is frozen.
+
+    Returns:
+      bool: True if the path specification is frozen.
+    """
+    return self._is_frozen
+
   def IsFileSystem(self):
     """Determines if the path specification is a file system.
 
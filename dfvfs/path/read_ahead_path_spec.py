@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""The read-ahead path specification implementation."""
+
+from __future__ import unicode_literals
+
+from dfvfs.lib import definitions
+from dfvfs.path import factory
+from dfvfs.path import path_spec
+
+
+class ReadAheadPathSpec(path_spec.PathSpec):
+  """Read-ahead path specification.
+
+  Attributes:
+    chunk_size (int): size of the chunks that are read ahead, where None
+        represents the default chunk size.
+    number_of_chunks (int): maximum number of chunks that are read ahead,
+        where None represents the default number of chunks.
+  """
+
+  TYPE_INDICATOR = definitions.TYPE_INDICATOR_READ_AHEAD
+
+  def __init__(
+      self, chunk_size=None, number_of_chunks=None, parent=None, **kwargs):
+    """Initializes a path specification.
+
+    Note that the read-ahead path specification must have a parent.
+
+    Args:
+      chunk_size (Optional[int]): size of the chunks that are read ahead,
+          where None represents the default chunk size.
+      number_of_chunks (Optional[int]): maximum number of chunks that are
+          read ahead, where None represents the default number of chunks.
+      parent (Optional[PathSpec]): parent path specification.
+
+    Raises:
+      ValueError: when parent is not set or the chunk size or number of
+          chunks is invalid.
+    """
+    if not parent:
+      raise ValueError('Missing parent value.')
+
+    if chunk_size is not None and chunk_size <= 0:
+      raise ValueError('Invalid chunk size: {0:d}.'.format(chunk_size))
+
+    if number_of_chunks is not None and number_of_chunks <= 0:
+      raise ValueError('Invalid number of chunks: {0:d}.'.format(
+          number_of_chunks))
+
+    super(ReadAheadPathSpec, self).__init__(parent=parent, **kwargs)
+    self.chunk_size = chunk_size
+    self.number_of_chunks = number_of_chunks
+
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
+    string_parts = []
+
+    if self.chunk_size is not None:
+      string_parts.append('chunk size: {0:d}'.format(self.chunk_size))
+    if self.number_of_chunks is not None:
+      string_parts.append('number of chunks: {0:d}'.format(
+          self.number_of_chunks))
+
+    return self._GetComparable(sub_comparable_string=', '.join(string_parts))
+
+
+factory.Factory.RegisterPathSpec(ReadAheadPathSpec)
@@ -59,9 +59,12 @@ class SQLiteBlobPathSpec(path_spec.PathSpec):
     self.row_index = row_index
     self.table_name = table_name
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     string_parts = []
 
     string_parts.append('table name: {0:s}'.format(self.table_name))
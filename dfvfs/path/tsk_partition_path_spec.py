@@ -43,9 +43,12 @@ class TSKPartitionPathSpec(path_spec.PathSpec):
     self.part_index = part_index
     self.start_offset = start_offset
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     string_parts = []
 
     if self.location is not None:
@@ -38,9 +38,12 @@ class VShadowPathSpec(path_spec.PathSpec):
     self.location = location
     self.store_index = store_index
 
-  @property
-  def comparable(self):
-    """str: comparable representation of the path specification."""
+  def _BuildComparable(self):
+    """Builds the comparable representation.
+
+    Returns:
+      str: comparable representation of the path specification.
+    """
     string_parts = []
 
     if self.location is not None:
@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import collections
+
 from dfvfs.lib import errors
 
 
@@ -45,7 +47,15 @@ class ObjectsCacheValue(object):
 
 
 class ObjectsCache(object):
-  """Resolver object cache."""
+  """Resolver object cache.
+
+  Besides the cache values by identifier, the cache maintains a reverse
+  index of the identifiers by VFS object identity, so that a cache value
+  can be looked up by its VFS object without iterating all cache values.
+
+  The cache also tracks the identifiers of dereferenced cache values in
+  least recently used order, so that they can be evicted.
+  """
 
   def __init__(self, maximum_number_of_cached_values):
     """Initializes the resolver objects cache object.
@@ -61,6 +71,8 @@ class ObjectsCache(object):
           'Invalid maximum number of cached objects value zero or less.')
 
     super(ObjectsCache, self).__init__()
+    self._dereferenced_identifiers = collections.OrderedDict()
+    self._identifiers_by_object = {}
     self._maximum_number_of_cached_values = maximum_number_of_cached_values
     self._values = {}
 
@@ -81,9 +93,11 @@ class ObjectsCache(object):
       raise KeyError('Object already cached for identifier: {0:s}'.format(
           identifier))
 
-    if len(self._values) == self._maximum_number_of_cached_values:
+    if self.IsFull():
       raise errors.CacheFullError('Maximum number of cached values reached.')
 
+    self._dereferenced_identifiers[identifier] = True
+    self._identifiers_by_object[id(vfs_object)] = identifier
     self._values[identifier] = ObjectsCacheValue(vfs_object)
 
   def Empty(self):
@@ -91,6 +105,8 @@ class ObjectsCache(object):
 
     This method ignores the cache value reference count.
     """
+    self._dereferenced_identifiers.clear()
+    self._identifiers_by_object.clear()
     self._values.clear()
 
   def GetCacheValue(self, identifier):
@@ -120,12 +136,25 @@ class ObjectsCache(object):
     Raises:
       RuntimeError: if the cache value is missing.
     """
-    for identifier, cache_value in iter(self._values.items()):
-      if not cache_value:
-        raise RuntimeError('Missing cache value.')
+    identifier = self._identifiers_by_object.get(id(vfs_object), None)
+    if identifier is None:
+      return None, None
+
+    cache_value = self._values.get(identifier, None)
+    if not cache_value:
+      raise RuntimeError('Missing cache value.')
+
+    return identifier, cache_value
+
+  def GetLeastRecentlyUsedDereferencedValue(self):
+    """Retrieves the least recently used dereferenced cache value.
 
-      if cache_value.vfs_object == vfs_object:
-        return identifier, cache_value
+    Returns:
+      tuple[str, ObjectsCacheValue]: identifier and cache value object or
+          (None, None) if there are no dereferenced cache values.
+    """
+    for identifier in self._dereferenced_identifiers:
+      return identifier, self._values[identifier]
 
     return None, None
 
@@ -168,6 +197,15 @@ class ObjectsCache(object):
           identifier))
 
     cache_value.IncrementReferenceCount()
+    self._dereferenced_identifiers.pop(identifier, None)
+
+  def IsFull(self):
+    """Determines if the maximum number of cached values is reached.
+
+    Returns:
+      bool: True if the maximum number of cached values is reached.
+    """
+    return len(self._values) >= self._maximum_number_of_cached_values
 
   def ReleaseObject(self, identifier):
     """Releases a cached object based on the identifier.
@@ -191,6 +229,8 @@ class ObjectsCache(object):
           identifier))
 
     cache_value.DecrementReferenceCount()
+    if cache_value.IsDereferenced():
+      self._dereferenced_identifiers[identifier] = True
 
   def RemoveObject(self, identifier):
     """Removes a cached object based on the identifier.
@@ -207,7 +247,12 @@ class ObjectsCache(object):
       raise KeyError('Missing cached object for identifier: {0:s}'.format(
           identifier))
 
-    del self._values[identifier]
+    cache_value = self._values.pop(identifier)
+    self._dereferenced_identifiers.pop(identifier, None)
+
+    object_identity = id(cache_value.vfs_object)
+    if self._identifiers_by_object.get(object_identity, None) == identifier:
+      del self._identifiers_by_object[object_identity]
 
   def SetMaximumNumberOfCachedValues(self, maximum_number_of_cached_values):
     """Sets the maximum number of cached values.
@@ -3,15 +3,35 @@
 
 from __future__ import unicode_literals
 
+import threading
+
+from dfvfs.lib import definitions
 from dfvfs.resolver import cache
 
 
 class Context(object):
-  """Resolver context."""
+  """Resolver context.
+
+  By default a file-like or file system object is removed from the context
+  when it is no longer referenced. If the LRU eviction policy is used,
+  dereferenced objects are kept open in the context, so that they can be
+  reused, until room is needed to cache another object. The least recently
+  used dereferenced object is then closed and removed from the context.
+
+  Dereferenced SQLite database objects, which hold a temporary copy of
+  the database, are always kept open in the context until room is needed
+  to cache another SQLite database object or the context is emptied.
+  """
+
+  _EVICTION_POLICIES = frozenset([
+      definitions.CACHE_EVICTION_POLICY_LRU])
+
+  _MAXIMUM_NUMBER_OF_SQLITE_DATABASES = 128
 
   def __init__(
       self, maximum_number_of_file_objects=128,
-      maximum_number_of_file_systems=16):
+      maximum_number_of_file_systems=16, eviction_policy=None,
+      memory_map_threshold=None, maximum_number_of_tsk_image_blocks=None):
     """Initializes the resolver context object.
 
     Args:
@@ -19,12 +39,95 @@ class Context(object):
           of file-like objects cached in the context.
       maximum_number_of_file_systems (Optional[int]): maximum number
           of file system objects cached in the context.
+      eviction_policy (Optional[str]): cache eviction policy, such as
+          CACHE_EVICTION_POLICY_LRU, where None represents dereferenced
+          objects are removed from the context immediately.
+      memory_map_threshold (Optional[int]): minimum size, in bytes, of
+          regular files opened by the operating system back-end to be
+          memory mapped, where None represents files are not memory mapped.
+      maximum_number_of_tsk_image_blocks (Optional[int]): maximum number of
+          32 KiB blocks cached per SleuthKit (TSK) image object, where None
+          represents blocks are not cached.
+
+    Raises:
+      ValueError: if the eviction policy, memory map threshold or maximum
+          number of TSK image blocks is not supported.
     """
+    if eviction_policy and eviction_policy not in self._EVICTION_POLICIES:
+      raise ValueError('Unsupported eviction policy: {0!s}.'.format(
+          eviction_policy))
+
+    if memory_map_threshold is not None and memory_map_threshold < 0:
+      raise ValueError('Invalid memory map threshold: {0:d}.'.format(
+          memory_map_threshold))
+
+    if (maximum_number_of_tsk_image_blocks is not None and
+        maximum_number_of_tsk_image_blocks < 0):
+      raise ValueError(
+          'Invalid maximum number of TSK image blocks: {0:d}.'.format(
+              maximum_number_of_tsk_image_blocks))
+
     super(Context, self).__init__()
+    self._eviction_policy = eviction_policy
+    self._evicted_file_object_identifiers = set()
+    self._evicted_file_system_identifiers = set()
     self._file_object_cache = cache.ObjectsCache(
         maximum_number_of_file_objects)
     self._file_system_cache = cache.ObjectsCache(
         maximum_number_of_file_systems)
+    self._maximum_number_of_tsk_image_blocks = (
+        maximum_number_of_tsk_image_blocks)
+    self._memory_map_threshold = memory_map_threshold
+    self._sqlite_database_cache = cache.ObjectsCache(
+        self._MAXIMUM_NUMBER_OF_SQLITE_DATABASES)
+
+  def _EvictFileObject(self, identifier, cache_value):
+    """Closes and removes a dereferenced file-like object.
+
+    Args:
+      identifier (str): VFS object identifier.
+      cache_value (ObjectsCacheValue): cache value of the file-like object.
+    """
+    # Closing the file-like object releases it, after which it is removed
+    # from the cache since it is marked as evicted.
+    self._evicted_file_object_identifiers.add(identifier)
+    self._file_object_cache.GrabObject(identifier)
+    cache_value.vfs_object.close()
+
+  def _EvictFileSystem(self, identifier, cache_value):
+    """Closes and removes a dereferenced file system object.
+
+    Args:
+      identifier (str): VFS object identifier.
+      cache_value (ObjectsCacheValue): cache value of the file system object.
+    """
+    # Closing the file system releases it, after which it is removed from
+    # the cache since it is marked as evicted.
+    self._evicted_file_system_identifiers.add(identifier)
+    self._file_system_cache.GrabObject(identifier)
+    cache_value.vfs_object.Close()
+
+  def _EvictSQLiteDatabase(self, identifier, cache_value):
+    """Closes and removes a dereferenced SQLite database object.
+
+    Args:
+      identifier (str): identifier of the SQLite database.
+      cache_value (ObjectsCacheValue): cache value of the SQLite database
+          object.
+    """
+    self._sqlite_database_cache.RemoveObject(identifier)
+    cache_value.vfs_object.Close()
+
+  def _GetFileObjectCacheIdentifier(self, path_spec):
+    """Determines the file-like object cache identifier for the path spec.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      str: identifier of the VFS object.
+    """
+    return path_spec.comparable
 
   def _GetFileSystemCacheIdentifier(self, path_spec):
     """Determines the file system cache identifier for the path specification.
@@ -42,29 +145,119 @@ class Context(object):
 
     return ''.join(string_parts)
 
+  def _GetSQLiteDatabaseCacheIdentifier(self, path_spec):
+    """Determines the SQLite database cache identifier for the path spec.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      str: identifier of the SQLite database.
+    """
+    return path_spec.comparable
+
   def CacheFileObject(self, path_spec, file_object):
     """Caches a file-like object based on a path specification.
 
+    If the cache is full and the context has an eviction policy, the least
+    recently used dereferenced file-like object is evicted first.
+
     Args:
       path_spec (PathSpec): path specification.
       file_object (FileIO): file-like object.
+
+    Raises:
+      CacheFullError: if the maximum number of cached file-like objects is
+          reached and no file-like object can be evicted.
     """
-    self._file_object_cache.CacheObject(path_spec.comparable, file_object)
+    if self._eviction_policy and self._file_object_cache.IsFull():
+      identifier, cache_value = (
+          self._file_object_cache.GetLeastRecentlyUsedDereferencedValue())
+      if cache_value:
+        self._EvictFileObject(identifier, cache_value)
+
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    self._file_object_cache.CacheObject(identifier, file_object)
 
   def CacheFileSystem(self, path_spec, file_system):
     """Caches a file system object based on a path specification.
 
+    If the cache is full and the context has an eviction policy, the least
+    recently used dereferenced file system object is evicted first.
+
     Args:
       path_spec (PathSpec): path specification.
       file_system (FileSystem): file system object.
+
+    Raises:
+      CacheFullError: if the maximum number of cached file system objects is
+          reached and no file system object can be evicted.
     """
+    if self._eviction_policy and self._file_system_cache.IsFull():
+      identifier, cache_value = (
+          self._file_system_cache.GetLeastRecentlyUsedDereferencedValue())
+      if cache_value:
+        self._EvictFileSystem(identifier, cache_value)
+
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
     self._file_system_cache.CacheObject(identifier, file_system)
 
+  def CacheSQLiteDatabase(self, path_spec, database_object):
+    """Caches a SQLite database object based on a path specification.
+
+    If the cache is full, the least recently used dereferenced SQLite
+    database object is evicted first.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+      database_object (SQLiteDatabaseFile): SQLite database object.
+
+    Raises:
+      CacheFullError: if the maximum number of cached SQLite database objects
+          is reached and no SQLite database object can be evicted.
+    """
+    if self._sqlite_database_cache.IsFull():
+      identifier, cache_value = (
+          self._sqlite_database_cache.GetLeastRecentlyUsedDereferencedValue())
+      if cache_value:
+        self._EvictSQLiteDatabase(identifier, cache_value)
+
+    identifier = self._GetSQLiteDatabaseCacheIdentifier(path_spec)
+    self._sqlite_database_cache.CacheObject(identifier, database_object)
+
   def Empty(self):
-    """Empties the caches."""
+    """Empties the caches.
+
+    The dereferenced objects that are kept open in the caches, such as
+    the SQLite database objects, are closed first.
+    """
+    if self._eviction_policy:
+      identifier, cache_value = (
+          self._file_object_cache.GetLeastRecentlyUsedDereferencedValue())
+      while cache_value:
+        self._EvictFileObject(identifier, cache_value)
+        identifier, cache_value = (
+            self._file_object_cache.GetLeastRecentlyUsedDereferencedValue())
+
+      identifier, cache_value = (
+          self._file_system_cache.GetLeastRecentlyUsedDereferencedValue())
+      while cache_value:
+        self._EvictFileSystem(identifier, cache_value)
+        identifier, cache_value = (
+            self._file_system_cache.GetLeastRecentlyUsedDereferencedValue())
+
+    identifier, cache_value = (
+        self._sqlite_database_cache.GetLeastRecentlyUsedDereferencedValue())
+    while cache_value:
+      self._EvictSQLiteDatabase(identifier, cache_value)
+      identifier, cache_value = (
+          self._sqlite_database_cache.GetLeastRecentlyUsedDereferencedValue())
+
+    self._evicted_file_object_identifiers.clear()
+    self._evicted_file_system_identifiers.clear()
     self._file_object_cache.Empty()
     self._file_system_cache.Empty()
+    self._sqlite_database_cache.Empty()
 
   def ForceRemoveFileObject(self, path_spec):
     """Forces the removal of a file-like object based on a path specification.
@@ -75,13 +268,17 @@ class Context(object):
     Returns:
       bool: True if the file-like object was cached.
     """
-    cache_value = self._file_object_cache.GetCacheValue(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    cache_value = self._file_object_cache.GetCacheValue(identifier)
     if not cache_value:
       return False
 
     while not cache_value.IsDereferenced():
       cache_value.vfs_object.close()
 
+    if self._file_object_cache.GetCacheValue(identifier):
+      self._EvictFileObject(identifier, cache_value)
+
     return True
 
   def GetFileObject(self, path_spec):
@@ -93,7 +290,8 @@ class Context(object):
     Returns:
       FileIO: a file-like object or None if not cached.
     """
-    return self._file_object_cache.GetObject(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    return self._file_object_cache.GetObject(identifier)
 
   def GetFileObjectReferenceCount(self, path_spec):
     """Retrieves the reference count of a cached file-like object.
@@ -105,7 +303,8 @@ class Context(object):
       int: reference count or None if there is no file-like object for
           the corresponding path specification cached.
     """
-    cache_value = self._file_object_cache.GetCacheValue(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    cache_value = self._file_object_cache.GetCacheValue(identifier)
     if not cache_value:
       return None
 
@@ -140,13 +339,45 @@ class Context(object):
 
     return cache_value.reference_count
 
+  def GetMaximumNumberOfTSKImageBlocks(self):
+    """Retrieves the maximum number of blocks cached per TSK image object.
+
+    Returns:
+      int: maximum number of 32 KiB blocks cached per SleuthKit (TSK) image
+          object or None if blocks are not cached.
+    """
+    return self._maximum_number_of_tsk_image_blocks
+
+  def GetMemoryMapThreshold(self):
+    """Retrieves the memory map threshold.
+
+    Returns:
+      int: minimum size, in bytes, of regular files opened by the operating
+          system back-end to be memory mapped or None if files are not
+          memory mapped.
+    """
+    return self._memory_map_threshold
+
+  def GetSQLiteDatabase(self, path_spec):
+    """Retrieves a SQLite database object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      SQLiteDatabaseFile: SQLite database object or None if not cached.
+    """
+    identifier = self._GetSQLiteDatabaseCacheIdentifier(path_spec)
+    return self._sqlite_database_cache.GetObject(identifier)
+
   def GrabFileObject(self, path_spec):
     """Grabs a cached file-like object defined by path specification.
 
     Args:
       path_spec (PathSpec): path specification.
     """
-    self._file_object_cache.GrabObject(path_spec.comparable)
+    identifier = self._GetFileObjectCacheIdentifier(path_spec)
+    self._file_object_cache.GrabObject(identifier)
 
   def GrabFileSystem(self, path_spec):
     """Grabs a cached file system object defined by path specification.
@@ -157,12 +388,24 @@ class Context(object):
     identifier = self._GetFileSystemCacheIdentifier(path_spec)
     self._file_system_cache.GrabObject(identifier)
 
+  def GrabSQLiteDatabase(self, path_spec):
+    """Grabs a cached SQLite database object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+    """
+    identifier = self._GetSQLiteDatabaseCacheIdentifier(path_spec)
+    self._sqlite_database_cache.GrabObject(identifier)
+
   def ReleaseFileObject(self, file_object):
     """Releases a cached file-like object.
 
     Args:
       file_object (FileIO): file-like object.
 
+    If the context has an eviction policy, a dereferenced file-like object
+    is kept open in the cache until it is evicted.
+
     Returns:
       bool: True if the file-like object can be closed.
 
@@ -182,11 +425,16 @@ class Context(object):
 
     self._file_object_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
-    if result:
-      self._file_object_cache.RemoveObject(identifier)
+    if not cache_value.IsDereferenced():
+      return False
+
+    if (self._eviction_policy and
+        identifier not in self._evicted_file_object_identifiers):
+      return False
 
-    return result
+    self._evicted_file_object_identifiers.discard(identifier)
+    self._file_object_cache.RemoveObject(identifier)
+    return True
 
   def ReleaseFileSystem(self, file_system):
     """Releases a cached file system object.
@@ -194,6 +442,9 @@ class Context(object):
     Args:
       file_system (FileSystem): file system object.
 
+    If the context has an eviction policy, a dereferenced file system object
+    is kept open in the cache until it is evicted.
+
     Returns:
       bool: True if the file system object can be closed.
 
@@ -213,11 +464,41 @@ class Context(object):
 
     self._file_system_cache.ReleaseObject(identifier)
 
-    result = cache_value.IsDereferenced()
-    if result:
-      self._file_system_cache.RemoveObject(identifier)
+    if not cache_value.IsDereferenced():
+      return False
 
-    return result
+    if (self._eviction_policy and
+        identifier not in self._evicted_file_system_identifiers):
+      return False
+
+    self._evicted_file_system_identifiers.discard(identifier)
+    self._file_system_cache.RemoveObject(identifier)
+    return True
+
+  def ReleaseSQLiteDatabase(self, database_object):
+    """Releases a cached SQLite database object.
+
+    A dereferenced SQLite database object is kept open in the cache, so that
+    its temporary copy can be reused, until it is evicted or the context is
+    emptied.
+
+    Args:
+      database_object (SQLiteDatabaseFile): SQLite database object.
+
+    Raises:
+      RuntimeError: if the SQLite database object is not cached or an
+          inconsistency is detected in the cache.
+    """
+    identifier, cache_value = (
+        self._sqlite_database_cache.GetCacheValueByObject(database_object))
+
+    if not identifier:
+      raise RuntimeError('Object not cached.')
+
+    if not cache_value:
+      raise RuntimeError('Invalid cache value.')
+
+    self._sqlite_database_cache.ReleaseObject(identifier)
 
   def SetMaximumNumberOfFileObjects(self, maximum_number_of_file_objects):
     """Sets the maximum number of cached file-like objects.
@@ -238,3 +519,307 @@ class Context(object):
     """
     self._file_system_cache.SetMaximumNumberOfCachedValues(
         maximum_number_of_file_systems)
+
+
+class ThreadSafeContext(Context):
+  """Thread-safe resolver context.
+
+  The caches are shared by all threads and protected by a lock. The cached
+  file-like and file system objects are per thread, since the objects keep
+  state, such as the current offset, and most back-ends, such as pytsk3 and
+  pyewf, are not reentrant. A thread therefore opens its own objects, which
+  can be released by any thread. SQLite database objects do not keep such
+  state and are shared by all threads.
+  """
+
+  def __init__(
+      self, maximum_number_of_file_objects=128,
+      maximum_number_of_file_systems=16, eviction_policy=None,
+      memory_map_threshold=None, maximum_number_of_tsk_image_blocks=None):
+    """Initializes the thread-safe resolver context object.
+
+    Args:
+      maximum_number_of_file_objects (Optional[int]): maximum number
+          of file-like objects cached in the context.
+      maximum_number_of_file_systems (Optional[int]): maximum number
+          of file system objects cached in the context.
+      eviction_policy (Optional[str]): cache eviction policy, such as
+          CACHE_EVICTION_POLICY_LRU, where None represents dereferenced
+          objects are removed from the context immediately.
+      memory_map_threshold (Optional[int]): minimum size, in bytes, of
+          regular files opened by the operating system back-end to be
+          memory mapped, where None represents files are not memory mapped.
+      maximum_number_of_tsk_image_blocks (Optional[int]): maximum number of
+          32 KiB blocks cached per SleuthKit (TSK) image object, where None
+          represents blocks are not cached.
+
+    Raises:
+      ValueError: if the eviction policy, memory map threshold or maximum
+          number of TSK image blocks is not supported.
+    """
+    super(ThreadSafeContext, self).__init__(
+        maximum_number_of_file_objects=maximum_number_of_file_objects,
+        maximum_number_of_file_systems=maximum_number_of_file_systems,
+        eviction_policy=eviction_policy,
+        memory_map_threshold=memory_map_threshold,
+        maximum_number_of_tsk_image_blocks=maximum_number_of_tsk_image_blocks)
+    # Note that a reentrant lock is used since closing an evicted object
+    # releases it in the same thread.
+    self._lock = threading.RLock()
+
+  def _GetThreadIdentifier(self):
+    """Determines the identifier of the current thread.
+
+    Returns:
+      str: identifier of the current thread.
+    """
+    return 'thread: {0:d}\n'.format(threading.current_thread().ident)
+
+  def _GetFileObjectCacheIdentifier(self, path_spec):
+    """Determines the file-like object cache identifier for the path spec.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      str: identifier of the VFS object.
+    """
+    return ''.join([
+        self._GetThreadIdentifier(),
+        super(ThreadSafeContext, self)._GetFileObjectCacheIdentifier(
+            path_spec)])
+
+  def _GetFileSystemCacheIdentifier(self, path_spec):
+    """Determines the file system cache identifier for the path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      str: identifier of the VFS object.
+    """
+    return ''.join([
+        self._GetThreadIdentifier(),
+        super(ThreadSafeContext, self)._GetFileSystemCacheIdentifier(
+            path_spec)])
+
+  def CacheFileObject(self, path_spec, file_object):
+    """Caches a file-like object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      file_object (FileIO): file-like object.
+
+    Raises:
+      CacheFullError: if the maximum number of cached file-like objects is
+          reached and no file-like object can be evicted.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).CacheFileObject(path_spec, file_object)
+
+  def CacheFileSystem(self, path_spec, file_system):
+    """Caches a file system object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      file_system (FileSystem): file system object.
+
+    Raises:
+      CacheFullError: if the maximum number of cached file system objects is
+          reached and no file system object can be evicted.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).CacheFileSystem(path_spec, file_system)
+
+  def CacheSQLiteDatabase(self, path_spec, database_object):
+    """Caches a SQLite database object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+      database_object (SQLiteDatabaseFile): SQLite database object.
+
+    Raises:
+      CacheFullError: if the maximum number of cached SQLite database objects
+          is reached.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).CacheSQLiteDatabase(
+          path_spec, database_object)
+
+  def Empty(self):
+    """Empties the caches."""
+    with self._lock:
+      super(ThreadSafeContext, self).Empty()
+
+  def ForceRemoveFileObject(self, path_spec):
+    """Forces the removal of a file-like object based on a path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      bool: True if the file-like object was cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).ForceRemoveFileObject(path_spec)
+
+  def GetFileObject(self, path_spec):
+    """Retrieves a file-like object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileIO: a file-like object or None if not cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetFileObject(path_spec)
+
+  def GetFileObjectReferenceCount(self, path_spec):
+    """Retrieves the reference count of a cached file-like object.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      int: reference count or None if there is no file-like object for
+          the corresponding path specification cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetFileObjectReferenceCount(
+          path_spec)
+
+  def GetFileSystem(self, path_spec):
+    """Retrieves a file system object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      FileSystem: a file system object or None if not cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetFileSystem(path_spec)
+
+  def GetFileSystemReferenceCount(self, path_spec):
+    """Retrieves the reference count of a cached file system object.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      int: reference count or None if there is no file system object for
+          the corresponding path specification cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetFileSystemReferenceCount(
+          path_spec)
+
+  def GetSQLiteDatabase(self, path_spec):
+    """Retrieves a SQLite database object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+
+    Returns:
+      SQLiteDatabaseFile: SQLite database object or None if not cached.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).GetSQLiteDatabase(path_spec)
+
+  def GrabFileObject(self, path_spec):
+    """Grabs a cached file-like object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).GrabFileObject(path_spec)
+
+  def GrabFileSystem(self, path_spec):
+    """Grabs a cached file system object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).GrabFileSystem(path_spec)
+
+  def GrabSQLiteDatabase(self, path_spec):
+    """Grabs a cached SQLite database object defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification of the database file.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).GrabSQLiteDatabase(path_spec)
+
+  def ReleaseFileObject(self, file_object):
+    """Releases a cached file-like object.
+
+    Args:
+      file_object (FileIO): file-like object.
+
+    Returns:
+      bool: True if the file-like object can be closed.
+
+    Raises:
+      PathSpecError: if the path specification is incorrect.
+      RuntimeError: if the file-like object is not cached or an inconsistency
+          is detected in the cache.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).ReleaseFileObject(file_object)
+
+  def ReleaseFileSystem(self, file_system):
+    """Releases a cached file system object.
+
+    Args:
+      file_system (FileSystem): file system object.
+
+    Returns:
+      bool: True if the file system object can be closed.
+
+    Raises:
+      PathSpecError: if the path specification is incorrect.
+      RuntimeError: if the file system object is not cached or an inconsistency
+          is detected in the cache.
+    """
+    with self._lock:
+      return super(ThreadSafeContext, self).ReleaseFileSystem(file_system)
+
+  def ReleaseSQLiteDatabase(self, database_object):
+    """Releases a cached SQLite database object.
+
+    Args:
+      database_object (SQLiteDatabaseFile): SQLite database object.
+
+    Raises:
+      RuntimeError: if the SQLite database object is not cached or an
+          inconsistency is detected in the cache.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).ReleaseSQLiteDatabase(
+          database_object)
+
+  def SetMaximumNumberOfFileObjects(self, maximum_number_of_file_objects):
+    """Sets the maximum number of cached file-like objects.
+
+    Args:
+      maximum_number_of_file_objects (int): maximum number of file-like
+          objects cached in the context.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).SetMaximumNumberOfFileObjects(
+          maximum_number_of_file_objects)
+
+  def SetMaximumNumberOfFileSystems(self, maximum_number_of_file_systems):
+    """Sets the maximum number of cached file system objects.
+
+    Args:
+      maximum_number_of_file_systems (int): maximum number of file system
+          objects cached in the context.
+    """
+    with self._lock:
+      super(ThreadSafeContext, self).SetMaximumNumberOfFileSystems(
+          maximum_number_of_file_systems)
@@ -3,12 +3,86 @@
 
 from __future__ import unicode_literals
 
+import importlib
+
+from dfvfs.lib import definitions
+
 
 class ResolverHelperManager(object):
   """Path specification resolver helper manager."""
 
+  # The names of the modules that register the resolver helpers per type
+  # indicator, used to import a resolver helper on first use.
+  _RESOLVER_HELPER_MODULES = {
+      definitions.TYPE_INDICATOR_APFS: (
+          'dfvfs.resolver_helpers.apfs_resolver_helper'),
+      definitions.TYPE_INDICATOR_APFS_CONTAINER: (
+          'dfvfs.resolver_helpers.apfs_container_resolver_helper'),
+      definitions.TYPE_INDICATOR_BDE: (
+          'dfvfs.resolver_helpers.bde_resolver_helper'),
+      definitions.TYPE_INDICATOR_COMPRESSED_STREAM: (
+          'dfvfs.resolver_helpers.compressed_stream_resolver_helper'),
+      definitions.TYPE_INDICATOR_CPIO: (
+          'dfvfs.resolver_helpers.cpio_resolver_helper'),
+      definitions.TYPE_INDICATOR_DATA_RANGE: (
+          'dfvfs.resolver_helpers.data_range_resolver_helper'),
+      definitions.TYPE_INDICATOR_ENCODED_STREAM: (
+          'dfvfs.resolver_helpers.encoded_stream_resolver_helper'),
+      definitions.TYPE_INDICATOR_ENCRYPTED_STREAM: (
+          'dfvfs.resolver_helpers.encrypted_stream_resolver_helper'),
+      definitions.TYPE_INDICATOR_EWF: (
+          'dfvfs.resolver_helpers.ewf_resolver_helper'),
+      definitions.TYPE_INDICATOR_FAKE: (
+          'dfvfs.resolver_helpers.fake_resolver_helper'),
+      definitions.TYPE_INDICATOR_FVDE: (
+          'dfvfs.resolver_helpers.fvde_resolver_helper'),
+      definitions.TYPE_INDICATOR_GZIP: (
+          'dfvfs.resolver_helpers.gzip_resolver_helper'),
+      definitions.TYPE_INDICATOR_LVM: (
+          'dfvfs.resolver_helpers.lvm_resolver_helper'),
+      definitions.TYPE_INDICATOR_NTFS: (
+          'dfvfs.resolver_helpers.ntfs_resolver_helper'),
+      definitions.TYPE_INDICATOR_OS: (
+          'dfvfs.resolver_helpers.os_resolver_helper'),
+      definitions.TYPE_INDICATOR_QCOW: (
+          'dfvfs.resolver_helpers.qcow_resolver_helper'),
+      definitions.TYPE_INDICATOR_RAW: (
+          'dfvfs.resolver_helpers.raw_resolver_helper'),
+      definitions.TYPE_INDICATOR_READ_AHEAD: (
+          'dfvfs.resolver_helpers.read_ahead_resolver_helper'),
+      definitions.TYPE_INDICATOR_SQLITE_BLOB: (
+          'dfvfs.resolver_helpers.sqlite_blob_resolver_helper'),
+      definitions.TYPE_INDICATOR_TAR: (
+          'dfvfs.resolver_helpers.tar_resolver_helper'),
+      definitions.TYPE_INDICATOR_TSK: (
+          'dfvfs.resolver_helpers.tsk_resolver_helper'),
+      definitions.TYPE_INDICATOR_TSK_PARTITION: (
+          'dfvfs.resolver_helpers.tsk_partition_resolver_helper'),
+      definitions.TYPE_INDICATOR_VHDI: (
+          'dfvfs.resolver_helpers.vhdi_resolver_helper'),
+      definitions.TYPE_INDICATOR_VMDK: (
+          'dfvfs.resolver_helpers.vmdk_resolver_helper'),
+      definitions.TYPE_INDICATOR_VSHADOW: (
+          'dfvfs.resolver_helpers.vshadow_resolver_helper'),
+      definitions.TYPE_INDICATOR_ZIP: (
+          'dfvfs.resolver_helpers.zip_resolver_helper')}
+
   _resolver_helpers = {}
 
+  @classmethod
+  def _ImportHelperModule(cls, type_indicator):
+    """Imports the module that registers the resolver helper of a type.
+
+    Args:
+      type_indicator (str): type indicator.
+    """
+    module_name = cls._RESOLVER_HELPER_MODULES.get(type_indicator, None)
+    if module_name:
+      try:
+        importlib.import_module(module_name)
+      except ImportError:
+        pass
+
   @classmethod
   def DeregisterHelper(cls, resolver_helper):
     """Deregisters a path specification resolver helper.
@@ -31,6 +105,9 @@ class ResolverHelperManager(object):
   def GetHelper(cls, type_indicator):
     """Retrieves the path specification resolver helper for the specified type.
 
+    The module of a resolver helper that is not registered, for example in
+    lazy import mode, is imported on first use.
+
     Args:
       type_indicator (str): type indicator.
 
@@ -41,6 +118,9 @@ class ResolverHelperManager(object):
       KeyError: if resolver helper is not set for the corresponding type
           indicator.
     """
+    if type_indicator not in cls._resolver_helpers:
+      cls._ImportHelperModule(type_indicator)
+
     if type_indicator not in cls._resolver_helpers:
       raise KeyError(
           'Resolver helper not set for type indicator: {0:s}.'.format(
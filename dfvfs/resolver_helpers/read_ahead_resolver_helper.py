@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""The read-ahead path specification resolver helper implementation."""
+
+from __future__ import unicode_literals
+
+from dfvfs.file_io import read_ahead_io
+from dfvfs.lib import definitions
+from dfvfs.resolver_helpers import manager
+from dfvfs.resolver_helpers import resolver_helper
+
+
+class ReadAheadResolverHelper(resolver_helper.ResolverHelper):
+  """Read-ahead resolver helper."""
+
+  TYPE_INDICATOR = definitions.TYPE_INDICATOR_READ_AHEAD
+
+  def NewFileObject(self, resolver_context):
+    """Creates a new file-like object.
+
+    Args:
+      resolver_context (Context): resolver context.
+
+    Returns:
+      FileIO: file-like object.
+    """
+    return read_ahead_io.ReadAheadFile(resolver_context)
+
+
+manager.ResolverHelperManager.RegisterHelper(ReadAheadResolverHelper())
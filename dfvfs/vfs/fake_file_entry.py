@@ -79,6 +79,17 @@ class FakeFileEntry(file_entry.FileEntry):
       return None
     return FakeDirectory(self._file_system, self.path_spec)
 
+  def _GetNameIndex(self):
+    """Retrieves the name index of the sub file entries.
+
+    The name index is not cached since file entries can be added to the fake
+    file system while it is open.
+
+    Returns:
+      NameIndex: name index or None if not available.
+    """
+    return self._BuildNameIndex()
+
   def _GetStat(self):
     """Retrieves information about the file entry.
 
@@ -80,6 +80,52 @@ class Directory(object):
     return self._EntriesGenerator()
 
 
+class NameIndex(object):
+  """Index of the names of the entries of a directory.
+
+  The index maps the names, and the lower case names for case insensitive
+  lookups, to the path specifications of the directory entries. If multiple
+  entries have the same name, the first entry is indexed.
+  """
+
+  def __init__(self):
+    """Initializes a name index."""
+    super(NameIndex, self).__init__()
+    self._path_specs_by_lower_case_name = {}
+    self._path_specs_by_name = {}
+
+  @property
+  def number_of_names(self):
+    """int: number of names in the index."""
+    return len(self._path_specs_by_name)
+
+  def AddPathSpec(self, name, path_spec):
+    """Adds the path specification of a directory entry.
+
+    Args:
+      name (str): name of the directory entry.
+      path_spec (PathSpec): path specification of the directory entry.
+    """
+    self._path_specs_by_name.setdefault(name, path_spec)
+    self._path_specs_by_lower_case_name.setdefault(name.lower(), path_spec)
+
+  def GetPathSpecByName(self, name, case_sensitive=True):
+    """Retrieves the path specification of a directory entry by name.
+
+    Args:
+      name (str): name of the directory entry.
+      case_sensitive (Optional[bool]): True if the name is case sensitive.
+
+    Returns:
+      PathSpec: path specification of the directory entry or None if not
+          available.
+    """
+    path_spec = self._path_specs_by_name.get(name, None)
+    if path_spec is None and not case_sensitive:
+      path_spec = self._path_specs_by_lower_case_name.get(name.lower(), None)
+    return path_spec
+
+
 class FileEntry(object):
   """Virtual file entry interface.
 
@@ -241,6 +287,49 @@ class FileEntry(object):
 
     return stat_object
 
+  def _BuildNameIndex(self):
+    """Builds the name index of the sub file entries.
+
+    Returns:
+      NameIndex: name index or None if not available, for example if
+          the path specifications of the directory entries have no location.
+    """
+    if self._directory is None:
+      self._directory = self._GetDirectory()
+
+    if self._directory is None:
+      return None
+
+    name_index = NameIndex()
+    for path_spec in self._directory.entries:
+      location = getattr(path_spec, 'location', None)
+      if location is None:
+        return None
+
+      name = self._file_system.BasenamePath(location)
+      name_index.AddPathSpec(name, path_spec)
+
+    return name_index
+
+  def _GetNameIndex(self):
+    """Retrieves the name index of the sub file entries.
+
+    The name index is cached by the file system, since file entries are
+    typically short-lived objects. File entries of back-ends that can change
+    while the file system is open should build the name index per lookup
+    instead.
+
+    Returns:
+      NameIndex: name index or None if not available.
+    """
+    name_index = self._file_system.GetCachedNameIndex(self.path_spec)
+    if name_index is None:
+      name_index = self._BuildNameIndex()
+      if name_index is not None:
+        self._file_system.CacheNameIndex(self.path_spec, name_index)
+
+    return name_index
+
   @abc.abstractmethod
   def _GetSubFileEntries(self):
     """Retrieves sub file entries.
@@ -402,6 +491,16 @@ class FileEntry(object):
     Returns:
       FileEntry: a file entry or None if not available.
     """
+    # The name index prevents creating a file entry per sub file entry.
+    name_index = self._GetNameIndex()
+    if name_index is not None:
+      path_spec = name_index.GetPathSpecByName(
+          name, case_sensitive=case_sensitive)
+      if path_spec is None:
+        return None
+
+      return self._file_system.GetFileEntryByPathSpec(path_spec)
+
     name_lower = name.lower()
     matching_sub_file_entry = None
 
@@ -4,6 +4,7 @@
 from __future__ import unicode_literals
 
 import abc
+import collections
 
 
 class FileSystem(object):
@@ -16,6 +17,9 @@ class FileSystem(object):
   LOCATION_ROOT = '/'
   PATH_SEPARATOR = '/'
 
+  # The maximum number of names in the cached name indexes of directories.
+  _MAXIMUM_NUMBER_OF_CACHED_NAMES = 256 * 1024
+
   def __init__(self, resolver_context):
     """Initializes a file system.
 
@@ -29,6 +33,10 @@ class FileSystem(object):
     super(FileSystem, self).__init__()
     self._is_cached = False
     self._is_open = False
+    # The name indexes of directories per path specification comparable,
+    # in least recently used order.
+    self._name_indexes = collections.OrderedDict()
+    self._number_of_cached_names = 0
     self._path_spec = None
     self._resolver_context = resolver_context
 
@@ -79,6 +87,34 @@ class FileSystem(object):
     _, _, basename = path.rpartition(self.PATH_SEPARATOR)
     return basename
 
+  def CacheNameIndex(self, path_spec, name_index):
+    """Caches the name index of a directory.
+
+    The least recently used name indexes are removed from the cache when
+    the maximum number of cached names is exceeded. A name index that exceeds
+    the maximum number of cached names by itself is not cached.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+      name_index (NameIndex): name index of the directory.
+    """
+    if name_index.number_of_names > self._MAXIMUM_NUMBER_OF_CACHED_NAMES:
+      return
+
+    comparable = path_spec.comparable
+    cached_name_index = self._name_indexes.pop(comparable, None)
+    if cached_name_index is not None:
+      self._number_of_cached_names -= cached_name_index.number_of_names
+
+    while (self._name_indexes and (
+        self._number_of_cached_names + name_index.number_of_names >
+        self._MAXIMUM_NUMBER_OF_CACHED_NAMES)):
+      _, cached_name_index = self._name_indexes.popitem(last=False)
+      self._number_of_cached_names -= cached_name_index.number_of_names
+
+    self._name_indexes[comparable] = name_index
+    self._number_of_cached_names += name_index.number_of_names
+
   def Close(self):
     """Closes the file system.
 
@@ -100,6 +136,8 @@ class FileSystem(object):
     if close_file_system:
       self._Close()
       self._is_open = False
+      self._name_indexes = collections.OrderedDict()
+      self._number_of_cached_names = 0
       self._path_spec = None
 
   def DirnamePath(self, path):
@@ -132,6 +170,22 @@ class FileSystem(object):
       bool: True if the file entry exists.
     """
 
+  def GetCachedNameIndex(self, path_spec):
+    """Retrieves the cached name index of a directory.
+
+    Args:
+      path_spec (PathSpec): path specification of the directory.
+
+    Returns:
+      NameIndex: name index of the directory or None if not cached.
+    """
+    comparable = path_spec.comparable
+    name_index = self._name_indexes.pop(comparable, None)
+    if name_index is not None:
+      # Move the name index to the end to mark it as most recently used.
+      self._name_indexes[comparable] = name_index
+    return name_index
+
   def GetDataStreamByPathSpec(self, path_spec):
     """Retrieves a data stream for a path specification.
 
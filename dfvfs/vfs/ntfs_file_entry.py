@@ -538,6 +538,48 @@ class NTFSFileEntry(file_entry.FileEntry):
     return NTFSFileEntry(
         self._resolver_context, self._file_system, path_spec, is_root=is_root)
 
+  def GetSubFileEntryByName(self, name, case_sensitive=True):
+    """Retrieves a sub file entry by name.
+
+    The sub file entry is first looked up by location with pyfsntfs, which
+    prevents creating a file entry per sub file entry. If pyfsntfs does not
+    return a sub file entry with exactly the same name, since NTFS names are
+    case insensitive, the name index of the sub file entries is used instead.
+
+    Args:
+      name (str): name of the file entry.
+      case_sensitive (Optional[bool]): True if the name is case sensitive.
+
+    Returns:
+      NTFSFileEntry: a file entry or None if not available.
+    """
+    location = getattr(self.path_spec, 'location', None)
+    if (location is not None and name and name not in ('.', '..') and
+        self._file_system.PATH_SEPARATOR not in name):
+      sub_location = self._file_system.JoinPath([location, name])
+      sub_path_spec = ntfs_path_spec.NTFSPathSpec(
+          location=sub_location, parent=self.path_spec.parent)
+
+      try:
+        fsntfs_sub_file_entry = self._file_system.GetNTFSFileEntryByPathSpec(
+            sub_path_spec)
+      except IOError:
+        fsntfs_sub_file_entry = None
+
+      if fsntfs_sub_file_entry and fsntfs_sub_file_entry.name == name:
+        file_reference = fsntfs_sub_file_entry.file_reference
+        sub_path_spec = ntfs_path_spec.NTFSPathSpec(
+            location=sub_location,
+            mft_attribute=fsntfs_sub_file_entry.name_attribute_index,
+            mft_entry=file_reference & _FILE_REFERENCE_MFT_ENTRY_BITMASK,
+            parent=self.path_spec.parent)
+        return NTFSFileEntry(
+            self._resolver_context, self._file_system, sub_path_spec,
+            fsntfs_file_entry=fsntfs_sub_file_entry)
+
+    return super(NTFSFileEntry, self).GetSubFileEntryByName(
+        name, case_sensitive=case_sensitive)
+
   def GetSecurityDescriptor(self):
     """Retrieves the security descriptor.
 
@@ -31,6 +31,52 @@ class OSDirectory(file_entry.Directory):
     Yields:
       OSPathSpec: a path specification.
 
+    Raises:
+      AccessError: if the access to list the directory was denied.
+      BackEndError: if the directory could not be listed.
+    """
+    for path_spec, _ in self.GetDirectoryEntries():
+      yield path_spec
+
+  def _ListDirectory(self, location):
+    """Lists a directory.
+
+    Args:
+      location (str): location of the directory.
+
+    Yields:
+      tuple[str, os.DirEntry]: name of the directory entry and the directory
+          entry or None if os.scandir is not supported.
+
+    Raises:
+      OSError: if the directory could not be listed.
+    """
+    # os.scandir is not supported by Python 2.
+    scandir = getattr(os, 'scandir', None)
+    if not scandir:
+      for name in os.listdir(location):
+        yield name, None
+      return
+
+    scandir_iterator = scandir(location)
+    try:
+      for directory_entry in scandir_iterator:
+        yield directory_entry.name, directory_entry
+    finally:
+      if hasattr(scandir_iterator, 'close'):
+        scandir_iterator.close()
+
+  def GetDirectoryEntries(self):
+    """Retrieves directory entries and the corresponding os.DirEntry.
+
+    The os.DirEntry contains the type and stat information of the directory
+    entry retrieved when listing the directory, which prevents separate
+    system calls per directory entry.
+
+    Yields:
+      tuple[OSPathSpec, os.DirEntry]: path specification and directory entry
+          or None if os.scandir is not supported.
+
     Raises:
       AccessError: if the access to list the directory was denied.
       BackEndError: if the directory could not be listed.
@@ -42,10 +88,12 @@ class OSDirectory(file_entry.Directory):
       # function cannot be used since it will return true even when os.listdir()
       # fails.
       try:
-        for directory_entry in os.listdir(location):
+        for name, directory_entry in self._ListDirectory(location):
           directory_entry_location = self._file_system.JoinPath([
-              location, directory_entry])
-          yield os_path_spec.OSPathSpec(location=directory_entry_location)
+              location, name])
+          path_spec = os_path_spec.OSPathSpec(
+              location=directory_entry_location)
+          yield path_spec, directory_entry
 
       except OSError as exception:
         if exception.errno == errno.EACCES:
@@ -68,13 +116,19 @@ class OSFileEntry(file_entry.FileEntry):
 
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_OS
 
-  def __init__(self, resolver_context, file_system, path_spec, is_root=False):
+  def __init__(
+      self, resolver_context, file_system, path_spec, directory_entry=None,
+      is_root=False):
     """Initializes a file entry.
 
     Args:
       resolver_context (Context): resolver context.
       file_system (FileSystem): file system.
       path_spec (PathSpec): path specification.
+      directory_entry (Optional[os.DirEntry]): directory entry, as retrieved
+          by os.scandir, used to determine the type and, except on Windows,
+          the stat information of the file entry without additional system
+          calls.
       is_root (Optional[bool]): True if the file entry is the root file entry
           of the corresponding file system.
 
@@ -85,61 +139,146 @@ class OSFileEntry(file_entry.FileEntry):
     location = getattr(path_spec, 'location', None)
 
     # Windows does not support running os.stat on device files so we use
-    # libsmdev to do an initial check.
+    # libsmdev to do an initial check. Directory entries retrieved by
+    # os.scandir are not devices that require libsmdev.
     is_windows_device = False
-    if platform.system() == 'Windows' and location:
+    if (not directory_entry and platform.system() == 'Windows' and
+        location):
       try:
         # pylint: disable=no-member
         is_windows_device = pysmdev.check_device(location)
       except IOError:
         pass
 
-    stat_info = None
-    if not is_windows_device and location:
-      # We are only catching OSError. However on the Windows platform
-      # a WindowsError can be raised as well. We are not catching that since
-      # that error does not exist on non-Windows platforms.
-      try:
-        stat_info = os.lstat(location)
-      except OSError as exception:
-        raise errors.BackEndError(
-            'Unable to retrieve stat object with error: {0!s}'.format(
-                exception))
-
     super(OSFileEntry, self).__init__(
         resolver_context, file_system, path_spec, is_root=is_root,
         is_virtual=False)
+    self._directory_entry = directory_entry
     self._is_windows_device = is_windows_device
     self._name = None
-    self._stat_info = stat_info
+    self._stat_info = None
 
     if is_windows_device:
       self.entry_type = definitions.FILE_ENTRY_TYPE_DEVICE
 
-    elif stat_info:
-      # If location contains a trailing segment separator and points to
-      # a symbolic link to a directory stat info will not indicate
-      # the file entry as a symbolic link. The following check ensures
-      # that the LINK type is correctly detected.
-      is_link = os.path.islink(location)
-
-      # The stat info member st_mode can have multiple types e.g.
-      # LINK and DIRECTORY in case of a symbolic link to a directory
-      # dfVFS currently only supports one type so we need to check
-      # for LINK first.
-      if stat.S_ISLNK(stat_info.st_mode) or is_link:
-        self.entry_type = definitions.FILE_ENTRY_TYPE_LINK
-      elif stat.S_ISREG(stat_info.st_mode):
-        self.entry_type = definitions.FILE_ENTRY_TYPE_FILE
-      elif stat.S_ISDIR(stat_info.st_mode):
-        self.entry_type = definitions.FILE_ENTRY_TYPE_DIRECTORY
-      elif (stat.S_ISCHR(stat_info.st_mode) or
-            stat.S_ISBLK(stat_info.st_mode)):
-        self.entry_type = definitions.FILE_ENTRY_TYPE_DEVICE
-      elif stat.S_ISFIFO(stat_info.st_mode):
-        self.entry_type = definitions.FILE_ENTRY_TYPE_PIPE
-      elif stat.S_ISSOCK(stat_info.st_mode):
-        self.entry_type = definitions.FILE_ENTRY_TYPE_SOCKET
+    elif directory_entry:
+      self.entry_type = self._GetEntryTypeFromDirectoryEntry(directory_entry)
+
+    elif location:
+      self.entry_type = self._GetEntryTypeFromStatInfo(location)
+
+  def _GetEntryTypeFromDirectoryEntry(self, directory_entry):
+    """Determines the file entry type from a directory entry.
+
+    On most platforms the type of a directory entry is known from listing
+    the directory and the stat information is only retrieved for types
+    other than link, regular file and directory.
+
+    Args:
+      directory_entry (os.DirEntry): directory entry.
+
+    Returns:
+      str: file entry type or None if not available.
+
+    Raises:
+      BackEndError: if the stat information could not be retrieved.
+    """
+    try:
+      if directory_entry.is_symlink():
+        return definitions.FILE_ENTRY_TYPE_LINK
+      if directory_entry.is_file(follow_symlinks=False):
+        return definitions.FILE_ENTRY_TYPE_FILE
+      if directory_entry.is_dir(follow_symlinks=False):
+        return definitions.FILE_ENTRY_TYPE_DIRECTORY
+
+    except OSError as exception:
+      raise errors.BackEndError(
+          'Unable to determine type with error: {0!s}'.format(exception))
+
+    return self._GetEntryTypeFromStatMode(self._GetStatInfo().st_mode)
+
+  def _GetEntryTypeFromStatInfo(self, location):
+    """Determines the file entry type from the stat information.
+
+    Args:
+      location (str): location of the file entry.
+
+    Returns:
+      str: file entry type or None if not available.
+
+    Raises:
+      BackEndError: if the stat information could not be retrieved.
+    """
+    stat_info = self._GetStatInfo()
+
+    # If location contains a trailing segment separator and points to
+    # a symbolic link to a directory stat info will not indicate
+    # the file entry as a symbolic link. The following check ensures
+    # that the LINK type is correctly detected.
+    if os.path.islink(location):
+      return definitions.FILE_ENTRY_TYPE_LINK
+
+    return self._GetEntryTypeFromStatMode(stat_info.st_mode)
+
+  def _GetEntryTypeFromStatMode(self, st_mode):
+    """Determines the file entry type from the stat mode.
+
+    Args:
+      st_mode (int): stat mode.
+
+    Returns:
+      str: file entry type or None if not available.
+    """
+    # The stat info member st_mode can have multiple types e.g.
+    # LINK and DIRECTORY in case of a symbolic link to a directory
+    # dfVFS currently only supports one type so we need to check
+    # for LINK first.
+    if stat.S_ISLNK(st_mode):
+      return definitions.FILE_ENTRY_TYPE_LINK
+    if stat.S_ISREG(st_mode):
+      return definitions.FILE_ENTRY_TYPE_FILE
+    if stat.S_ISDIR(st_mode):
+      return definitions.FILE_ENTRY_TYPE_DIRECTORY
+    if stat.S_ISCHR(st_mode) or stat.S_ISBLK(st_mode):
+      return definitions.FILE_ENTRY_TYPE_DEVICE
+    if stat.S_ISFIFO(st_mode):
+      return definitions.FILE_ENTRY_TYPE_PIPE
+    if stat.S_ISSOCK(st_mode):
+      return definitions.FILE_ENTRY_TYPE_SOCKET
+    return None
+
+  def _GetStatInfo(self):
+    """Retrieves the stat information of the file entry.
+
+    The stat information of a directory entry is retrieved on first use.
+    On Windows the stat information of a directory entry does not contain
+    the inode number, device and number of links, hence os.lstat is used
+    instead.
+
+    Returns:
+      os.stat_result: stat information or None if not available.
+
+    Raises:
+      BackEndError: if the stat information could not be retrieved.
+    """
+    if self._stat_info is None and not self._is_windows_device:
+      # We are only catching OSError. However on the Windows platform
+      # a WindowsError can be raised as well. We are not catching that since
+      # that error does not exist on non-Windows platforms.
+      try:
+        if self._directory_entry and platform.system() != 'Windows':
+          self._stat_info = self._directory_entry.stat(follow_symlinks=False)
+        else:
+          location = getattr(self.path_spec, 'location', None)
+          if location:
+            self._stat_info = os.lstat(location)
+
+      except OSError as exception:
+        raise errors.BackEndError(
+            'Unable to retrieve stat object with error: {0!s}'.format(
+                exception))
+
+    return self._stat_info
 
   def _GetDirectory(self):
     """Retrieves a directory.
@@ -168,6 +307,17 @@ class OSFileEntry(file_entry.FileEntry):
 
     return self._link
 
+  def _GetNameIndex(self):
+    """Retrieves the name index of the sub file entries.
+
+    The name index is not cached since the operating system file system
+    can change while it is open.
+
+    Returns:
+      NameIndex: name index or None if not available.
+    """
+    return self._BuildNameIndex()
+
   def _GetStat(self):
     """Retrieves information about the file entry.
 
@@ -176,17 +326,18 @@ class OSFileEntry(file_entry.FileEntry):
     """
     stat_object = super(OSFileEntry, self)._GetStat()
 
-    if not self._is_windows_device:
+    stat_info = self._GetStatInfo()
+    if stat_info:
       # File data stat information.
-      stat_object.size = self._stat_info.st_size
+      stat_object.size = stat_info.st_size
 
       # Ownership and permissions stat information.
-      stat_object.mode = stat.S_IMODE(self._stat_info.st_mode)
-      stat_object.uid = self._stat_info.st_uid
-      stat_object.gid = self._stat_info.st_gid
+      stat_object.mode = stat.S_IMODE(stat_info.st_mode)
+      stat_object.uid = stat_info.st_uid
+      stat_object.gid = stat_info.st_gid
 
       # Other stat information.
-      stat_object.ino = self._stat_info.st_ino
+      stat_object.ino = stat_info.st_ino
       # stat_info.st_dev
       # stat_info.st_nlink
 
@@ -202,25 +353,29 @@ class OSFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
-      for path_spec in self._directory.entries:
-        yield OSFileEntry(self._resolver_context, self._file_system, path_spec)
+      for path_spec, directory_entry in self._directory.GetDirectoryEntries():
+        yield OSFileEntry(
+            self._resolver_context, self._file_system, path_spec,
+            directory_entry=directory_entry)
 
   @property
   def access_time(self):
     """dfdatetime.DateTimeValues: access time or None if not available."""
-    if self._stat_info is None:
+    stat_info = self._GetStatInfo()
+    if stat_info is None:
       return None
 
-    timestamp = int(self._stat_info.st_atime)
+    timestamp = int(stat_info.st_atime)
     return dfdatetime_posix_time.PosixTime(timestamp=timestamp)
 
   @property
   def change_time(self):
     """dfdatetime.DateTimeValues: change time or None if not available."""
-    if self._stat_info is None:
+    stat_info = self._GetStatInfo()
+    if stat_info is None:
       return None
 
-    timestamp = int(self._stat_info.st_ctime)
+    timestamp = int(stat_info.st_ctime)
     return dfdatetime_posix_time.PosixTime(timestamp=timestamp)
 
   @property
@@ -252,10 +407,11 @@ class OSFileEntry(file_entry.FileEntry):
   @property
   def modification_time(self):
     """dfdatetime.DateTimeValues: modification time or None if not available."""
-    if self._stat_info is None:
+    stat_info = self._GetStatInfo()
+    if stat_info is None:
       return None
 
-    timestamp = int(self._stat_info.st_mtime)
+    timestamp = int(stat_info.st_mtime)
     return dfdatetime_posix_time.PosixTime(timestamp=timestamp)
 
   def GetLinkedFileEntry(self):
@@ -27,50 +27,9 @@ class TARDirectory(file_entry.Directory):
     location = getattr(self.path_spec, 'location', None)
 
     if location and location.startswith(self._file_system.PATH_SEPARATOR):
-      # The TAR info name does not have the leading path separator as
-      # the location string does.
-      tar_path = location[1:]
-
-      # Set of top level sub directories that have been yielded.
-      processed_directories = set()
-
-      tar_file = self._file_system.GetTARFile()
-      for tar_info in iter(tar_file.getmembers()):
-        path = tar_info.name
-
-        # Determine if the start of the TAR info name is similar to
-        # the location string. If not the file TAR info refers to is not in
-        # the same directory.
-        if not path or not path.startswith(tar_path):
-          continue
-
-        # Ignore the directory itself.
-        if path == tar_path:
-          continue
-
-        path_segment, suffix = self._file_system.GetPathSegmentAndSuffix(
-            tar_path, path)
-        if not path_segment:
-          continue
-
-        # Sometimes the TAR file lacks directories, therefore we will
-        # provide virtual ones.
-        if suffix:
-          path_spec_location = self._file_system.JoinPath([
-              location, path_segment])
-          is_directory = True
-
-        else:
-          path_spec_location = self._file_system.JoinPath([path])
-          is_directory = tar_info.isdir()
-
-        if is_directory:
-          if path_spec_location in processed_directories:
-            continue
-          processed_directories.add(path_spec_location)
-
+      for sub_location in self._file_system.GetSubLocations(location):
         yield tar_path_spec.TARPathSpec(
-            location=path_spec_location, parent=self.path_spec.parent)
+            location=sub_location, parent=self.path_spec.parent)
 
 
 class TARFileEntry(file_entry.FileEntry):
@@ -178,21 +137,16 @@ class TARFileEntry(file_entry.FileEntry):
     Yields:
       TARFileEntry: a sub file entry.
     """
-    tar_file = self._file_system.GetTARFile()
-
     if self._directory is None:
       self._directory = self._GetDirectory()
 
-    if self._directory and tar_file:
+    if self._directory:
       for path_spec in self._directory.entries:
-        location = getattr(path_spec, 'location', None)
-        if location is None:
-          continue
-
         kwargs = {}
-        try:
-          kwargs['tar_info'] = tar_file.getmember(location[1:])
-        except KeyError:
+        tar_info = self._file_system.GetTARInfoByPathSpec(path_spec)
+        if tar_info:
+          kwargs['tar_info'] = tar_info
+        else:
           kwargs['is_virtual'] = True
 
         yield TARFileEntry(
@@ -256,20 +210,6 @@ class TARFileEntry(file_entry.FileEntry):
       PathSpecError: if the path specification is incorrect.
     """
     if not self._tar_info:
-      location = getattr(self.path_spec, 'location', None)
-      if location is None:
-        raise errors.PathSpecError('Path specification missing location.')
-
-      if not location.startswith(self._file_system.LOCATION_ROOT):
-        raise errors.PathSpecError('Invalid location in path specification.')
-
-      if len(location) == 1:
-        return None
-
-      tar_file = self._file_system.GetTARFile()
-      try:
-        self._tar_info = tar_file.getmember(location[1:])
-      except KeyError:
-        pass
+      self._tar_info = self._file_system.GetTARInfoByPathSpec(self.path_spec)
 
     return self._tar_info
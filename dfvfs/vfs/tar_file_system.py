@@ -7,6 +7,7 @@ import os
 import tarfile
 
 from dfvfs.lib import definitions
+from dfvfs.lib import directory_index
 from dfvfs.lib import errors
 from dfvfs.path import tar_path_spec
 from dfvfs.resolver import resolver
@@ -32,10 +33,38 @@ class TARFileSystem(file_system.FileSystem):
       encoding (Optional[str]): file entry name encoding.
     """
     super(TARFileSystem, self).__init__(resolver_context)
+    self._directory_index = None
     self._file_object = None
     self._tar_file = None
+    self._tar_info_by_location = {}
     self.encoding = encoding
 
+  def _BuildIndex(self):
+    """Builds the index of the TAR infos and directory entries.
+
+    TAR files can lack directories, hence the index also contains virtual
+    directories for the parents of all TAR infos.
+    """
+    tar_directory_index = directory_index.DirectoryIndex(
+        path_separator=self.PATH_SEPARATOR)
+    tar_info_by_location = {}
+
+    for tar_info in iter(self._tar_file.getmembers()):
+      path = tar_info.name
+      if not path:
+        continue
+
+      # The TAR info name does not have the leading path separator as
+      # the location string does. Note that the last TAR info with a specific
+      # name takes precedence, similar to tarfile.getmember().
+      tar_info_by_location[tar_directory_index.GetIndexLocation(
+          '{0:s}{1:s}'.format(self.LOCATION_ROOT, path))] = tar_info
+
+      tar_directory_index.AddPath(path)
+
+    self._directory_index = tar_directory_index
+    self._tar_info_by_location = tar_info_by_location
+
   def _Close(self):
     """Closes the file system.
 
@@ -45,6 +74,9 @@ class TARFileSystem(file_system.FileSystem):
     self._tar_file.close()
     self._tar_file = None
 
+    self._directory_index = None
+    self._tar_info_by_location = {}
+
     self._file_object.close()
     self._file_object = None
 
@@ -83,6 +115,8 @@ class TARFileSystem(file_system.FileSystem):
     self._file_object = file_object
     self._tar_file = tar_file
 
+    self._BuildIndex()
+
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
@@ -101,20 +135,10 @@ class TARFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return True
 
-    try:
-      self._tar_file.getmember(location[1:])
-      return True
-    except KeyError:
-      pass
-
-    # Check if location could be a virtual directory.
-    for name in iter(self._tar_file.getnames()):
-      # The TAR info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
-
-    return False
+    # Check if location is a TAR info or could be a virtual directory.
+    location = self._directory_index.GetIndexLocation(location)
+    return (location in self._tar_info_by_location or
+            self._directory_index.HasDirectory(location))
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -136,9 +160,11 @@ class TARFileSystem(file_system.FileSystem):
           is_virtual=True)
 
     kwargs = {}
-    try:
-      kwargs['tar_info'] = self._tar_file.getmember(location[1:])
-    except KeyError:
+    tar_info = self._tar_info_by_location.get(
+        self._directory_index.GetIndexLocation(location), None)
+    if tar_info:
+      kwargs['tar_info'] = tar_info
+    else:
       kwargs['is_virtual'] = True
 
     return tar_file_entry.TARFileEntry(
@@ -154,6 +180,18 @@ class TARFileSystem(file_system.FileSystem):
         location=self.LOCATION_ROOT, parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
 
+  def GetSubLocations(self, location):
+    """Retrieves the locations of the entries of a directory.
+
+    Args:
+      location (str): location of the directory.
+
+    Returns:
+      list[str]: locations of the directory entries, including virtual
+          directories.
+    """
+    return self._directory_index.GetSubLocations(location)
+
   def GetTARFile(self):
     """Retrieves the TAR file.
 
@@ -184,7 +222,5 @@ class TARFileSystem(file_system.FileSystem):
     if len(location) == 1:
       return None
 
-    try:
-      return self._tar_file.getmember(location[1:])
-    except KeyError:
-      pass
+    return self._tar_info_by_location.get(
+        self._directory_index.GetIndexLocation(location), None)
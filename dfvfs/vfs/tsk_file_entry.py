@@ -649,6 +649,49 @@ class TSKFileEntry(file_entry.FileEntry):
       for path_spec in self._directory.entries:
         yield TSKFileEntry(self._resolver_context, self._file_system, path_spec)
 
+  def _GetSubFileEntryInode(self, tsk_file, name):
+    """Retrieves the inode of a sub file entry opened by location.
+
+    Args:
+      tsk_file (pytsk3.File): TSK file of the sub file entry or None.
+      name (str): expected name of the sub file entry.
+
+    Returns:
+      int: inode of the sub file entry or None if the TSK file is not
+          an allocated sub file entry with the expected name.
+    """
+    tsk_file_info = getattr(tsk_file, 'info', None)
+    if tsk_file_info is None:
+      return None
+
+    tsk_file_name = getattr(tsk_file_info, 'name', None)
+    tsk_file_meta = getattr(tsk_file_info, 'meta', None)
+    if tsk_file_name is None or tsk_file_meta is None:
+      return None
+
+    flags = getattr(tsk_file_name, 'flags', 0)
+    if int(flags) & pytsk3.TSK_FS_NAME_FLAG_UNALLOC:
+      return None
+
+    try:
+      # pytsk3 returns an UTF-8 encoded byte string.
+      tsk_name = getattr(tsk_file_name, 'name', b'').decode('utf8')
+    except UnicodeError:
+      return None
+
+    if tsk_name != name:
+      return None
+
+    inode = getattr(tsk_file_meta, 'addr', None)
+    if inode == getattr(self.path_spec, 'inode', None):
+      return None
+
+    # On non-NTFS file systems inode 0 is ignored.
+    if inode == 0 and not self._file_system.IsNTFS():
+      return None
+
+    return inode
+
   def _GetTimeValue(self, name):
     """Retrieves a date and time value.
 
@@ -867,6 +910,46 @@ class TSKFileEntry(file_entry.FileEntry):
     return TSKFileEntry(
         self._resolver_context, self._file_system, path_spec, is_root=is_root)
 
+  def GetSubFileEntryByName(self, name, case_sensitive=True):
+    """Retrieves a sub file entry by name.
+
+    The sub file entry is first looked up by location with pytsk3, which
+    prevents creating a file entry per sub file entry. If pytsk3 does not
+    return an allocated sub file entry with exactly the same name, for
+    example on a case insensitive file system, the name index of the sub
+    file entries is used instead.
+
+    Args:
+      name (str): name of the file entry.
+      case_sensitive (Optional[bool]): True if the name is case sensitive.
+
+    Returns:
+      TSKFileEntry: a file entry or None if not available.
+    """
+    location = getattr(self.path_spec, 'location', None)
+    if (location is not None and name and name not in ('.', '..') and
+        self._file_system.PATH_SEPARATOR not in name):
+      sub_location = self._file_system.JoinPath([location, name])
+      sub_path_spec = tsk_path_spec.TSKPathSpec(
+          location=sub_location, parent=self.path_spec.parent)
+
+      try:
+        tsk_file = self._file_system.GetTSKFileByPathSpec(sub_path_spec)
+      except IOError:
+        tsk_file = None
+
+      sub_file_entry_inode = self._GetSubFileEntryInode(tsk_file, name)
+      if sub_file_entry_inode is not None:
+        sub_path_spec = tsk_path_spec.TSKPathSpec(
+            inode=sub_file_entry_inode, location=sub_location,
+            parent=self.path_spec.parent)
+        return TSKFileEntry(
+            self._resolver_context, self._file_system, sub_path_spec,
+            tsk_file=tsk_file)
+
+    return super(TSKFileEntry, self).GetSubFileEntryByName(
+        name, case_sensitive=case_sensitive)
+
   def GetTSKFile(self):
     """Retrieves the SleuthKit file object.
 
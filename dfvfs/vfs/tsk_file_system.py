@@ -31,6 +31,7 @@ class TSKFileSystem(file_system.FileSystem):
     self._file_object = None
     self._tsk_file_system = None
     self._tsk_fs_type = None
+    self._tsk_image_object = None
 
   def _Close(self):
     """Closes a file system.
@@ -39,6 +40,7 @@ class TSKFileSystem(file_system.FileSystem):
       IOError: if the close failed.
     """
     self._tsk_file_system = None
+    self._tsk_image_object = None
 
     self._file_object.close()
     self._file_object = None
@@ -64,7 +66,9 @@ class TSKFileSystem(file_system.FileSystem):
         path_spec.parent, resolver_context=self._resolver_context)
 
     try:
-      tsk_image_object = tsk_image.TSKFileSystemImage(file_object)
+      tsk_image_object = tsk_image.TSKFileSystemImage(
+          file_object, maximum_number_of_cached_blocks=(
+              self._resolver_context.GetMaximumNumberOfTSKImageBlocks()))
       tsk_file_system = pytsk3.FS_Info(tsk_image_object)
     except:
       file_object.close()
@@ -72,6 +76,7 @@ class TSKFileSystem(file_system.FileSystem):
 
     self._file_object = file_object
     self._tsk_file_system = tsk_file_system
+    self._tsk_image_object = tsk_image_object
 
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
@@ -223,6 +228,20 @@ class TSKFileSystem(file_system.FileSystem):
 
     return tsk_file
 
+  def GetTSKImageCacheStatistics(self):
+    """Retrieves the block cache statistics of the TSK image object.
+
+    Returns:
+      tuple[int, int]: number of blocks read from the cache and number of
+          blocks read from the file-like object.
+    """
+    if self._tsk_image_object is None:
+      return 0, 0
+
+    return (
+        self._tsk_image_object.number_of_cache_hits,
+        self._tsk_image_object.number_of_cache_misses)
+
   def IsHFS(self):
     """Determines if the file system is HFS, HFS+ or HFSX.
 
@@ -29,28 +29,20 @@ class TSKPartitionDirectory(file_entry.Directory):
     # Only the virtual root file has directory entries.
     if (part_index is None and start_offset is None and
         location is not None and location == self._file_system.LOCATION_ROOT):
-      tsk_volume = self._file_system.GetTSKVolume()
-      bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(tsk_volume)
-      part_index = 0
-      partition_index = 0
-
-      # pytsk3 does not handle the Volume_Info iterator correctly therefore
-      # the explicit list is needed to prevent the iterator terminating too
-      # soon or looping forever.
-      for tsk_vs_part in list(tsk_volume):
+      partition_table = self._file_system.GetTSKPartitionTable()
+
+      for part_index in range(partition_table.number_of_parts):
         kwargs = {}
 
-        if tsk_partition.TSKVsPartIsAllocated(tsk_vs_part):
-          partition_index += 1
-          kwargs['location'] = '/p{0:d}'.format(partition_index)
+        location = partition_table.GetLocation(part_index)
+        if location is not None:
+          kwargs['location'] = location
 
         kwargs['part_index'] = part_index
-        part_index += 1
-
-        start_sector = tsk_partition.TSKVsPartGetStartSector(tsk_vs_part)
 
-        if start_sector is not None:
-          kwargs['start_offset'] = start_sector * bytes_per_sector
+        start_offset = partition_table.GetStartOffset(part_index)
+        if start_offset is not None:
+          kwargs['start_offset'] = start_offset
 
         kwargs['parent'] = self.path_spec.parent
 
@@ -83,8 +75,8 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
     """
     tsk_volume = file_system.GetTSKVolume()
     if not is_virtual and tsk_vs_part is None:
-      tsk_vs_part, _ = tsk_partition.GetTSKVsPartByPathSpec(
-          tsk_volume, path_spec)
+      partition_table = file_system.GetTSKPartitionTable()
+      tsk_vs_part, _ = partition_table.GetTSKVsPartByPathSpec(path_spec)
     if not is_virtual and tsk_vs_part is None:
       raise errors.BackEndError(
           'Missing TSK volume system part in non-virtual file entry.')
@@ -119,8 +111,8 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
     """
     stat_object = super(TSKPartitionFileEntry, self)._GetStat()
 
-    bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(
-        self._tsk_volume)
+    partition_table = self._file_system.GetTSKPartitionTable()
+    bytes_per_sector = partition_table.bytes_per_sector
 
     # File data stat information.
     if self._tsk_vs_part is not None:
@@ -153,9 +145,12 @@ class TSKPartitionFileEntry(file_entry.FileEntry):
       self._directory = self._GetDirectory()
 
     if self._directory:
+      partition_table = self._file_system.GetTSKPartitionTable()
       for path_spec in self._directory.entries:
+        tsk_vs_part = partition_table.GetTSKVsPart(path_spec.part_index)
         yield TSKPartitionFileEntry(
-            self._resolver_context, self._file_system, path_spec)
+            self._resolver_context, self._file_system, path_spec,
+            tsk_vs_part=tsk_vs_part)
 
   @property
   def name(self):
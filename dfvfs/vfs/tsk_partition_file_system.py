@@ -29,6 +29,8 @@ class TSKPartitionFileSystem(file_system.FileSystem):
     """
     super(TSKPartitionFileSystem, self).__init__(resolver_context)
     self._file_object = None
+    self._partition_table = None
+    self._tsk_image_object = None
     self._tsk_volume = None
 
   def _Close(self):
@@ -37,6 +39,8 @@ class TSKPartitionFileSystem(file_system.FileSystem):
     Raises:
       IOError: if the close failed.
     """
+    self._partition_table = None
+    self._tsk_image_object = None
     self._tsk_volume = None
 
     self._file_object.close()
@@ -64,13 +68,18 @@ class TSKPartitionFileSystem(file_system.FileSystem):
         path_spec.parent, resolver_context=self._resolver_context)
 
     try:
-      tsk_image_object = tsk_image.TSKFileSystemImage(file_object)
+      tsk_image_object = tsk_image.TSKFileSystemImage(
+          file_object, maximum_number_of_cached_blocks=(
+              self._resolver_context.GetMaximumNumberOfTSKImageBlocks()))
       tsk_volume = pytsk3.Volume_Info(tsk_image_object)
+      partition_table = tsk_partition.TSKPartitionTable(tsk_volume)
     except:
       file_object.close()
       raise
 
     self._file_object = file_object
+    self._partition_table = partition_table
+    self._tsk_image_object = tsk_image_object
     self._tsk_volume = tsk_volume
 
   def FileEntryExistsByPathSpec(self, path_spec):
@@ -82,8 +91,7 @@ class TSKPartitionFileSystem(file_system.FileSystem):
     Returns:
       bool: True if the file entry exists or false otherwise.
     """
-    tsk_vs_part, _ = tsk_partition.GetTSKVsPartByPathSpec(
-        self._tsk_volume, path_spec)
+    tsk_vs_part, _ = self._partition_table.GetTSKVsPartByPathSpec(path_spec)
 
     # The virtual root file has not corresponding TSK volume system part object
     # but should have a location.
@@ -102,8 +110,8 @@ class TSKPartitionFileSystem(file_system.FileSystem):
     Returns:
       TSKPartitionFileEntry: a file entry or None of not available.
     """
-    tsk_vs_part, partition_index = tsk_partition.GetTSKVsPartByPathSpec(
-        self._tsk_volume, path_spec)
+    tsk_vs_part, partition_index = (
+        self._partition_table.GetTSKVsPartByPathSpec(path_spec))
 
     location = getattr(path_spec, 'location', None)
 
@@ -121,7 +129,7 @@ class TSKPartitionFileSystem(file_system.FileSystem):
       path_spec.location = '/p{0:d}'.format(partition_index)
 
     return tsk_partition_file_entry.TSKPartitionFileEntry(
-        self._resolver_context, self, path_spec)
+        self._resolver_context, self, path_spec, tsk_vs_part=tsk_vs_part)
 
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
@@ -133,6 +141,28 @@ class TSKPartitionFileSystem(file_system.FileSystem):
         location=self.LOCATION_ROOT, parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
 
+  def GetTSKPartitionTable(self):
+    """Retrieves the TSK partition table.
+
+    Returns:
+      TSKPartitionTable: a TSK partition table.
+    """
+    return self._partition_table
+
+  def GetTSKImageCacheStatistics(self):
+    """Retrieves the block cache statistics of the TSK image object.
+
+    Returns:
+      tuple[int, int]: number of blocks read from the cache and number of
+          blocks read from the file-like object.
+    """
+    if self._tsk_image_object is None:
+      return 0, 0
+
+    return (
+        self._tsk_image_object.number_of_cache_hits,
+        self._tsk_image_object.number_of_cache_misses)
+
   def GetTSKVolume(self):
     """Retrieves the TSK volume object.
 
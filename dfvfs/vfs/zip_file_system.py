@@ -6,7 +6,9 @@ from __future__ import unicode_literals
 import zipfile
 
 from dfvfs.lib import definitions
+from dfvfs.lib import directory_index
 from dfvfs.lib import errors
+from dfvfs.lib import py2to3
 from dfvfs.path import zip_path_spec
 from dfvfs.resolver import resolver
 from dfvfs.vfs import file_system
@@ -31,10 +33,37 @@ class ZipFileSystem(file_system.FileSystem):
       encoding (Optional[str]): encoding of the file entry name.
     """
     super(ZipFileSystem, self).__init__(resolver_context)
+    self._directory_index = None
     self._file_object = None
+    self._seek_points_by_header_offset = {}
     self._zip_file = None
     self.encoding = encoding
 
+  def _BuildIndex(self):
+    """Builds the index of the directory entries.
+
+    ZIP files can lack directories, hence the index also contains virtual
+    directories for the parents of all ZIP infos. Note that the locations
+    of directories have a trailing path separator.
+    """
+    zip_directory_index = directory_index.DirectoryIndex(
+        path_separator=self.PATH_SEPARATOR, mark_directories=True)
+
+    for zip_info in self._zip_file.infolist():
+      path = getattr(zip_info, 'filename', None)
+      if path is not None and not isinstance(path, py2to3.UNICODE_TYPE):
+        try:
+          path = path.decode(self.encoding)
+        except UnicodeDecodeError:
+          path = None
+
+      if not path:
+        continue
+
+      zip_directory_index.AddPath(path)
+
+    self._directory_index = zip_directory_index
+
   def _Close(self):
     """Closes the file system object.
 
@@ -44,6 +73,9 @@ class ZipFileSystem(file_system.FileSystem):
     self._zip_file.close()
     self._zip_file = None
 
+    self._directory_index = None
+    self._seek_points_by_header_offset = {}
+
     self._file_object.close()
     self._file_object = None
 
@@ -77,6 +109,8 @@ class ZipFileSystem(file_system.FileSystem):
     self._file_object = file_object
     self._zip_file = zip_file
 
+    self._BuildIndex()
+
   def FileEntryExistsByPathSpec(self, path_spec):
     """Determines if a file entry for a path specification exists.
 
@@ -102,13 +136,7 @@ class ZipFileSystem(file_system.FileSystem):
       pass
 
     # Check if location could be a virtual directory.
-    for name in iter(self._zip_file.namelist()):
-      # The ZIP info name does not have the leading path separator as
-      # the location string does.
-      if name.startswith(location[1:]):
-        return True
-
-    return False
+    return self._directory_index.HasDirectory(location)
 
   def GetFileEntryByPathSpec(self, path_spec):
     """Retrieves a file entry for a path specification.
@@ -148,6 +176,41 @@ class ZipFileSystem(file_system.FileSystem):
         location=self.LOCATION_ROOT, parent=self._path_spec.parent)
     return self.GetFileEntryByPathSpec(path_spec)
 
+  def GetSeekPoints(self, zip_info):
+    """Retrieves the seek points of a ZIP member.
+
+    The seek points are shared by the file-like objects of the ZIP member
+    while the file system is open. The seek points are stored by the offset
+    of the local file header of the member, since a ZIP file can contain
+    multiple members with the same name.
+
+    Args:
+      zip_info (zipfile.ZipInfo): ZIP info of the member.
+
+    Returns:
+      tuple[list[int], list[object]]: uncompressed data offsets of the seek
+          points and the corresponding seek points, sorted by offset.
+    """
+    seek_points = self._seek_points_by_header_offset.get(
+        zip_info.header_offset, None)
+    if seek_points is None:
+      seek_points = ([], [])
+      self._seek_points_by_header_offset[zip_info.header_offset] = seek_points
+
+    return seek_points
+
+  def GetSubLocations(self, location):
+    """Retrieves the locations of the entries of a directory.
+
+    Args:
+      location (str): location of the directory.
+
+    Returns:
+      list[str]: locations of the directory entries, including virtual
+          directories.
+    """
+    return self._directory_index.GetSubLocations(location)
+
   def GetZipFile(self):
     """Retrieves the ZIP file object.
 
@@ -67,8 +67,8 @@ class TSKVolumeSystem(volume_system.VolumeSystem):
   def _Parse(self):
     """Extracts sections and volumes from the volume system."""
     root_file_entry = self._file_system.GetRootFileEntry()
-    tsk_volume = self._file_system.GetTSKVolume()
-    self.bytes_per_sector = tsk_partition.TSKVolumeGetBytesPerSector(tsk_volume)
+    partition_table = self._file_system.GetTSKPartitionTable()
+    self.bytes_per_sector = partition_table.bytes_per_sector
 
     for sub_file_entry in root_file_entry.sub_file_entries:
       tsk_vs_part = sub_file_entry.GetTSKVsPart()
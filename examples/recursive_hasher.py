@@ -10,7 +10,6 @@ from __future__ import unicode_literals
 
 import abc
 import argparse
-import hashlib
 import logging
 import sys
 
@@ -19,6 +18,7 @@ from dfvfs.analyzer import fvde_analyzer_helper
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.lib import errors
 from dfvfs.helpers import command_line
+from dfvfs.helpers import hasher
 from dfvfs.helpers import volume_scanner
 from dfvfs.resolver import resolver
 
@@ -33,8 +33,19 @@ except KeyError:
 class RecursiveHasher(volume_scanner.VolumeScanner):
   """Recursively calculates message digest hashes of data streams."""
 
-  # Class constant that defines the default read buffer size.
-  _READ_BUFFER_SIZE = 32768
+  def __init__(self, mediator=None):
+    """Initializes a recursive hasher.
+
+    Args:
+      mediator (Optional[VolumeScannerMediator]): a volume scanner mediator.
+    """
+    super(RecursiveHasher, self).__init__(mediator=mediator)
+    self._data_stream_hasher = hasher.DataStreamHasher(hash_names=['sha256'])
+
+  @property
+  def statistics(self):
+    """dfvfs.HashingStatistics: hashing throughput statistics."""
+    return self._data_stream_hasher.statistics
 
   def _CalculateHashDataStream(self, file_entry, data_stream_name):
     """Calculates a message digest hash of the data of the file entry.
@@ -46,25 +57,9 @@ class RecursiveHasher(volume_scanner.VolumeScanner):
     Returns:
       bytes: digest hash or None.
     """
-    hash_context = hashlib.sha256()
-
-    try:
-      file_object = file_entry.GetFileObject(data_stream_name=data_stream_name)
-    except IOError as exception:
-      logging.warning((
-          'Unable to open path specification:\n{0:s}'
-          'with error: {1!s}').format(
-              file_entry.path_spec.comparable, exception))
-      return None
-
-    if not file_object:
-      return None
-
     try:
-      data = file_object.read(self._READ_BUFFER_SIZE)
-      while data:
-        hash_context.update(data)
-        data = file_object.read(self._READ_BUFFER_SIZE)
+      hashes = self._data_stream_hasher.HashDataStream(
+          file_entry, data_stream_name=data_stream_name)
     except IOError as exception:
       logging.warning((
           'Unable to read from path specification:\n{0:s}'
@@ -72,10 +67,10 @@ class RecursiveHasher(volume_scanner.VolumeScanner):
               file_entry.path_spec.comparable, exception))
       return None
 
-    finally:
-      file_object.close()
+    if not hashes:
+      return None
 
-    return hash_context.hexdigest()
+    return hashes['sha256']
 
   def _CalculateHashesFileEntry(
       self, file_system, file_entry, parent_full_path, output_writer):
@@ -322,6 +317,12 @@ def Main():
     print('')
     print('Completed.')
 
+    statistics = recursive_hasher.statistics
+    for type_indicator in statistics.type_indicators:
+      print('{0:s}: {1:d} data streams hashed at {2:.1f} MB/s'.format(
+          type_indicator, statistics.GetNumberOfDataStreams(type_indicator),
+          statistics.GetThroughput(type_indicator) or 0.0))
+
   except errors.ScannerError as exception:
     return_value = False
 
@@ -4,17 +4,24 @@
 
 from __future__ import unicode_literals
 
+import json
+import os
+import shutil
+import tempfile
 import unittest
 
 from dfvfs.analyzer import analyzer
 from dfvfs.analyzer import analyzer_helper
 from dfvfs.analyzer import specification
+from dfvfs.file_io import fake_file_io
 from dfvfs.lib import definitions
+from dfvfs.path import fake_path_spec
 from dfvfs.path import gzip_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.path import qcow_path_spec
 from dfvfs.path import tsk_partition_path_spec
 from dfvfs.path import vshadow_path_spec
+from dfvfs.resolver import context
 
 from tests import test_lib as shared_test_lib
 
@@ -43,6 +50,43 @@ class TestAnalyzerHelper(analyzer_helper.AnalyzerHelper):
     return
 
 
+class ScanDataFileObjectTest(shared_test_lib.BaseTestCase):
+  """Tests for the file-like object that caches scan data."""
+
+  # pylint: disable=protected-access
+
+  def testRead(self):
+    """Tests the read function."""
+    resolver_context = context.Context()
+    test_path_spec = fake_path_spec.FakePathSpec(location='/scan')
+    file_object = fake_file_io.FakeFile(
+        resolver_context, bytes(bytearray([i % 256 for i in range(4096)])))
+    file_object.open(path_spec=test_path_spec)
+
+    try:
+      scan_data_file_object = analyzer._ScanDataFileObject(file_object, 1024)
+      self.assertEqual(scan_data_file_object.get_size(), 4096)
+
+      scan_data_file_object.seek(0, os.SEEK_SET)
+      self.assertEqual(scan_data_file_object.read(4), b'\x00\x01\x02\x03')
+      self.assertEqual(scan_data_file_object.get_offset(), 4)
+
+      scan_data_file_object.seek(512, os.SEEK_SET)
+      self.assertEqual(scan_data_file_object.read(2), b'\x00\x01')
+
+      scan_data_file_object.seek(-8, os.SEEK_END)
+      self.assertEqual(scan_data_file_object.read(16), b'\xf8\xf9\xfa\xfb'
+                       b'\xfc\xfd\xfe\xff')
+
+      scan_data_file_object.seek(-4, os.SEEK_END)
+      self.assertEqual(scan_data_file_object.read(4), b'\xfc\xfd\xfe\xff')
+
+      self.assertEqual(scan_data_file_object.number_of_reads, 2)
+
+    finally:
+      file_object.close()
+
+
 class AnalyzerTest(shared_test_lib.BaseTestCase):
   """Format analyzer tests."""
 
@@ -215,6 +259,119 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         path_spec)
     self.assertEqual(type_indicators, expected_type_indicators)
 
+  def testGetTypeIndicatorsByFormatCategory(self):
+    """Tests the GetTypeIndicatorsByFormatCategory function."""
+    test_file = self._GetTestFilePath(['tsk_volume_system.raw'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    format_categories = [
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE,
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM]
+
+    # Note that the TSK file system signature matches the MBR.
+    expected_type_indicators = {
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM: [
+            definitions.TYPE_INDICATOR_TSK],
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [],
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: [
+            definitions.TYPE_INDICATOR_TSK_PARTITION]}
+    type_indicators = analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(
+        path_spec, format_categories)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    test_file = self._GetTestFilePath(['image.E01'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+    format_categories = [
+        definitions.FORMAT_CATEGORY_ARCHIVE,
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE]
+
+    expected_type_indicators = {
+        definitions.FORMAT_CATEGORY_ARCHIVE: [definitions.TYPE_INDICATOR_EWF],
+        definitions.FORMAT_CATEGORY_STORAGE_MEDIA_IMAGE: [
+            definitions.TYPE_INDICATOR_EWF]}
+    type_indicators = analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(
+        path_spec, format_categories)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    test_file = self._GetTestFilePath(['vsstest.qcow2'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+
+    format_categories = [
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM,
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM]
+
+    expected_type_indicators = {
+        definitions.FORMAT_CATEGORY_FILE_SYSTEM: [
+            definitions.PREFERRED_NTFS_BACK_END],
+        definitions.FORMAT_CATEGORY_VOLUME_SYSTEM: [
+            definitions.TYPE_INDICATOR_VSHADOW]}
+    type_indicators = analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(
+        path_spec, format_categories)
+    self.assertEqual(type_indicators, expected_type_indicators)
+
+    with self.assertRaises(ValueError):
+      analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(path_spec, [99])
+
+  def testGetTypeIndicatorsByFormatCategoryWithCache(self):
+    """Tests the GetTypeIndicatorsByFormatCategory function with cache."""
+    test_file = self._GetTestFilePath(['syslog.gz'])
+    self._SkipIfPathNotExists(test_file)
+
+    format_categories = [
+        definitions.FORMAT_CATEGORY_ARCHIVE,
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM]
+
+    expected_type_indicators = {
+        definitions.FORMAT_CATEGORY_ARCHIVE: [],
+        definitions.FORMAT_CATEGORY_COMPRESSED_STREAM: [
+            definitions.TYPE_INDICATOR_GZIP]}
+
+    temporary_directory = tempfile.mkdtemp()
+    try:
+      temporary_file = os.path.join(temporary_directory, 'syslog.gz')
+      shutil.copy(test_file, temporary_file)
+
+      path_spec = os_path_spec.OSPathSpec(location=temporary_file)
+
+      type_indicators = analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(
+          path_spec, format_categories, use_cache=True)
+      self.assertEqual(type_indicators, expected_type_indicators)
+
+      # The cached results are used, so the file is not opened again.
+      os.remove(temporary_file)
+
+      type_indicators = analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(
+          path_spec, format_categories, use_cache=True)
+      self.assertEqual(type_indicators, expected_type_indicators)
+
+      # Registering an analyzer helper flushes the results of its format
+      # categories.
+      test_helper = TestAnalyzerHelper()
+      analyzer.Analyzer.RegisterHelper(test_helper)
+      analyzer.Analyzer.DeregisterHelper(test_helper)
+
+      type_indicators = analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(
+          path_spec, format_categories, use_cache=True)
+      self.assertEqual(type_indicators, expected_type_indicators)
+
+      analyzer.Analyzer.EmptyResultsCache()
+
+      with self.assertRaises(IOError):
+        analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(
+            path_spec, format_categories, use_cache=True)
+
+    finally:
+      shutil.rmtree(temporary_directory, True)
+
   def testGetVolumeSystemTypeIndicatorsTSK(self):
     """Tests the GetVolumeSystemTypeIndicators function on partitions."""
     test_file = self._GetTestFilePath(['tsk_volume_system.raw'])
@@ -267,6 +424,98 @@ class AnalyzerTest(shared_test_lib.BaseTestCase):
         path_spec)
     self.assertEqual(type_indicators, expected_type_indicators)
 
+  def testAnalyzerHelperModules(self):
+    """Tests that the analyzer helper modules match the format categories."""
+    # pylint: disable=protected-access
+    expected_helper_modules = {}
+    for type_indicator, helper in analyzer.Analyzer._analyzer_helpers.items():
+      for format_category in helper.FORMAT_CATEGORIES:
+        helper_modules = expected_helper_modules.setdefault(
+            format_category, {})
+        helper_modules[type_indicator] = helper.__module__
+
+    for format_category, helper_modules in (
+        analyzer.Analyzer._ANALYZER_HELPER_MODULES.items()):
+      for type_indicator, module_name in helper_modules.items():
+        # Analyzer helpers with missing dependencies are not registered.
+        if type_indicator not in analyzer.Analyzer._analyzer_helpers:
+          continue
+
+        self.assertEqual(
+            expected_helper_modules[format_category].get(type_indicator),
+            module_name)
+
+    for format_category, helper_modules in expected_helper_modules.items():
+      for type_indicator, module_name in helper_modules.items():
+        if module_name.startswith('dfvfs.analyzer.'):
+          self.assertEqual(
+              analyzer.Analyzer._ANALYZER_HELPER_MODULES.get(
+                  format_category, {}).get(type_indicator), module_name)
+
+  def testLazyImportTypeIndicators(self):
+    """Tests that lazy import mode determines the same type indicators."""
+    format_categories = sorted(
+        analyzer.Analyzer._FORMAT_CATEGORY_ATTRIBUTE_NAMES.keys())
+    test_files = [
+        'image.E01', 'image.qcow2', 'image.vhd', 'image.vmdk', 'syslog',
+        'syslog.bin.cpio', 'syslog.bz2', 'syslog.gz', 'syslog.tar',
+        'syslog.zip', 'tsk_volume_system.raw']
+
+    script = '\n'.join([
+        'import json',
+        'import sys',
+        'from dfvfs.analyzer import analyzer',
+        'from dfvfs.path import os_path_spec',
+        'results = {}',
+        'for format_category in json.loads(sys.argv[1]):',
+        '  for test_file in {0!r}:'.format(test_files),
+        '    path_spec = os_path_spec.OSPathSpec(',
+        '        location="test_data/" + test_file)',
+        '    type_indicators = (',
+        '        analyzer.Analyzer.GetTypeIndicatorsByFormatCategory(',
+        '            path_spec, [format_category]))',
+        '    key = "{0:d} {1:s}".format(format_category, test_file)',
+        '    results[key] = sorted(type_indicators[format_category])',
+        'print(json.dumps(results))'])
+
+    output, _ = self._RunPythonScript(
+        script, arguments=[json.dumps(format_categories)])
+    expected_results = json.loads(output)
+
+    results = {}
+    for format_category in format_categories:
+      # Every format category is analyzed by a separate interpreter, so that
+      # the results do not depend on the analyzer helpers imported for
+      # another format category.
+      output, _ = self._RunPythonScript(
+          script, arguments=[json.dumps([format_category])],
+          lazy_import=True)
+      results.update(json.loads(output))
+
+    self.assertEqual(results, expected_results)
+    self.assertEqual(
+        expected_results['{0:d} image.E01'.format(
+            definitions.FORMAT_CATEGORY_ARCHIVE)],
+        [definitions.TYPE_INDICATOR_EWF])
+
+  def testLazyImport(self):
+    """Tests the import times in lazy import mode."""
+    script = '\n'.join([
+        'from dfvfs.analyzer import analyzer',
+        'from dfvfs.path import os_path_spec',
+        'path_spec = os_path_spec.OSPathSpec(location="test_data/syslog.gz")',
+        'type_indicators = (',
+        '    analyzer.Analyzer.GetCompressedStreamTypeIndicators(path_spec))',
+        'assert type_indicators == ["GZIP"], type_indicators'])
+
+    import_times = self._GetImportTimes(script)
+    self.assertIn('dfvfs.analyzer.tsk_partition_analyzer_helper', import_times)
+
+    lazy_import_times = self._GetImportTimes(script, lazy_import=True)
+    self.assertNotIn(
+        'dfvfs.analyzer.tsk_partition_analyzer_helper', lazy_import_times)
+    self.assertNotIn('pytsk3', lazy_import_times)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -15,6 +15,28 @@ from tests.compression import test_lib
 class ZlibDecompressorTestCase(test_lib.DecompressorTestCase):
   """Tests for the zlib decompressor object."""
 
+  def testCopy(self):
+    """Tests the Copy method."""
+    decompressor = zlib_decompressor.ZlibDecompressor()
+
+    compressed_data = (
+        b'x\x9c\x0b\xc9\xc8,V\x00\xa2D\x85\x92\xd4\xe2\x12=\x00)\x97\x05$')
+
+    uncompressed_data, _ = decompressor.Decompress(compressed_data[:8])
+
+    decompressor_copy = decompressor.Copy()
+    self.assertIsNotNone(decompressor_copy)
+
+    uncompressed_data_copy, _ = decompressor_copy.Decompress(
+        compressed_data[8:])
+    self.assertEqual(
+        uncompressed_data + uncompressed_data_copy, b'This is a test.')
+
+    # Decompressing with the copy should not change the original state.
+    uncompressed_data_original, _ = decompressor.Decompress(
+        compressed_data[8:])
+    self.assertEqual(uncompressed_data_original, uncompressed_data_copy)
+
   def testDecompress(self):
     """Tests the Decompress method."""
     decompressor = zlib_decompressor.ZlibDecompressor()
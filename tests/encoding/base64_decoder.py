@@ -29,5 +29,29 @@ class Base64DecoderTestCase(test_lib.DecoderTestCase):
       decoder.Decode(b'\x01\x02\x03\x04\x05\x06\x07\x08A')
 
 
+  def testDecodeGroups(self):
+    """Tests the DecodeGroups method."""
+    decoder = base64_decoder.Base64Decoder()
+
+    decoded_data, encoded_data = decoder.DecodeGroups(b'AQID\nBAUG\r\nBw')
+    self.assertEqual(decoded_data, b'\x01\x02\x03\x04\x05\x06')
+    self.assertEqual(encoded_data, b'Bw')
+
+  def testGetDecodedDataSize(self):
+    """Tests the GetDecodedDataSize method."""
+    decoder = base64_decoder.Base64Decoder()
+
+    self.assertEqual(decoder.GetDecodedDataSize(12), 9)
+    self.assertEqual(decoder.GetDecodedDataSize(11), 8)
+    self.assertEqual(decoder.GetDecodedDataSize(10), 7)
+
+  def testGetEncodedGroup(self):
+    """Tests the GetEncodedGroup method."""
+    decoder = base64_decoder.Base64Decoder()
+
+    self.assertEqual(decoder.GetEncodedGroup(0), (0, 0))
+    self.assertEqual(decoder.GetEncodedGroup(5), (4, 2))
+    self.assertEqual(decoder.GetEncodedGroup(6), (8, 0))
+
 if __name__ == '__main__':
   unittest.main()
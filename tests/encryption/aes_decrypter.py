@@ -85,5 +85,40 @@ class AESDecrypterTestCase(test_lib.DecrypterTestCase):
     self.assertEqual(expected_encrypted_data, encrypted_data)
 
 
+  def testResetToBlock(self):
+    """Tests the ResetToBlock method."""
+    decrypter = aes_decrypter.AESDecrypter(
+        cipher_mode=definitions.ENCRYPTION_MODE_CBC,
+        initialization_vector=b'This is an IV456', key=b'This is a key123')
+
+    self.assertTrue(decrypter.SupportsRandomAccess())
+    self.assertEqual(decrypter.block_size, 16)
+
+    decrypter.ResetToBlock(
+        previous_encrypted_block=(
+            b'2|\x7f\xd7\xff\xbay\xf9\x95?\x81\xc7\xaafV\xce'))
+
+    decrypted_data, _ = decrypter.Decrypt(
+        b'B\x01\xdb8E7\xfe\x92j\xf0\x1d(\xb9\x9f\xad\x13')
+    self.assertEqual(decrypted_data, b'ncrypted text!!!')
+
+    decrypter.ResetToBlock()
+
+    decrypted_data, _ = decrypter.Decrypt(
+        b'2|\x7f\xd7\xff\xbay\xf9\x95?\x81\xc7\xaafV\xce')
+    self.assertEqual(decrypted_data, b'This is secret e')
+
+    with self.assertRaises(ValueError):
+      decrypter.ResetToBlock(previous_encrypted_block=b'bogus')
+
+    decrypter = aes_decrypter.AESDecrypter(
+        cipher_mode=definitions.ENCRYPTION_MODE_OFB,
+        initialization_vector=b'This is an IV456', key=b'This is a key123')
+
+    self.assertFalse(decrypter.SupportsRandomAccess())
+
+    with self.assertRaises(ValueError):
+      decrypter.ResetToBlock()
+
 if __name__ == '__main__':
   unittest.main()
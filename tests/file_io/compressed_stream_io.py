@@ -93,6 +93,15 @@ class BZIP2CompressedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into functionality."""
+    file_object = compressed_stream_io.CompressedStream(self._resolver_context)
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
 
 @unittest.skipIf(lzma is None, 'requires LZMA compression support')
 class LZMACompressedStreamTest(test_lib.SylogTestCase):
@@ -293,6 +302,32 @@ class ZlibCompressedStreamTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testSeekWithSeekPoints(self):
+    """Test the seek functionality with seek points."""
+    file_object = compressed_stream_io.CompressedStream(self._resolver_context)
+    file_object.open(path_spec=self._compressed_stream_path_spec)
+
+    # Use small buffers to force multiple seek points in the test data.
+    # pylint: disable=protected-access
+    file_object._COMPRESSED_DATA_BUFFER_SIZE = 64
+    file_object._SEEK_POINT_INTERVAL = 128
+
+    self.assertEqual(file_object.get_size(), 1247)
+    self.assertGreater(len(file_object._seek_points), 1)
+
+    test_file = self._GetTestFilePath(['syslog'])
+    with open(test_file, 'rb') as file_object_expected:
+      expected_data = file_object_expected.read()
+
+    for offset in (1200, 167, 900, 0, 1000, 500):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(32), expected_data[offset:offset + 32])
+
+    self._TestSeekFileObject(file_object)
+
+    file_object.close()
+
   def testRead(self):
     """Test the read functionality."""
     file_object = compressed_stream_io.CompressedStream(self._resolver_context)
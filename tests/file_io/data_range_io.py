@@ -84,6 +84,38 @@ class DataRangeTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into functionality."""
+    file_object = data_range_io.DataRange(self._resolver_context)
+    file_object.open(path_spec=self._data_range_path_spec)
+
+    self._TestReadIntoFileObject(file_object, base_offset=0)
+
+    file_object.close()
+
+  def testReadRanges(self):
+    """Test the read ranges functionality."""
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    expected_data = os_file_object.read()
+    os_file_object.close()
+
+    file_object = data_range_io.DataRange(self._resolver_context)
+    file_object.open(path_spec=self._data_range_path_spec)
+
+    data_per_range = file_object.read_ranges([
+        (0, 16), (8, 16), (1070, 20), (2000, 4)])
+    self.assertEqual(data_per_range, [
+        expected_data[167:183], expected_data[175:191],
+        expected_data[1237:1247], b''])
+
+    self.assertEqual(file_object.get_offset(), 0)
+
+    with self.assertRaises(ValueError):
+      file_object.read_ranges([(-1, 4)])
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
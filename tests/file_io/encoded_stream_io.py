@@ -4,19 +4,34 @@
 
 from __future__ import unicode_literals
 
+import base64
 import os
 import unittest
 
 from dfvfs.file_io import encoded_stream_io
+from dfvfs.file_io import fake_file_io
 from dfvfs.file_io import os_file_io
 from dfvfs.lib import definitions
 from dfvfs.path import encoded_stream_path_spec
+from dfvfs.path import fake_path_spec
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 
 from tests.file_io import test_lib
 
 
+class ListIndexEncodedStream(encoded_stream_io.EncodedStream):
+  """Encoded stream that stores the index in lists, such as on Python 2."""
+
+  def _CreateIndexArray(self):
+    """Creates an array to store the values of a column of the index.
+
+    Returns:
+      list[int]: empty list.
+    """
+    return []
+
+
 class Base16EncodedStreamTest(test_lib.SylogTestCase):
   """The unit test for a base16 encoded stream file-like object."""
 
@@ -224,5 +239,113 @@ class Base64EncodedStreamTest(test_lib.SylogTestCase):
     file_object.close()
 
 
+  def testReadRandomAccess(self):
+    """Test the read functionality at offsets within line-wrapped data."""
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    with open(test_file, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    # Use a small buffer to read encoded groups that span buffer boundaries.
+    # pylint: disable=protected-access
+    file_object._ENCODED_DATA_BUFFER_SIZE = 7
+
+    self.assertEqual(file_object.get_size(), len(expected_data))
+
+    for offset in (1200, 56, 57, 0, 1246, 600, 1):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(file_object.read(80), expected_data[offset:offset + 80])
+
+    file_object.seek(0, os.SEEK_SET)
+    self.assertEqual(file_object.read(), expected_data)
+
+    file_object.close()
+
+  def testReadRandomAccessWithListIndex(self):
+    """Test the read functionality with the index stored in lists."""
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    with open(test_file, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    file_object = ListIndexEncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    self.assertEqual(file_object.get_size(), len(expected_data))
+
+    for offset in (1200, 56, 57, 0, 1246, 600, 1):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(file_object.read(80), expected_data[offset:offset + 80])
+
+    file_object.close()
+
+  def testBuildCharacterIndex(self):
+    """Test the _BuildCharacterIndex function."""
+    file_object = encoded_stream_io.EncodedStream(self._resolver_context)
+    file_object.open(path_spec=self._encoded_stream_path_spec)
+
+    file_object.get_size()
+
+    # The lines of line-wrapped data are stored as a single segment.
+    # pylint: disable=protected-access
+    self.assertEqual(
+        list(file_object._character_index_character_offsets), [0])
+    self.assertEqual(list(file_object._character_index_number_of_runs), [22])
+    self.assertEqual(list(file_object._character_index_run_sizes), [76])
+    self.assertEqual(list(file_object._character_index_run_strides), [77])
+
+    file_object.close()
+
+  def testReadRandomAccessIrregularWhitespace(self):
+    """Test the read functionality on data with irregular whitespace."""
+    expected_data = bytes(bytearray(range(256))) * 4
+    encoded_data = base64.b64encode(expected_data)
+
+    lines = []
+    line_sizes = [76, 76, 76, 40, 40, 12, 76, 76, 3, 1, 76]
+    while encoded_data:
+      for line_size in line_sizes:
+        lines.append(encoded_data[:line_size])
+        encoded_data = encoded_data[line_size:]
+
+    data = b'\r\n'.join(lines[:5]) + b'\n\n' + b'\n'.join(lines[5:]) + b'\n'
+
+    parent_file_object = fake_file_io.FakeFile(self._resolver_context, data)
+    parent_file_object.open(
+        path_spec=fake_path_spec.FakePathSpec(location='/syslog.base64'))
+
+    file_object = encoded_stream_io.EncodedStream(
+        self._resolver_context,
+        encoding_method=definitions.ENCODING_METHOD_BASE64,
+        file_object=parent_file_object)
+    file_object.open()
+
+    self.assertEqual(file_object.get_size(), len(expected_data))
+
+    # pylint: disable=protected-access
+    self.assertLess(
+        len(file_object._character_index_character_offsets), len(lines))
+
+    for offset in range(0, len(expected_data), 7):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(file_object.read(9), expected_data[offset:offset + 9])
+
+    # Reads that span multiple buffers of encoded data.
+    file_object._ENCODED_DATA_BUFFER_SIZE = 13
+
+    for offset in range(0, len(expected_data), 7):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(23), expected_data[offset:offset + 23])
+
+    file_object.close()
+    parent_file_object.close()
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -180,6 +180,20 @@ class AESEncryptedStreamTest(test_lib.PaddedSyslogTestCase):
     file_object.close()
 
 
+  def testReadRandomAccess(self):
+    """Test the read functionality at block unaligned offsets."""
+    file_object = encrypted_stream_io.EncryptedStream(self._resolver_context)
+    file_object.open(path_spec=self._encrypted_stream_path_spec)
+
+    expected_data = file_object.read()
+    self.assertEqual(len(expected_data), 1248)
+
+    for offset in (1200, 17, 0, 1247, 512, 15):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(file_object.read(33), expected_data[offset:offset + 33])
+
+    file_object.close()
+
 class BlowfishEncryptedStreamWithKeyChainTest(test_lib.PaddedSyslogTestCase):
   """Tests the Blowfish encrypted stream file-like object.
 
@@ -4,8 +4,10 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
+from dfvfs.file_io import ewf_file_io
 from dfvfs.lib import errors
 from dfvfs.path import ewf_path_spec
 from dfvfs.path import os_path_spec
@@ -48,6 +50,24 @@ class EWFFileTest(test_lib.ImageFileTestCase):
     """Test the read functionality."""
     self._TestRead(self._ewf_path_spec)
 
+  def testReadRanges(self):
+    """Test the read ranges functionality."""
+    self._TestReadRanges(self._ewf_path_spec)
+
+    file_object = ewf_file_io.EWFFile(self._resolver_context)
+    file_object.open(path_spec=self._ewf_path_spec)
+
+    ranges = [(1024, 16), (1032, 16), (0, 512), (102390, 20)]
+    data_per_range = file_object.read_ranges(ranges)
+
+    for (range_offset, range_size), data in zip(ranges, data_per_range):
+      file_object.seek(range_offset, os.SEEK_SET)
+      self.assertEqual(data, file_object.read(range_size))
+
+    self.assertEqual(len(data_per_range[3]), 10)
+
+    file_object.close()
+
 
 class SplitEWFFileTest(test_lib.PartitionedImageFileTestCase):
   """The unit test for the split EWF image file-like object."""
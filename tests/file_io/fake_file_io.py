@@ -115,6 +115,32 @@ class FakeFileTest(shared_test_lib.BaseTestCase):
 
     # TODO: add boundary scenarios.
 
+  def testReadInto(self):
+    """Test the readinto function."""
+    test_file = '/test_data/password.txt'
+    test_path_spec = fake_path_spec.FakePathSpec(location=test_file)
+
+    file_object = fake_file_io.FakeFile(
+        self._resolver_context, self._FILE_DATA1)
+    file_object.open(path_spec=test_path_spec)
+
+    read_buffer = bytearray(20)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 20)
+    self.assertEqual(read_buffer, b'place,user,password\n')
+
+    file_object.seek(-6, os.SEEK_END)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 6)
+    self.assertEqual(read_buffer[:6], b'admin\n')
+
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 0)
+
+    file_object.close()
+
 
 if __name__ == '__main__':
   unittest.main()
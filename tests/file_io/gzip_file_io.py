@@ -4,6 +4,9 @@
 
 from __future__ import unicode_literals
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from dfvfs.file_io import gzip_file_io
@@ -61,6 +64,15 @@ class GzipFileTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testReadInto(self):
+    """Test the read into functionality."""
+    file_object = gzip_file_io.GzipFile(self._resolver_context)
+    file_object.open(path_spec=self._gzip_path_spec)
+
+    self._TestReadIntoFileObject(file_object)
+
+    file_object.close()
+
   def testReadCorrupt(self):
     """Tests reading a file that is corrupt."""
     # The corrupt gzip has no member footer.
@@ -116,6 +128,50 @@ class GzipFileTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testSaveLoadIndex(self):
+    """Tests the SaveIndex and LoadIndex functions."""
+    test_path = self._GetTestFilePath(['fsevents_000000000000b208'])
+    self._SkipIfPathNotExists(test_path)
+
+    test_os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_OS, location=test_path)
+    test_gzip_path_spec = path_spec_factory.Factory.NewPathSpec(
+        definitions.TYPE_INDICATOR_GZIP, parent=test_os_path_spec)
+
+    temp_directory = tempfile.mkdtemp()
+    try:
+      index_path = os.path.join(temp_directory, 'index.json')
+
+      file_object = gzip_file_io.GzipFile(self._resolver_context)
+
+      with self.assertRaises(IOError):
+        file_object.SaveIndex(index_path)
+
+      file_object.open(path_spec=test_gzip_path_spec)
+      file_object.SaveIndex(index_path)
+      file_object.close()
+
+      file_object = gzip_file_io.GzipFile(self._resolver_context)
+      file_object.LoadIndex(index_path)
+      file_object.open(path_spec=test_gzip_path_spec)
+
+      self.assertEqual(file_object.uncompressed_data_size, 506631)
+      self.assertEqual(file_object.modification_times, [0, 0])
+
+      file_object.seek(28530)
+      self.assertEqual(file_object.read(6), b'OS\x00P\x07\x00')
+
+      file_object.seek(506631 - 4)
+      self.assertEqual(file_object.read(4), b'\x02\x00\x80\x00')
+
+      with self.assertRaises(IOError):
+        file_object.LoadIndex(index_path)
+
+      file_object.close()
+
+    finally:
+      shutil.rmtree(temp_directory, True)
+
 
 if __name__ == '__main__':
   unittest.main()
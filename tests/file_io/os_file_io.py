@@ -130,6 +130,101 @@ class OSFileTest(shared_test_lib.BaseTestCase):
 
     # TODO: add boundary scenarios.
 
+  def testReadInto(self):
+    """Test the read into functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+
+    with self.assertRaises(IOError):
+      file_object.readinto(bytearray(16))
+
+    file_object.open(path_spec=self._path_spec1)
+
+    read_buffer = bytearray(20)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 20)
+    self.assertEqual(read_buffer, b'place,user,password\n')
+    self.assertEqual(file_object.get_offset(), 20)
+
+    file_object.seek(110, os.SEEK_SET)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 6)
+    self.assertEqual(read_buffer[:6], b'admin\n')
+
+    file_object.close()
+
+  def testReadRanges(self):
+    """Test the read ranges functionality."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+
+    with self.assertRaises(IOError):
+      file_object.read_ranges([(0, 5)])
+
+    file_object.open(path_spec=self._path_spec1)
+    file_object.seek(10, os.SEEK_SET)
+
+    data_per_range = file_object.read_ranges([
+        (6, 4), (0, 5), (20, 4), (22, 10), (110, 20), (200, 4), (3, 0)])
+    self.assertEqual(data_per_range, [
+        b'user', b'place', b'bank', b'nk,joesmit', b'admin\n', b'', b''])
+
+    # Reading ranges should not change the offset.
+    self.assertEqual(file_object.get_offset(), 10)
+
+    with self.assertRaises(ValueError):
+      file_object.read_ranges([(-1, 4)])
+
+    with self.assertRaises(ValueError):
+      file_object.read_ranges([(0, -4)])
+
+    file_object.close()
+
+  def testMemoryMap(self):
+    """Test the memory mapped functionality."""
+    resolver_context = context.Context(memory_map_threshold=1024)
+    file_object = os_file_io.OSFile(resolver_context)
+    file_object.open(path_spec=self._path_spec1)
+
+    # The file is smaller than the memory map threshold.
+    # pylint: disable=protected-access
+    self.assertFalse(file_object._is_memory_mapped)
+
+    file_object.close()
+
+    resolver_context = context.Context(memory_map_threshold=0)
+    file_object = os_file_io.OSFile(resolver_context)
+    file_object.open(path_spec=self._path_spec1)
+
+    self.assertTrue(file_object._is_memory_mapped)
+    self.assertEqual(file_object.get_size(), 116)
+
+    self.assertEqual(file_object.read(20), b'place,user,password\n')
+    self.assertEqual(file_object.get_offset(), 20)
+
+    file_object.seek(-6, os.SEEK_END)
+    self.assertEqual(file_object.read(), b'admin\n')
+
+    file_object.seek(6, os.SEEK_SET)
+    read_buffer = bytearray(4)
+    self.assertEqual(file_object.readinto(read_buffer), 4)
+    self.assertEqual(read_buffer, b'user')
+
+    data_per_range = file_object.read_ranges([(20, 4), (110, 20)])
+    self.assertEqual(data_per_range, [b'bank', b'admin\n'])
+    self.assertEqual(file_object.get_offset(), 10)
+
+    # Conforming to the POSIX seek the offset can exceed the file size
+    # but reading will result in no data being returned.
+    file_object.seek(300, os.SEEK_SET)
+    self.assertEqual(file_object.get_offset(), 300)
+    self.assertEqual(file_object.read(2), b'')
+
+    with self.assertRaises(IOError):
+      file_object.seek(-10, os.SEEK_SET)
+
+    file_object.close()
+
   def testGetOffset(self):
     """Test the get offset functionality."""
     file_object = os_file_io.OSFile(self._resolver_context)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the read-ahead file-like object."""
+
+from __future__ import unicode_literals
+
+import gc
+import os
+import unittest
+
+from dfvfs.file_io import os_file_io
+from dfvfs.file_io import read_ahead_io
+from dfvfs.path import os_path_spec
+from dfvfs.path import read_ahead_path_spec
+from dfvfs.resolver import context
+
+from tests.file_io import test_lib
+
+
+class ReadAheadFileTest(test_lib.SylogTestCase):
+  """The unit test for the read-ahead file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._read_ahead_path_spec = read_ahead_path_spec.ReadAheadPathSpec(
+        chunk_size=64, number_of_chunks=4, parent=self._os_path_spec)
+
+  def testInitialize(self):
+    """Test the __init__ function."""
+    with self.assertRaises(ValueError):
+      read_ahead_io.ReadAheadFile(self._resolver_context, chunk_size=0)
+
+    with self.assertRaises(ValueError):
+      read_ahead_io.ReadAheadFile(self._resolver_context, number_of_chunks=0)
+
+  def testOpenCloseFileObject(self):
+    """Test the open and close functionality using a file-like object."""
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    file_object = read_ahead_io.ReadAheadFile(
+        self._resolver_context, file_object=os_file_object)
+    file_object.open()
+
+    self._TestGetSizeFileObject(file_object)
+
+    file_object.close()
+    os_file_object.close()
+
+  def testOpenClosePathSpec(self):
+    """Test the open and close functionality using a path specification."""
+    file_object = read_ahead_io.ReadAheadFile(self._resolver_context)
+    file_object.open(path_spec=self._read_ahead_path_spec)
+
+    self._TestGetSizeFileObject(file_object)
+
+    file_object.close()
+
+  def testSeek(self):
+    """Test the seek functionality."""
+    file_object = read_ahead_io.ReadAheadFile(self._resolver_context)
+    file_object.open(path_spec=self._read_ahead_path_spec)
+
+    self._TestSeekFileObject(file_object)
+
+    file_object.close()
+
+  def testRead(self):
+    """Test the read functionality."""
+    file_object = read_ahead_io.ReadAheadFile(self._resolver_context)
+    file_object.open(path_spec=self._read_ahead_path_spec)
+
+    self._TestReadFileObject(file_object)
+
+    file_object.close()
+
+  def testReadSequential(self):
+    """Test reading sequentially."""
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    expected_data = os_file_object.read()
+    os_file_object.close()
+
+    file_object = read_ahead_io.ReadAheadFile(self._resolver_context)
+    file_object.open(path_spec=self._read_ahead_path_spec)
+
+    data_segments = []
+    data = file_object.read(48)
+    while data:
+      data_segments.append(data)
+      data = file_object.read(48)
+
+    self.assertEqual(b''.join(data_segments), expected_data)
+
+    # The first of the 20 chunks is read by the consumer, the others are
+    # read ahead.
+    self.assertEqual(file_object.number_of_misses, 1)
+    self.assertEqual(file_object.number_of_hits, 19)
+    self.assertEqual(file_object.number_of_wasted_chunks, 0)
+
+    file_object.close()
+
+  def testReadRandomAccess(self):
+    """Test reading with random access."""
+    file_object = read_ahead_io.ReadAheadFile(self._resolver_context)
+    file_object.open(path_spec=self._read_ahead_path_spec)
+
+    file_object.read(16)
+
+    # Chunks 1 to 4 are read ahead but not used.
+    file_object.seek(1000, os.SEEK_SET)
+    self.assertEqual(file_object.read(4), b'me.m')
+
+    self.assertEqual(file_object.number_of_misses, 2)
+    self.assertEqual(file_object.number_of_hits, 0)
+    self.assertEqual(file_object.number_of_wasted_chunks, 4)
+
+    file_object.close()
+
+
+  def testReadWithSharedParent(self):
+    """Test reading while the parent is read by another consumer."""
+    file_object = read_ahead_io.ReadAheadFile(self._resolver_context)
+    file_object.open(path_spec=self._read_ahead_path_spec)
+
+    # The parent is opened in a private resolver context.
+    self.assertIsNone(self._resolver_context.GetFileObject(self._os_path_spec))
+
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+    expected_data = os_file_object.read()
+
+    data_segments = []
+    data = file_object.read(48)
+    while data:
+      data_segments.append(data)
+
+      os_file_object.seek(0, os.SEEK_SET)
+      self.assertEqual(os_file_object.read(16), expected_data[:16])
+
+      data = file_object.read(48)
+
+    self.assertEqual(b''.join(data_segments), expected_data)
+
+    file_object.close()
+    os_file_object.close()
+
+  def testReleaseWithoutClose(self):
+    """Test that the read-ahead thread stops if the object is released."""
+    os_file_object = os_file_io.OSFile(self._resolver_context)
+    os_file_object.open(path_spec=self._os_path_spec)
+
+    # A file-like object opened without a path specification is not cached
+    # in the resolver context.
+    file_object = read_ahead_io.ReadAheadFile(
+        self._resolver_context, file_object=os_file_object, chunk_size=64)
+    file_object.open()
+
+    file_object.read(16)
+
+    # pylint: disable=protected-access
+    read_ahead_thread = file_object._read_ahead_thread
+    self.assertIsNotNone(read_ahead_thread)
+
+    file_object = None
+    gc.collect()
+
+    read_ahead_thread.join(5.0)
+    self.assertFalse(read_ahead_thread.is_alive())
+
+    os_file_object.close()
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,6 +4,10 @@
 
 from __future__ import unicode_literals
 
+import os
+import shutil
+import sqlite3
+import tempfile
 import unittest
 
 from dfvfs.file_io import sqlite_blob_file_io
@@ -28,6 +32,10 @@ class SQLiteBlobFileWithConditionTest(test_lib.SylogTestCase):
         table_name='blobs', column_name='blob',
         row_condition=('identifier', '==', 'myblob'), parent=path_spec)
 
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
   def testOpenClosePathSpec(self):
     """Test the open and close functionality using a path specification."""
     file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
@@ -55,6 +63,185 @@ class SQLiteBlobFileWithConditionTest(test_lib.SylogTestCase):
 
     file_object.close()
 
+  def testSharedDatabase(self):
+    """Test that file-like objects share the database file object."""
+    index_path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='blobs', column_name='blob', row_index=0,
+        parent=self._sqlite_blob_path_spec.parent)
+
+    file_object1 = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object1.open(path_spec=self._sqlite_blob_path_spec)
+
+    file_object2 = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object2.open(path_spec=index_path_spec)
+
+    # pylint: disable=protected-access
+    database_object = file_object1._database_object
+    self.assertIsNotNone(database_object)
+    self.assertIs(file_object2._database_object, database_object)
+
+    parent_path_spec = self._sqlite_blob_path_spec.parent
+    self.assertIs(
+        self._resolver_context.GetSQLiteDatabase(parent_path_spec),
+        database_object)
+
+    database_cache = self._resolver_context._sqlite_database_cache
+    cache_value = database_cache.GetCacheValue(parent_path_spec.comparable)
+    self.assertEqual(cache_value.reference_count, 2)
+
+    file_object1.close()
+    self.assertEqual(cache_value.reference_count, 1)
+
+    self._TestReadFileObject(file_object2)
+
+    file_object2.close()
+    self.assertEqual(cache_value.reference_count, 0)
+
+    # The dereferenced database file object is kept open until the resolver
+    # context is emptied.
+    self.assertIs(
+        self._resolver_context.GetSQLiteDatabase(parent_path_spec),
+        database_object)
+
+    self._resolver_context.Empty()
+    self.assertIsNone(
+        self._resolver_context.GetSQLiteDatabase(parent_path_spec))
+
+    # A different resolver context does not share the database file object.
+    file_object1 = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object1.open(path_spec=self._sqlite_blob_path_spec)
+
+    file_object2 = sqlite_blob_file_io.SQLiteBlobFile(context.Context())
+    file_object2.open(path_spec=self._sqlite_blob_path_spec)
+
+    self.assertIsNot(
+        file_object2._database_object, file_object1._database_object)
+
+    file_object1.close()
+    file_object2.close()
+
+  def testSharedDatabaseSuccessiveOpens(self):
+    """Test that successive file-like objects reuse the database copy."""
+    parent_path_spec = self._sqlite_blob_path_spec.parent
+
+    database_object = None
+    for _ in range(5):
+      file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+      file_object.open(path_spec=self._sqlite_blob_path_spec)
+
+      # pylint: disable=protected-access
+      if database_object is None:
+        database_object = file_object._database_object
+        temp_file_path = database_object._temp_file_path
+
+      self.assertIs(file_object._database_object, database_object)
+      self.assertEqual(database_object._temp_file_path, temp_file_path)
+
+      self._TestReadFileObject(file_object)
+
+      file_object.close()
+
+    self.assertIs(
+        self._resolver_context.GetSQLiteDatabase(parent_path_spec),
+        database_object)
+    self.assertTrue(os.path.exists(temp_file_path))
+
+    # Emptying the context closes the database file object and removes its
+    # temporary copy.
+    self._resolver_context.Empty()
+    self.assertIsNone(
+        self._resolver_context.GetSQLiteDatabase(parent_path_spec))
+    self.assertFalse(os.path.exists(temp_file_path))
+
+  @unittest.skipIf(
+      not hasattr(sqlite3.Connection, 'blobopen'),
+      'missing support for incremental blob I/O')
+  def testReadIncremental(self):
+    """Test the read functionality using incremental blob I/O."""
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+    file_object.open(path_spec=self._sqlite_blob_path_spec)
+
+    # pylint: disable=protected-access
+    self.assertIsNotNone(file_object._blob_object)
+    self.assertIsNone(file_object._blob)
+
+    self._TestReadFileObject(file_object)
+
+    file_object.close()
+
+
+class SQLiteBlobFileWithoutRowIdentifierTest(test_lib.SylogTestCase):
+  """The unit test for a SQLite blob file-like object without rowid."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    with open(test_file, 'rb') as file_object:
+      self._expected_data = file_object.read()
+
+    self._temp_directory = tempfile.mkdtemp()
+    database_path = os.path.join(self._temp_directory, 'without_rowid.db')
+
+    connection = sqlite3.connect(database_path)
+    connection.execute((
+        'CREATE TABLE blobs (identifier TEXT PRIMARY KEY, blob BLOB) '
+        'WITHOUT ROWID'))
+    connection.execute(
+        'INSERT INTO blobs VALUES (?, ?)',
+        ('myblob', sqlite3.Binary(self._expected_data)))
+    connection.commit()
+    connection.close()
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=database_path)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+    shutil.rmtree(self._temp_directory, True)
+
+  def testRead(self):
+    """Test the read functionality."""
+    for path_spec in (
+        sqlite_blob_path_spec.SQLiteBlobPathSpec(
+            table_name='blobs', column_name='blob',
+            row_condition=('identifier', '==', 'myblob'),
+            parent=self._os_path_spec),
+        sqlite_blob_path_spec.SQLiteBlobPathSpec(
+            table_name='blobs', column_name='blob', row_index=0,
+            parent=self._os_path_spec)):
+      file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+      file_object.open(path_spec=path_spec)
+
+      self.assertEqual(file_object.get_size(), len(self._expected_data))
+      self.assertEqual(file_object.read(), self._expected_data)
+
+      file_object.close()
+
+    # pylint: disable=protected-access
+    database_cache = self._resolver_context._sqlite_database_cache
+    cache_value = database_cache.GetCacheValue(self._os_path_spec.comparable)
+    self.assertEqual(cache_value.reference_count, 0)
+
+  def testOpenMissingRow(self):
+    """Test that a failed open releases the database file object."""
+    path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
+        table_name='blobs', column_name='blob',
+        row_condition=('identifier', '==', 'bogus'),
+        parent=self._os_path_spec)
+
+    file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
+
+    with self.assertRaises(IOError):
+      file_object.open(path_spec=path_spec)
+
+    # pylint: disable=protected-access
+    database_cache = self._resolver_context._sqlite_database_cache
+    cache_value = database_cache.GetCacheValue(self._os_path_spec.comparable)
+    self.assertEqual(cache_value.reference_count, 0)
+
 
 class SQLiteBlobFileWithIndexTest(test_lib.SylogTestCase):
   """The unit test for a SQLite blob file-like object using row index."""
@@ -69,6 +256,10 @@ class SQLiteBlobFileWithIndexTest(test_lib.SylogTestCase):
     self._sqlite_blob_path_spec = sqlite_blob_path_spec.SQLiteBlobPathSpec(
         table_name='blobs', column_name='blob', row_index=0, parent=path_spec)
 
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._resolver_context.Empty()
+
   def testOpenClosePathSpec(self):
     """Test the open and close functionality using a path specification."""
     file_object = sqlite_blob_file_io.SQLiteBlobFile(self._resolver_context)
@@ -124,6 +124,33 @@ class ImageFileTestCase(shared_test_lib.BaseTestCase):
 
     file_object.close()
 
+  def _TestReadRanges(self, parent_path_spec):
+    """Test the read ranges functionality.
+
+    Args:
+      parent_path_spec (PathSpec): parent path specification.
+    """
+    path_spec = tsk_path_spec.TSKPathSpec(
+        inode=self._INODE_PASSWORDS_TXT, location='/passwords.txt',
+        parent=parent_path_spec)
+    file_object = tsk_file_io.TSKFile(self._resolver_context)
+
+    file_object.open(path_spec=path_spec)
+    file_object.seek(10, os.SEEK_SET)
+
+    data_per_range = file_object.read_ranges([
+        (6, 4), (0, 5), (20, 4), (110, 20), (200, 4), (3, 0)])
+    self.assertEqual(data_per_range, [
+        b'user', b'place', b'bank', b'admin\n', b'', b''])
+
+    # Reading ranges should not change the offset.
+    self.assertEqual(file_object.get_offset(), 10)
+
+    with self.assertRaises(ValueError):
+      file_object.read_ranges([(-1, 4)])
+
+    file_object.close()
+
 
 class PartitionedImageFileTestCase(shared_test_lib.BaseTestCase):
   """The unit test case for partitioned storage media image based test data."""
@@ -316,6 +343,44 @@ class SylogTestCase(shared_test_lib.BaseTestCase):
 
     self.assertEqual(file_object.get_offset(), expected_offset)
 
+  def _TestReadIntoFileObject(self, file_object, base_offset=167):
+    """Runs the read into tests on the file-like object.
+
+    Args:
+      file_object (file): file-like object with the test data.
+      base_offset (Optional[int]): base offset use in the tests.
+    """
+    file_object.seek(base_offset, os.SEEK_SET)
+
+    expected_buffer = (
+        b'Jan 22 07:53:01 myhostname.myhost.com CRON[31051]: (root) CMD '
+        b'(touch /var/run/crond.somecheck)\n')
+
+    read_buffer = bytearray(95)
+    read_count = file_object.readinto(read_buffer)
+
+    self.assertEqual(read_count, 95)
+    self.assertEqual(read_buffer, expected_buffer)
+    self.assertEqual(file_object.get_offset(), base_offset + 95)
+
+    # Read into part of a buffer.
+    file_object.seek(base_offset, os.SEEK_SET)
+
+    read_buffer = bytearray(16)
+    read_count = file_object.readinto(memoryview(read_buffer)[4:8])
+
+    self.assertEqual(read_count, 4)
+    self.assertEqual(read_buffer[:8], b'\x00\x00\x00\x00Jan ')
+
+    # Read beyond the end of the data.
+    file_object.seek(-5, os.SEEK_END)
+
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 5)
+
+    read_count = file_object.readinto(read_buffer)
+    self.assertEqual(read_count, 0)
+
   def _TestSeekFileObject(self, file_object, base_offset=167):
     """Runs the seek tests on the file-like object.
 
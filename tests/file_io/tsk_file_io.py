@@ -38,6 +38,10 @@ class TSKFileTest(test_lib.ImageFileTestCase):
     """Test the seek functionality."""
     self._TestSeek(self._os_path_spec)
 
+  def testReadRanges(self):
+    """Test the read ranges functionality."""
+    self._TestReadRanges(self._os_path_spec)
+
   def testRead(self):
     """Test the read functionality."""
     self._TestRead(self._os_path_spec)
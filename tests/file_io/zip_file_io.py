@@ -4,7 +4,11 @@
 
 from __future__ import unicode_literals
 
+import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
 from dfvfs.file_io import zip_file_io
 from dfvfs.path import os_path_spec
@@ -57,6 +61,125 @@ class ZipFileTest(test_lib.SylogTestCase):
 
     # TODO: add tests for read > UNCOMPRESSED_DATA_BUFFER_SIZE
 
+  def testSeekWithSeekPoints(self):
+    """Test seeking backwards using seek points."""
+    # pylint: disable=protected-access
+    file_object = zip_file_io.ZipFile(self._resolver_context)
+    file_object._COMPRESSED_DATA_BUFFER_SIZE = 64
+    file_object._SEEK_POINT_INTERVAL = 128
+    file_object.open(path_spec=self._zip_path_spec)
+
+    expected_data = file_object.read()
+    self.assertEqual(len(expected_data), 1247)
+
+    number_of_seek_points = len(file_object._seek_points)
+    self.assertGreater(number_of_seek_points, 1)
+
+    for offset in (1100, 600, 200, 1000, 0):
+      file_object.seek(offset, os.SEEK_SET)
+      self.assertEqual(
+          file_object.read(100), expected_data[offset:offset + 100])
+
+    self.assertEqual(len(file_object._seek_points), number_of_seek_points)
+
+    # The seek points are shared by file-like objects of the same member.
+    other_file_object = zip_file_io.ZipFile(self._resolver_context)
+    other_file_object.open(path_spec=self._zip_path_spec)
+
+    self.assertIs(other_file_object._seek_points, file_object._seek_points)
+
+    other_file_object.seek(1100, os.SEEK_SET)
+    self.assertEqual(other_file_object.read(), expected_data[1100:])
+
+    other_file_object.close()
+    file_object.close()
+
+  def testReadWithCompressionMethods(self):
+    """Test the read functionality on stored and bzip2 compressed members."""
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    with open(test_file, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    temp_directory = tempfile.mkdtemp()
+    try:
+      zip_file_path = os.path.join(temp_directory, 'syslog.zip')
+      with zipfile.ZipFile(zip_file_path, 'w') as zip_file:
+        zip_file.writestr(
+            'stored', expected_data, compress_type=zipfile.ZIP_STORED)
+        zip_file.writestr(
+            'bzip2', expected_data, compress_type=zipfile.ZIP_BZIP2)
+
+      parent_path_spec = os_path_spec.OSPathSpec(location=zip_file_path)
+
+      for location in ('/stored', '/bzip2'):
+        path_spec = zip_path_spec.ZipPathSpec(
+            location=location, parent=parent_path_spec)
+
+        file_object = zip_file_io.ZipFile(self._resolver_context)
+        file_object.open(path_spec=path_spec)
+
+        self.assertEqual(file_object.get_size(), len(expected_data))
+
+        for offset in (1100, 200, 1000, 0):
+          file_object.seek(offset, os.SEEK_SET)
+          self.assertEqual(
+              file_object.read(100), expected_data[offset:offset + 100])
+
+        file_object.seek(0, os.SEEK_SET)
+        self.assertEqual(file_object.read(), expected_data)
+
+        file_object.close()
+
+    finally:
+      shutil.rmtree(temp_directory, True)
+
+  def testReadWithCRC32Mismatch(self):
+    """Test the read functionality on members with a CRC-32 mismatch."""
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    with open(test_file, 'rb') as file_object:
+      expected_data = file_object.read()
+
+    temp_directory = tempfile.mkdtemp()
+    try:
+      zip_file_path = os.path.join(temp_directory, 'syslog.zip')
+      with zipfile.ZipFile(zip_file_path, 'w') as zip_file:
+        zip_file.writestr(
+            'stored', expected_data, compress_type=zipfile.ZIP_STORED)
+        zip_file.writestr(
+            'deflated', expected_data, compress_type=zipfile.ZIP_DEFLATED)
+
+      # Corrupt the CRC-32 of the members in the central directory.
+      with open(zip_file_path, 'r+b') as file_object:
+        zip_file_data = file_object.read()
+
+        crc32_offset = zip_file_data.find(b'PK\x01\x02') + 16
+        while crc32_offset > 16:
+          file_object.seek(crc32_offset, os.SEEK_SET)
+          file_object.write(b'\x00\x00\x00\x00')
+          crc32_offset = zip_file_data.find(
+              b'PK\x01\x02', crc32_offset) + 16
+
+      parent_path_spec = os_path_spec.OSPathSpec(location=zip_file_path)
+
+      for location in ('/stored', '/deflated'):
+        path_spec = zip_path_spec.ZipPathSpec(
+            location=location, parent=parent_path_spec)
+
+        file_object = zip_file_io.ZipFile(self._resolver_context)
+        file_object.open(path_spec=path_spec)
+
+        with self.assertRaises(IOError):
+          file_object.read()
+
+        file_object.close()
+
+    finally:
+      shutil.rmtree(temp_directory, True)
+
 
 if __name__ == '__main__':
   unittest.main()
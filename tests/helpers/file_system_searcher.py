@@ -8,6 +8,7 @@ import os
 import unittest
 
 from dfvfs.lib import definitions
+from dfvfs.lib import errors
 from dfvfs.helpers import fake_file_system_builder
 from dfvfs.helpers import file_system_searcher
 from dfvfs.path import fake_path_spec
@@ -21,6 +22,57 @@ from dfvfs.vfs import tsk_file_system
 from tests import test_lib as shared_test_lib
 
 
+class FailingFindSpec(file_system_searcher.FindSpec):
+  """Find specification that fails below the root, for testing."""
+
+  def Matches(self, file_entry, search_depth=None):
+    """Determines if the file entry matches the find specification.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      search_depth (Optional[int]): number of location path segments to
+          compare.
+
+    Returns:
+      tuple: contains:
+
+        bool: True if the file entry matches the find specification.
+        bool: True if the location matches.
+
+    Raises:
+      RuntimeError: always below the root.
+    """
+    if search_depth:
+      raise RuntimeError('Failing find specification.')
+
+    return super(FailingFindSpec, self).Matches(
+        file_entry, search_depth=search_depth)
+
+
+class TerminatingFindSpec(file_system_searcher.FindSpec):
+  """Find specification that terminates the process below the root."""
+
+  def Matches(self, file_entry, search_depth=None):
+    """Determines if the file entry matches the find specification.
+
+    Args:
+      file_entry (FileEntry): file entry.
+      search_depth (Optional[int]): number of location path segments to
+          compare.
+
+    Returns:
+      tuple: contains:
+
+        bool: True if the file entry matches the find specification.
+        bool: True if the location matches.
+    """
+    if search_depth:
+      os._exit(1)  # pylint: disable=protected-access
+
+    return super(TerminatingFindSpec, self).Matches(
+        file_entry, search_depth=search_depth)
+
+
 class FindSpecTest(shared_test_lib.BaseTestCase):
   """Tests for the find specification."""
 
@@ -649,6 +701,58 @@ class FileSystemSearcherTest(shared_test_lib.BaseTestCase):
     test_relative_path = searcher.GetRelativePath(first_path_spec)
     self.assertEqual(test_relative_path, expected_relative_path)
 
+  def testFindParallel(self):
+    """Test the FindParallel() function."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    with self.assertRaises(ValueError):
+      list(searcher.FindParallel(number_of_workers=0))
+
+    # Find all the file entries of type: FILE_ENTRY_TYPE_FILE.
+    find_spec = file_system_searcher.FindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+
+    expected_locations = sorted([
+        getattr(path_spec, 'location', '')
+        for path_spec in searcher.Find(find_specs=[find_spec])])
+
+    path_spec_generator = searcher.FindParallel(
+        find_specs=[find_spec], number_of_workers=2)
+    self.assertIsNotNone(path_spec_generator)
+
+    locations = []
+    for path_spec in path_spec_generator:
+      self.assertEqual(path_spec.parent, self._qcow_path_spec)
+      locations.append(getattr(path_spec, 'location', ''))
+
+    self.assertEqual(len(locations), 24)
+    self.assertEqual(sorted(locations), expected_locations)
+
+    # Find all the file entries with a location glob.
+    find_spec = file_system_searcher.FindSpec(
+        location_glob=['$Extend', '$RmMetadata', '*', '*.blf'])
+    path_spec_generator = searcher.FindParallel(find_specs=[find_spec])
+
+    locations = [
+        getattr(path_spec, 'location', '') for path_spec in path_spec_generator]
+    self.assertEqual(locations, ['/$Extend/$RmMetadata/$TxfLog/$TxfLog.blf'])
+
+  def testFindParallelWithFailingWorkers(self):
+    """Test the FindParallel() function with failing worker processes."""
+    searcher = file_system_searcher.FileSystemSearcher(
+        self._tsk_file_system, self._qcow_path_spec)
+
+    find_spec = FailingFindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+    with self.assertRaises(errors.BackEndError):
+      list(searcher.FindParallel(find_specs=[find_spec], number_of_workers=2))
+
+    find_spec = TerminatingFindSpec(
+        file_entry_types=[definitions.FILE_ENTRY_TYPE_FILE])
+    with self.assertRaises(errors.BackEndError):
+      list(searcher.FindParallel(find_specs=[find_spec], number_of_workers=2))
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the helpers to calculate message digest hashes."""
+
+from __future__ import unicode_literals
+
+import threading
+import unittest
+
+from dfvfs.file_io import fake_file_io
+from dfvfs.helpers import hasher
+from dfvfs.lib import definitions
+from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+def _RaiseIOError(unused_file_entry, data_stream_name=''):
+  """Raises an IOError, to test hashing a data stream that cannot be read.
+
+  Args:
+    unused_file_entry (FileEntry): file entry.
+    data_stream_name (Optional[str]): name of the data stream.
+
+  Raises:
+    IOError: always.
+  """
+  raise IOError('Unable to read data stream: {0:s}.'.format(data_stream_name))
+
+
+class HashingStatisticsTest(shared_test_lib.BaseTestCase):
+  """Tests for the hashing statistics."""
+
+  def testGetThroughput(self):
+    """Tests the GetThroughput function."""
+    statistics = hasher.HashingStatistics()
+
+    self.assertIsNone(statistics.GetThroughput('TSK'))
+
+    statistics.AddDataStream('TSK', 2 * 1024 * 1024, 1.0)
+    statistics.AddDataStream('TSK', 4 * 1024 * 1024, 2.0)
+
+    self.assertEqual(statistics.type_indicators, ['TSK'])
+    self.assertEqual(statistics.GetNumberOfBytes('TSK'), 6 * 1024 * 1024)
+    self.assertEqual(statistics.GetNumberOfDataStreams('TSK'), 2)
+    self.assertEqual(statistics.GetThroughput('TSK'), 2.0)
+
+
+class DataStreamHasherTest(shared_test_lib.BaseTestCase):
+  """Tests for the data stream hasher."""
+
+  _EXPECTED_HASHES = {
+      'md5': '8b32710e60ce9f650b8b4dcc2b3ee927',
+      'sha1': '4668a3834d1a59cea883802978d12c5fba7d158d',
+      'sha256': (
+          '0420b023f8dc1b71ff25191ce4ce88d10028f99f99f7c21532611f4c273aeae9')}
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    with self.assertRaises(ValueError):
+      hasher.DataStreamHasher(hash_names=['bogus'])
+
+    with self.assertRaises(ValueError):
+      hasher.DataStreamHasher(read_buffer_size=0)
+
+  def testHashDataStream(self):
+    """Tests the HashDataStream function."""
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    resolver_context = context.ThreadSafeContext()
+    test_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    file_entry = resolver.Resolver.OpenFileEntry(
+        test_path_spec, resolver_context=resolver_context)
+
+    data_stream_hasher = hasher.DataStreamHasher(
+        read_buffer_size=100, resolver_context=resolver_context)
+
+    hashes = data_stream_hasher.HashDataStream(file_entry)
+    self.assertEqual(hashes, self._EXPECTED_HASHES)
+
+    statistics = data_stream_hasher.statistics
+    self.assertEqual(
+        statistics.GetNumberOfBytes(definitions.TYPE_INDICATOR_OS), 1247)
+
+    hashes = data_stream_hasher.HashDataStream(
+        file_entry, data_stream_name='bogus')
+    self.assertIsNone(hashes)
+
+  def testHashDataStreams(self):
+    """Tests the HashDataStreams function."""
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    bogus_path_spec = os_path_spec.OSPathSpec(
+        location=self._GetTestFilePath(['bogus']))
+
+    data_streams = [(test_path_spec, '')] * 8
+    data_streams.append((bogus_path_spec, ''))
+
+    data_stream_hasher = hasher.DataStreamHasher(hash_names=['sha256'])
+
+    results = list(data_stream_hasher.HashDataStreams(
+        data_streams, number_of_workers=3))
+    self.assertEqual(len(results), 9)
+
+    hashes = [
+        result_hashes for path_spec, _, result_hashes, _ in results
+        if path_spec == test_path_spec]
+    expected_hashes = {'sha256': self._EXPECTED_HASHES['sha256']}
+    self.assertEqual(hashes, [expected_hashes] * 8)
+
+    errors = [error for _, _, _, error in results]
+    self.assertEqual(errors, [None] * 9)
+
+    hashes = [
+        result_hashes for path_spec, _, result_hashes, _ in results
+        if path_spec == bogus_path_spec]
+    self.assertEqual(hashes, [None])
+
+    # An error while hashing is returned with the result.
+    data_stream_hasher.HashDataStream = _RaiseIOError
+    results = list(data_stream_hasher.HashDataStreams(
+        [(test_path_spec, '')], number_of_workers=1))
+    self.assertEqual(len(results), 1)
+
+    _, _, hashes, error = results[0]
+    self.assertIsNone(hashes)
+    self.assertIsInstance(error, IOError)
+
+    with self.assertRaises(ValueError):
+      list(data_stream_hasher.HashDataStreams(
+          data_streams, number_of_workers=0))
+
+  def testHashDataStreamsStopEarly(self):
+    """Tests the HashDataStreams function when not consumed to the end."""
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    data_streams = [(test_path_spec, '')] * 32
+
+    data_stream_hasher = hasher.DataStreamHasher(hash_names=['sha256'])
+
+    number_of_threads = threading.active_count()
+
+    # The workers are stopped when the caller stops after the first result.
+    results = data_stream_hasher.HashDataStreams(
+        data_streams, number_of_workers=3)
+    for _, _, hashes, _ in results:
+      self.assertIsNotNone(hashes)
+      break
+
+    results.close()
+    self.assertEqual(threading.active_count(), number_of_threads)
+
+    # The workers are stopped when the data streams cannot be iterated.
+    def _GenerateDataStreams():
+      """Yields a data stream and then raises an IOError."""
+      yield test_path_spec, ''
+      raise IOError('Unable to retrieve data streams.')
+
+    with self.assertRaises(IOError):
+      list(data_stream_hasher.HashDataStreams(
+          _GenerateDataStreams(), number_of_workers=3))
+
+    self.assertEqual(threading.active_count(), number_of_threads)
+
+  def testHashFileObject(self):
+    """Tests the HashFileObject function."""
+    resolver_context = context.Context()
+    file_object = fake_file_io.FakeFile(resolver_context, b'A' * 5000)
+    file_object.open(path_spec=fake_path_spec.FakePathSpec(location='/a'))
+
+    for read_ahead in (False, True):
+      data_stream_hasher = hasher.DataStreamHasher(
+          hash_names=['md5'], read_ahead=read_ahead, read_buffer_size=512)
+
+      file_object.seek(0)
+      hashes, number_of_bytes = data_stream_hasher.HashFileObject(file_object)
+      self.assertEqual(hashes, {'md5': '1811ed45a571e515ed0faefc29f27026'})
+      self.assertEqual(number_of_bytes, 5000)
+
+    file_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
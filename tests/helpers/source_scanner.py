@@ -4,6 +4,9 @@
 
 from __future__ import unicode_literals
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from dfvfs.helpers import source_scanner
@@ -11,6 +14,7 @@ from dfvfs.lib import definitions
 from dfvfs.lib import errors
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.path import fake_path_spec
+from dfvfs.resolver import context
 from dfvfs.resolver import resolver
 from dfvfs.volume import tsk_volume_system
 
@@ -318,6 +322,47 @@ class SourceScannerTest(shared_test_lib.BaseTestCase):
         volume_system)
     self.assertEqual(volume_identifiers, ['p1', 'p2'])
 
+  def testScanChangedFile(self):
+    """Test the Scan function on a file that changed between scans."""
+    qcow_test_path = self._GetTestFilePath(['image.qcow2'])
+    self._SkipIfPathNotExists(qcow_test_path)
+
+    syslog_test_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(syslog_test_path)
+
+    resolver_context = context.Context()
+    test_source_scanner = source_scanner.SourceScanner(
+        resolver_context=resolver_context)
+
+    temp_directory = tempfile.mkdtemp()
+    try:
+      test_path = os.path.join(temp_directory, 'source')
+      shutil.copyfile(qcow_test_path, test_path)
+
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(test_path)
+
+      test_source_scanner.Scan(scan_context)
+      scan_node = scan_context.GetRootScanNode().sub_nodes[0]
+      self.assertEqual(scan_node.type_indicator, definitions.TYPE_INDICATOR_QCOW)
+
+      # pylint: disable=protected-access
+      self.assertIsNone(test_source_scanner._type_indicators_cache)
+
+      resolver_context.Empty()
+      shutil.copyfile(syslog_test_path, test_path)
+
+      scan_context = source_scanner.SourceScannerContext()
+      scan_context.OpenSourcePath(test_path)
+
+      test_source_scanner.Scan(scan_context)
+      scan_node = scan_context.GetRootScanNode()
+      self.assertEqual(scan_node.type_indicator, definitions.TYPE_INDICATOR_OS)
+      self.assertEqual(scan_node.sub_nodes, [])
+
+    finally:
+      shutil.rmtree(temp_directory, True)
+
   def testScanOnAPFS(self):
     """Test the Scan function on an APFS image."""
     test_path = self._GetTestFilePath(['apfs.dmg'])
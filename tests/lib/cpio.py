@@ -187,6 +187,34 @@ class CPIOArchiveFileTest(shared_test_lib.BaseTestCase):
       test_file.Close()
       file_io_object.close()
 
+  def testGetSubFileEntriesOnBinary(self):
+    """Tests the GetSubFileEntries function on binary format."""
+    test_file = cpio.CPIOArchiveFile()
+
+    test_file_path = self._GetTestFilePath(['syslog.bin.cpio'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      file_io_object = file_object_io.FileObjectIO(
+          None, file_object=file_object)
+      file_io_object.open()
+
+      test_file.Open(file_io_object)
+
+      file_entries = test_file.GetSubFileEntries('')
+      self.assertEqual(len(file_entries), 1)
+      self.assertEqual(file_entries[0].path, 'syslog')
+
+      file_entries = test_file.GetSubFileEntries('syslog')
+      self.assertEqual(len(file_entries), 0)
+
+      test_file.Close()
+
+      file_entries = test_file.GetSubFileEntries('')
+      self.assertEqual(len(file_entries), 0)
+
+      file_io_object.close()
+
   # TODO: add tests for FileEntryExistsByPath
   # TODO: add tests for GetFileEntries
   # TODO: add tests for GetFileEntryByPath
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the archive file directory index helper functions."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.lib import directory_index
+
+from tests import test_lib as shared_test_lib
+
+
+class DirectoryIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the index of the directory entries of an archive file."""
+
+  def testGetIndexLocation(self):
+    """Tests the GetIndexLocation function."""
+    test_index = directory_index.DirectoryIndex()
+
+    self.assertEqual(test_index.GetIndexLocation('/'), '/')
+    self.assertEqual(test_index.GetIndexLocation('//'), '/')
+    self.assertEqual(test_index.GetIndexLocation('/folder/'), '/folder')
+    self.assertEqual(test_index.GetIndexLocation('/folder'), '/folder')
+
+  def testGetSubLocations(self):
+    """Tests the AddPath and GetSubLocations functions."""
+    test_index = directory_index.DirectoryIndex()
+    test_index.AddPath('folder/a_file')
+    test_index.AddPath('folder/')
+    test_index.AddPath('file')
+
+    self.assertEqual(test_index.GetSubLocations('/'), ['/folder', '/file'])
+    self.assertEqual(
+        test_index.GetSubLocations('/folder/'), ['/folder/a_file'])
+    self.assertEqual(test_index.GetSubLocations('/file'), [])
+    self.assertEqual(test_index.GetSubLocations('/bogus'), [])
+
+  def testGetSubLocationsWithMarkedDirectories(self):
+    """Tests the GetSubLocations function with marked directories."""
+    test_index = directory_index.DirectoryIndex(mark_directories=True)
+    test_index.AddPath('folder/a_file')
+    test_index.AddPath('empty/')
+    test_index.AddPath('file')
+
+    self.assertEqual(
+        test_index.GetSubLocations('/'), ['/folder/', '/empty/', '/file'])
+    self.assertEqual(
+        test_index.GetSubLocations('/folder'), ['/folder/a_file'])
+
+  def testHasDirectory(self):
+    """Tests the HasDirectory function."""
+    test_index = directory_index.DirectoryIndex()
+    test_index.AddPath('folder/a_file')
+
+    self.assertTrue(test_index.HasDirectory('/'))
+    self.assertTrue(test_index.HasDirectory('/folder/'))
+    self.assertFalse(test_index.HasDirectory('/folder/a_file'))
+    self.assertFalse(test_index.HasDirectory('/bogus'))
+
+
+if __name__ == '__main__':
+  unittest.main()
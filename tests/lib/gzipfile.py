@@ -10,9 +10,82 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.file_io import os_file_io
+from dfvfs.lib import gzipfile
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+
+from tests import test_lib as shared_test_lib
+
 
 # TODO: add tests for _GzipDecompressorState
-# TODO: add tests for GzipMember
+
+
+class TestGzipMember(gzipfile.GzipMember):
+  """Gzip member with small access point spacing for testing."""
+
+  _ACCESS_POINT_SPACING = 4096
+
+  _COMPRESSED_DATA_READ_SIZE = 1024
+
+  _UNCOMPRESSED_DATA_CACHE_SIZE = 8192
+
+
+class GzipMemberTest(shared_test_lib.BaseTestCase):
+  """Tests for the gzip member."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath(['fsevents_000000000000b208'])
+    self._SkipIfPathNotExists(test_file)
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+
+  def testAccessPoints(self):
+    """Tests reading with access points."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._os_path_spec)
+
+    member = TestGzipMember(file_object, 0, 0)
+    self.assertGreater(member.GetNumberOfAccessPoints(), 1)
+
+    expected_data = b''
+    offset = 0
+    while offset < member.uncompressed_data_size:
+      data = member.ReadAtOffset(offset)
+      self.assertTrue(data)
+
+      expected_data = b''.join([expected_data, data])
+      offset += len(data)
+
+    self.assertEqual(len(expected_data), member.uncompressed_data_size)
+
+    for offset in (20000, 100, 12345, 0, 24000, 4096):
+      data = member.ReadAtOffset(offset, 64)
+      self.assertEqual(data, expected_data[offset:offset + 64])
+
+    file_object.close()
+
+  def testInitializeFromIndex(self):
+    """Tests initializing a member with values from an index."""
+    file_object = os_file_io.OSFile(self._resolver_context)
+    file_object.open(path_spec=self._os_path_spec)
+
+    member = gzipfile.GzipMember(file_object, 0, 0)
+
+    indexed_member = gzipfile.GzipMember(
+        file_object, 0, 0, member_end_offset=member.member_end_offset,
+        uncompressed_data_size=member.uncompressed_data_size)
+    self.assertEqual(indexed_member.member_end_offset, member.member_end_offset)
+    self.assertEqual(
+        indexed_member.uncompressed_data_size, member.uncompressed_data_size)
+    self.assertEqual(indexed_member.GetNumberOfAccessPoints(), 0)
+
+    self.assertEqual(
+        indexed_member.ReadAtOffset(16, 32), member.ReadAtOffset(16, 32))
+
+    file_object.close()
 
 
 if __name__ == '__main__':
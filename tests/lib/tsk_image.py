@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the SleuthKit (TSK) image support helper functions."""
+
+from __future__ import unicode_literals
+
+import os
+import unittest
+
+from dfvfs.lib import tsk_image
+from dfvfs.path import os_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class TSKFileSystemImageTest(shared_test_lib.BaseTestCase):
+  """Tests for the pytsk3 image object using a file-like object."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._file_object = resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=self._resolver_context)
+    self._file_object.seek(0, os.SEEK_SET)
+    self._expected_data = self._file_object.read()
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_object.close()
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    with self.assertRaises(ValueError):
+      tsk_image.TSKFileSystemImage(None)
+
+    with self.assertRaises(ValueError):
+      tsk_image.TSKFileSystemImage(self._file_object, block_size=0)
+
+    with self.assertRaises(ValueError):
+      tsk_image.TSKFileSystemImage(
+          self._file_object, maximum_number_of_cached_blocks=-1)
+
+  def testRead(self):
+    """Tests the read function."""
+    tsk_image_object = tsk_image.TSKFileSystemImage(
+        self._file_object, block_size=256, maximum_number_of_cached_blocks=3)
+
+    self.assertEqual(tsk_image_object.get_size(), 1247)
+
+    data = tsk_image_object.read(500, 100)
+    self.assertEqual(data, self._expected_data[500:600])
+    self.assertEqual(tsk_image_object.number_of_cache_hits, 0)
+    self.assertEqual(tsk_image_object.number_of_cache_misses, 2)
+
+    data = tsk_image_object.read(510, 10)
+    self.assertEqual(data, self._expected_data[510:520])
+    self.assertEqual(tsk_image_object.number_of_cache_hits, 2)
+    self.assertEqual(tsk_image_object.number_of_cache_misses, 2)
+
+    # The last block is smaller than the block size and is not cached.
+    # pylint: disable=protected-access
+    data = tsk_image_object.read(1200, 100)
+    self.assertEqual(data, self._expected_data[1200:])
+    self.assertEqual(tsk_image_object.number_of_cache_misses, 3)
+    self.assertEqual(list(tsk_image_object._cached_blocks.keys()), [1, 2])
+
+    # Read beyond the end of the data.
+    data = tsk_image_object.read(2048, 100)
+    self.assertEqual(data, b'')
+    self.assertEqual(tsk_image_object.number_of_cache_misses, 3)
+    self.assertEqual(list(tsk_image_object._cached_blocks.keys()), [1, 2])
+
+    # Caching block 3 evicts the least recently used block 0.
+    data = tsk_image_object.read(0, len(self._expected_data))
+    self.assertEqual(data, self._expected_data)
+    self.assertEqual(tsk_image_object.number_of_cache_hits, 4)
+    self.assertEqual(tsk_image_object.number_of_cache_misses, 6)
+    self.assertEqual(list(tsk_image_object._cached_blocks.keys()), [1, 2, 3])
+
+    tsk_image_object.read(0, 10)
+    self.assertEqual(tsk_image_object.number_of_cache_misses, 7)
+
+    tsk_image_object.close()
+
+  def testReadWithoutCache(self):
+    """Tests the read function with the cache disabled."""
+    tsk_image_object = tsk_image.TSKFileSystemImage(self._file_object)
+
+    data = tsk_image_object.read(500, 100)
+    self.assertEqual(data, self._expected_data[500:600])
+    self.assertEqual(tsk_image_object.number_of_cache_hits, 0)
+    self.assertEqual(tsk_image_object.number_of_cache_misses, 0)
+
+    tsk_image_object.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
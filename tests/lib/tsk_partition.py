@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the SleuthKit (TSK) partition support helper functions."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+import pytsk3
+
+from dfvfs.lib import tsk_image
+from dfvfs.lib import tsk_partition
+from dfvfs.path import os_path_spec
+from dfvfs.path import tsk_partition_path_spec
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+from tests import test_lib as shared_test_lib
+
+
+class TSKPartitionTableTest(shared_test_lib.BaseTestCase):
+  """Tests for the TSK partition table."""
+
+  def setUp(self):
+    """Sets up the needed objects used throughout the test."""
+    self._resolver_context = context.Context()
+    test_file = self._GetTestFilePath(['tsk_volume_system.raw'])
+    self._SkipIfPathNotExists(test_file)
+
+    self._os_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    self._file_object = resolver.Resolver.OpenFileObject(
+        self._os_path_spec, resolver_context=self._resolver_context)
+
+    tsk_image_object = tsk_image.TSKFileSystemImage(self._file_object)
+    self._tsk_volume = pytsk3.Volume_Info(tsk_image_object)
+
+  def tearDown(self):
+    """Cleans up the needed objects used throughout the test."""
+    self._file_object.close()
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    partition_table = tsk_partition.TSKPartitionTable(self._tsk_volume)
+
+    self.assertEqual(partition_table.bytes_per_sector, 512)
+    self.assertEqual(partition_table.number_of_parts, 7)
+
+    locations = [
+        partition_table.GetLocation(part_index)
+        for part_index in range(partition_table.number_of_parts)]
+    self.assertEqual(
+        locations, [None, None, '/p1', None, None, None, '/p2'])
+
+    self.assertEqual(partition_table.GetStartOffset(2), 512)
+    self.assertEqual(partition_table.GetStartOffset(6), 180224)
+
+  def testGetTSKVsPartByPathSpec(self):
+    """Tests the GetTSKVsPartByPathSpec function."""
+    partition_table = tsk_partition.TSKPartitionTable(self._tsk_volume)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        location='/p2', parent=self._os_path_spec)
+    tsk_vs_part, partition_index = partition_table.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertEqual(tsk_vs_part, partition_table.GetTSKVsPart(6))
+    self.assertEqual(partition_index, 1)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        part_index=2, parent=self._os_path_spec)
+    tsk_vs_part, partition_index = partition_table.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertEqual(tsk_vs_part, partition_table.GetTSKVsPart(2))
+    self.assertEqual(partition_index, 1)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        start_offset=180224, parent=self._os_path_spec)
+    tsk_vs_part, partition_index = partition_table.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertEqual(tsk_vs_part, partition_table.GetTSKVsPart(6))
+    self.assertEqual(partition_index, 2)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        part_index=0, parent=self._os_path_spec)
+    tsk_vs_part, partition_index = partition_table.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertEqual(tsk_vs_part, partition_table.GetTSKVsPart(0))
+    self.assertIsNone(partition_index)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        location='/p9', parent=self._os_path_spec)
+    tsk_vs_part, partition_index = partition_table.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertIsNone(tsk_vs_part)
+    self.assertIsNone(partition_index)
+
+    path_spec = tsk_partition_path_spec.TSKPartitionPathSpec(
+        part_index=99, parent=self._os_path_spec)
+    tsk_vs_part, partition_index = partition_table.GetTSKVsPartByPathSpec(
+        path_spec)
+    self.assertIsNone(tsk_vs_part)
+    self.assertIsNone(partition_index)
+
+
+if __name__ == '__main__':
+  unittest.main()
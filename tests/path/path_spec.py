@@ -37,7 +37,25 @@ class PathSpecTest(test_lib.PathSpecTestCase):
       path_spec.PathSpec()
 
   # TODO: add tests for __eq__
-  # TODO: add tests for __hash__
+
+  def testHash(self):
+    """Tests the __hash__ function."""
+    test_path_spec = TestPathSpec()
+    self.assertEqual(hash(test_path_spec), hash('type: test\n'))
+
+    test_path_spec.Freeze()
+    self.assertEqual(hash(test_path_spec), hash('type: test\n'))
+
+  def testSetAttr(self):
+    """Tests the __setattr__ function."""
+    test_path_spec = TestPathSpec()
+    test_path_spec.attribute = 'OtherAttribute'
+    self.assertEqual(test_path_spec.attribute, 'OtherAttribute')
+
+    test_path_spec.Freeze()
+
+    with self.assertRaises(AttributeError):
+      test_path_spec.attribute = 'MyAttribute'
 
   def testGetComparable(self):
     """Tests the _GetComparable function."""
@@ -52,6 +70,18 @@ class PathSpecTest(test_lib.PathSpecTestCase):
 
     self.assertEqual(test_path_spec.comparable, 'type: test\n')
 
+  def testComparableFrozen(self):
+    """Tests the comparable property of a frozen path specification."""
+    parent_path_spec = TestPathSpec()
+    test_path_spec = TestPathSpec(parent=parent_path_spec)
+
+    expected_comparable = 'type: test\ntype: test\n'
+    self.assertEqual(test_path_spec.comparable, expected_comparable)
+
+    test_path_spec.Freeze()
+    self.assertEqual(test_path_spec.comparable, expected_comparable)
+    self.assertIs(test_path_spec.comparable, test_path_spec.comparable)
+
   def testTypeIndicator(self):
     """Tests the type_indicator property."""
     test_path_spec = TestPathSpec()
@@ -65,6 +95,21 @@ class PathSpecTest(test_lib.PathSpecTestCase):
     test_dict = test_path_spec.CopyToDict()
     self.assertEqual(test_dict, {'attribute': 'MyAttribute'})
 
+  def testFreeze(self):
+    """Tests the Freeze function."""
+    parent_path_spec = TestPathSpec()
+    test_path_spec = TestPathSpec(parent=parent_path_spec)
+
+    self.assertFalse(test_path_spec.IsFrozen())
+
+    result_path_spec = test_path_spec.Freeze()
+    self.assertIs(result_path_spec, test_path_spec)
+    self.assertTrue(test_path_spec.IsFrozen())
+    self.assertTrue(parent_path_spec.IsFrozen())
+
+    with self.assertRaises(AttributeError):
+      parent_path_spec.attribute = 'OtherAttribute'
+
   def testHasParent(self):
     """Tests the HasParent function."""
     test_path_spec = TestPathSpec()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the read-ahead path specification implementation."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.path import read_ahead_path_spec
+
+from tests.path import test_lib
+
+
+class ReadAheadPathSpecTest(test_lib.PathSpecTestCase):
+  """Tests for the read-ahead path specification implementation."""
+
+  def testInitialize(self):
+    """Tests the path specification initialization."""
+    path_spec = read_ahead_path_spec.ReadAheadPathSpec(parent=self._path_spec)
+
+    self.assertIsNotNone(path_spec)
+
+    path_spec = read_ahead_path_spec.ReadAheadPathSpec(
+        chunk_size=64, number_of_chunks=4, parent=self._path_spec)
+
+    self.assertIsNotNone(path_spec)
+
+    with self.assertRaises(ValueError):
+      read_ahead_path_spec.ReadAheadPathSpec(parent=None)
+
+    with self.assertRaises(ValueError):
+      read_ahead_path_spec.ReadAheadPathSpec(
+          chunk_size=0, parent=self._path_spec)
+
+    with self.assertRaises(ValueError):
+      read_ahead_path_spec.ReadAheadPathSpec(
+          number_of_chunks=0, parent=self._path_spec)
+
+    with self.assertRaises(ValueError):
+      read_ahead_path_spec.ReadAheadPathSpec(
+          parent=self._path_spec, bogus='BOGUS')
+
+  def testComparable(self):
+    """Tests the path specification comparable property."""
+    path_spec = read_ahead_path_spec.ReadAheadPathSpec(parent=self._path_spec)
+
+    self.assertIsNotNone(path_spec)
+
+    expected_comparable = '\n'.join([
+        'type: TEST',
+        'type: READ_AHEAD',
+        ''])
+
+    self.assertEqual(path_spec.comparable, expected_comparable)
+
+    path_spec = read_ahead_path_spec.ReadAheadPathSpec(
+        chunk_size=64, number_of_chunks=4, parent=self._path_spec)
+
+    self.assertIsNotNone(path_spec)
+
+    expected_comparable = '\n'.join([
+        'type: TEST',
+        'type: READ_AHEAD, chunk size: 64, number of chunks: 4',
+        ''])
+
+    self.assertEqual(path_spec.comparable, expected_comparable)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -132,6 +132,61 @@ class ObjectsCacheTest(unittest.TestCase):
     self.assertEqual(identifier, self._path_spec.comparable)
     self.assertEqual(cache_value.vfs_object, self._vfs_object)
 
+    identifier, cache_value = cache_object.GetCacheValueByObject(
+        TestVFSObject())
+    self.assertIsNone(identifier)
+    self.assertIsNone(cache_value)
+
+    cache_object.RemoveObject(self._path_spec.comparable)
+
+    identifier, cache_value = cache_object.GetCacheValueByObject(
+        self._vfs_object)
+    self.assertIsNone(identifier)
+    self.assertIsNone(cache_value)
+
+  def testGetLeastRecentlyUsedDereferencedValue(self):
+    """Tests the GetLeastRecentlyUsedDereferencedValue method."""
+    cache_object = cache.ObjectsCache(2)
+
+    identifier, cache_value = (
+        cache_object.GetLeastRecentlyUsedDereferencedValue())
+    self.assertIsNone(identifier)
+    self.assertIsNone(cache_value)
+
+    path_spec = fake_path_spec.FakePathSpec(location='2')
+    vfs_object = TestVFSObject()
+
+    cache_object.CacheObject(self._path_spec.comparable, self._vfs_object)
+    cache_object.CacheObject(path_spec.comparable, vfs_object)
+    cache_object.GrabObject(self._path_spec.comparable)
+    cache_object.GrabObject(path_spec.comparable)
+
+    identifier, cache_value = (
+        cache_object.GetLeastRecentlyUsedDereferencedValue())
+    self.assertIsNone(identifier)
+
+    cache_object.ReleaseObject(path_spec.comparable)
+    cache_object.ReleaseObject(self._path_spec.comparable)
+
+    identifier, cache_value = (
+        cache_object.GetLeastRecentlyUsedDereferencedValue())
+    self.assertEqual(identifier, path_spec.comparable)
+    self.assertEqual(cache_value.vfs_object, vfs_object)
+
+    cache_object.RemoveObject(path_spec.comparable)
+
+    identifier, cache_value = (
+        cache_object.GetLeastRecentlyUsedDereferencedValue())
+    self.assertEqual(identifier, self._path_spec.comparable)
+
+  def testIsFull(self):
+    """Tests the IsFull method."""
+    cache_object = cache.ObjectsCache(1)
+    self.assertFalse(cache_object.IsFull())
+
+    cache_object.CacheObject(self._path_spec.comparable, self._vfs_object)
+    self.assertTrue(cache_object.IsFull())
+
   def testGrabAndRelease(self):
     """Tests the GrabObject and ReleaseObject methods."""
     cache_object = cache.ObjectsCache(1)
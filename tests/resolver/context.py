@@ -4,13 +4,23 @@
 
 from __future__ import unicode_literals
 
+import threading
 import unittest
 
 from dfvfs.file_io import fake_file_io
+from dfvfs.lib import definitions
+from dfvfs.lib import errors
+from dfvfs.lib import sqlite_database
+from dfvfs.path import ewf_path_spec
 from dfvfs.path import fake_path_spec
+from dfvfs.path import os_path_spec
+from dfvfs.path import tsk_path_spec
 from dfvfs.resolver import context
+from dfvfs.resolver import resolver
 from dfvfs.vfs import fake_file_system
 
+from tests import test_lib as shared_test_lib
+
 
 class ContextTest(unittest.TestCase):
   """Tests for the resolver context object."""
@@ -71,6 +81,243 @@ class ContextTest(unittest.TestCase):
     resolver_context.ReleaseFileSystem(file_system)
     self.assertEqual(len(resolver_context._file_system_cache._values), 0)
 
+  def testCacheSQLiteDatabase(self):
+    """Tests the cache SQLite database object functionality."""
+    resolver_context = context.Context()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/database.db')
+    database_object = sqlite_database.SQLiteDatabaseFile()
+
+    resolver_context.CacheSQLiteDatabase(path_spec, database_object)
+    self.assertEqual(
+        resolver_context.GetSQLiteDatabase(path_spec), database_object)
+
+    resolver_context.GrabSQLiteDatabase(path_spec)
+    resolver_context.GrabSQLiteDatabase(path_spec)
+
+    resolver_context.ReleaseSQLiteDatabase(database_object)
+    self.assertEqual(
+        resolver_context.GetSQLiteDatabase(path_spec), database_object)
+
+    # The dereferenced SQLite database object is kept in the cache.
+    resolver_context.ReleaseSQLiteDatabase(database_object)
+    self.assertEqual(
+        resolver_context.GetSQLiteDatabase(path_spec), database_object)
+
+    with self.assertRaises(RuntimeError):
+      resolver_context.ReleaseSQLiteDatabase(database_object)
+
+    resolver_context.Empty()
+    self.assertIsNone(resolver_context.GetSQLiteDatabase(path_spec))
+
+    # The least recently used dereferenced SQLite database object is evicted
+    # when the cache is full.
+    resolver_context = context.Context()
+
+    # pylint: disable=protected-access
+    resolver_context._sqlite_database_cache.SetMaximumNumberOfCachedValues(2)
+
+    path_specs = []
+    for location in ('/a.db', '/b.db', '/c.db'):
+      path_spec = fake_path_spec.FakePathSpec(location=location)
+      database_object = sqlite_database.SQLiteDatabaseFile()
+      resolver_context.CacheSQLiteDatabase(path_spec, database_object)
+      resolver_context.GrabSQLiteDatabase(path_spec)
+      resolver_context.ReleaseSQLiteDatabase(database_object)
+      path_specs.append(path_spec)
+
+    self.assertIsNone(resolver_context.GetSQLiteDatabase(path_specs[0]))
+    self.assertIsNotNone(resolver_context.GetSQLiteDatabase(path_specs[1]))
+    self.assertIsNotNone(resolver_context.GetSQLiteDatabase(path_specs[2]))
+
+  def testEvictionPolicyLRU(self):
+    """Tests the LRU eviction policy."""
+    with self.assertRaises(ValueError):
+      context.Context(eviction_policy='bogus')
+
+    resolver_context = context.Context(
+        maximum_number_of_file_objects=2,
+        eviction_policy=definitions.CACHE_EVICTION_POLICY_LRU)
+
+    file_objects = []
+    for location in ('/a', '/b', '/c'):
+      path_spec = fake_path_spec.FakePathSpec(location=location)
+      file_object = fake_file_io.FakeFile(resolver_context, b'data')
+      file_object.open(path_spec=path_spec)
+      file_objects.append((path_spec, file_object))
+
+      if location == '/a':
+        # Dereferenced file-like objects are kept open in the cache.
+        file_object.close()
+        self.assertEqual(resolver_context.GetFileObject(path_spec), file_object)
+        self.assertEqual(
+            resolver_context.GetFileObjectReferenceCount(path_spec), 0)
+
+    # Caching /c evicted the dereferenced /a.
+    path_spec, file_object = file_objects[0]
+    self.assertIsNone(resolver_context.GetFileObject(path_spec))
+    with self.assertRaises(IOError):
+      file_object.get_size()
+
+    # Both /b and /c are referenced so nothing can be evicted.
+    path_spec = fake_path_spec.FakePathSpec(location='/d')
+    file_object = fake_file_io.FakeFile(resolver_context, b'data')
+    with self.assertRaises(errors.CacheFullError):
+      file_object.open(path_spec=path_spec)
+
+    path_spec, file_object = file_objects[1]
+    file_object.close()
+
+    result = resolver_context.ForceRemoveFileObject(path_spec)
+    self.assertTrue(result)
+    self.assertIsNone(resolver_context.GetFileObject(path_spec))
+
+  def testEvictionPolicyLRUReopen(self):
+    """Tests reopening a file-like object kept open by the LRU policy."""
+    resolver_context = context.Context(
+        eviction_policy=definitions.CACHE_EVICTION_POLICY_LRU)
+
+    path_spec = fake_path_spec.FakePathSpec(location='/a')
+    file_object = fake_file_io.FakeFile(resolver_context, b'data')
+    file_object.open(path_spec=path_spec)
+    file_object.read(2)
+    file_object.close()
+
+    self.assertEqual(resolver_context.GetFileObject(path_spec), file_object)
+
+    # A reopened file-like object is reset to the start of the data.
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.get_offset(), 0)
+    file_object.read(2)
+
+    # A file-like object that is still referenced keeps its offset.
+    file_object.open(path_spec=path_spec)
+    self.assertEqual(file_object.get_offset(), 2)
+
+    file_object.close()
+    file_object.close()
+
+    # Emptying the context closes the file-like objects kept open.
+    resolver_context.Empty()
+    self.assertIsNone(resolver_context.GetFileObject(path_spec))
+    with self.assertRaises(IOError):
+      file_object.get_size()
+
+  def testGetMaximumNumberOfTSKImageBlocks(self):
+    """Tests the GetMaximumNumberOfTSKImageBlocks function."""
+    resolver_context = context.Context()
+    self.assertIsNone(resolver_context.GetMaximumNumberOfTSKImageBlocks())
+
+    resolver_context = context.Context(maximum_number_of_tsk_image_blocks=64)
+    self.assertEqual(resolver_context.GetMaximumNumberOfTSKImageBlocks(), 64)
+
+    with self.assertRaises(ValueError):
+      context.Context(maximum_number_of_tsk_image_blocks=-1)
+
+  def testGetMemoryMapThreshold(self):
+    """Tests the GetMemoryMapThreshold function."""
+    resolver_context = context.Context()
+    self.assertIsNone(resolver_context.GetMemoryMapThreshold())
+
+    resolver_context = context.Context(memory_map_threshold=1024)
+    self.assertEqual(resolver_context.GetMemoryMapThreshold(), 1024)
+
+    with self.assertRaises(ValueError):
+      context.Context(memory_map_threshold=-1)
+
+
+class ThreadSafeContextTest(shared_test_lib.BaseTestCase):
+  """Tests for the thread-safe resolver context object."""
+
+  _NUMBER_OF_ITERATIONS = 25
+  _NUMBER_OF_THREADS = 8
+
+  def testCacheFileObject(self):
+    """Tests that cached file-like objects are per thread."""
+    resolver_context = context.ThreadSafeContext()
+
+    path_spec = fake_path_spec.FakePathSpec(location='/empty.txt')
+    file_object = fake_file_io.FakeFile(resolver_context, b'')
+
+    resolver_context.CacheFileObject(path_spec, file_object)
+    self.assertEqual(resolver_context.GetFileObject(path_spec), file_object)
+
+    cached_objects = []
+    thread = threading.Thread(
+        target=lambda: cached_objects.append(
+            resolver_context.GetFileObject(path_spec)))
+    thread.start()
+    thread.join()
+
+    self.assertEqual(cached_objects, [None])
+
+    resolver_context.GrabFileObject(path_spec)
+
+    # Releasing is not bound to the thread that cached the file-like object.
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(
+            resolver_context.ReleaseFileObject(file_object)))
+    thread.start()
+    thread.join()
+
+    self.assertEqual(results, [True])
+    self.assertIsNone(resolver_context.GetFileObject(path_spec))
+
+  def testOpenFileObjectConcurrently(self):
+    """Tests opening the same path specification from multiple threads."""
+    test_file = self._GetTestFilePath(['image.E01'])
+    self._SkipIfPathNotExists(test_file)
+
+    path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = ewf_path_spec.EWFPathSpec(parent=path_spec)
+    path_spec = tsk_path_spec.TSKPathSpec(
+        location='/passwords.txt', parent=path_spec)
+
+    resolver_context = context.ThreadSafeContext()
+
+    file_object = resolver.Resolver.OpenFileObject(
+        path_spec, resolver_context=resolver_context)
+    expected_data = file_object.read()
+    file_object.close()
+
+    self.assertEqual(len(expected_data), 116)
+
+    exceptions = []
+
+    def _ReadFileObject():
+      """Opens, reads and closes the file-like object repeatedly."""
+      try:
+        for _ in range(self._NUMBER_OF_ITERATIONS):
+          file_object = resolver.Resolver.OpenFileObject(
+              path_spec, resolver_context=resolver_context)
+          try:
+            for offset in (64, 0, 100):
+              file_object.seek(offset)
+              data = file_object.read(16)
+              if data != expected_data[offset:offset + 16]:
+                raise AssertionError(
+                    'Unexpected data at offset: {0:d}'.format(offset))
+          finally:
+            file_object.close()
+
+      except Exception as exception:  # pylint: disable=broad-except
+        exceptions.append(exception)
+
+    threads = [
+        threading.Thread(target=_ReadFileObject)
+        for _ in range(self._NUMBER_OF_THREADS)]
+
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual(exceptions, [])
+
+    # pylint: disable=protected-access
+    self.assertEqual(len(resolver_context._file_object_cache._values), 0)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -6,6 +6,7 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.resolver_helpers import manager
 
 from tests import test_lib as shared_test_lib
@@ -17,6 +18,17 @@ class ResolverHelperManagerTest(shared_test_lib.BaseTestCase):
 
   # pylint: disable=protected-access
 
+  def testGetHelper(self):
+    """Tests the GetHelper function."""
+    resolver_helper = manager.ResolverHelperManager.GetHelper(
+        definitions.TYPE_INDICATOR_OS)
+    self.assertIsNotNone(resolver_helper)
+    self.assertEqual(
+        resolver_helper.type_indicator, definitions.TYPE_INDICATOR_OS)
+
+    with self.assertRaises(KeyError):
+      manager.ResolverHelperManager.GetHelper('bogus')
+
   def testHelperRegistration(self):
     """Tests the DeregisterHelper and DeregisterHelper functions."""
     number_of_resolver_helpers = len(
@@ -35,6 +47,24 @@ class ResolverHelperManagerTest(shared_test_lib.BaseTestCase):
         len(manager.ResolverHelperManager._resolver_helpers),
         number_of_resolver_helpers)
 
+  def testLazyImport(self):
+    """Tests the import times in lazy import mode."""
+    script = '\n'.join([
+        'from dfvfs.path import os_path_spec',
+        'from dfvfs.resolver import resolver',
+        'path_spec = os_path_spec.OSPathSpec(location="test_data/syslog")',
+        'resolver.Resolver.OpenFileObject(path_spec).close()'])
+
+    import_times = self._GetImportTimes(script)
+    self.assertIn('dfvfs.resolver_helpers.tsk_resolver_helper', import_times)
+
+    lazy_import_times = self._GetImportTimes(script, lazy_import=True)
+    self.assertNotIn(
+        'dfvfs.resolver_helpers.tsk_resolver_helper', lazy_import_times)
+    self.assertNotIn('pytsk3', lazy_import_times)
+
+    self.assertLess(len(lazy_import_times), len(import_times))
+
 
 if __name__ == '__main__':
   unittest.main()
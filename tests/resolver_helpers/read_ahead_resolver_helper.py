@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the read-ahead resolver helper implementation."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from dfvfs.resolver_helpers import read_ahead_resolver_helper
+
+from tests.resolver_helpers import test_lib
+
+
+class ReadAheadResolverHelperTest(test_lib.ResolverHelperTestCase):
+  """Tests for the read-ahead resolver helper implementation."""
+
+  def testNewFileObject(self):
+    """Tests the NewFileObject function."""
+    resolver_helper_object = (
+        read_ahead_resolver_helper.ReadAheadResolverHelper())
+    self._TestNewFileObject(resolver_helper_object)
+
+  def testNewFileSystem(self):
+    """Tests the NewFileSystem function."""
+    resolver_helper_object = (
+        read_ahead_resolver_helper.ReadAheadResolverHelper())
+    self._TestNewFileSystemRaisesNotSupported(resolver_helper_object)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -4,6 +4,8 @@
 from __future__ import unicode_literals
 
 import os
+import subprocess
+import sys
 import unittest
 
 
@@ -34,6 +36,43 @@ class BaseTestCase(unittest.TestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), sorted(expected_sub_file_entry_names))
 
+  def _GetImportTimes(self, script, lazy_import=False):
+    """Retrieves the import times of the modules imported by a script.
+
+    The script is run in a separate Python interpreter with "-X importtime".
+
+    Args:
+      script (str): Python script to run.
+      lazy_import (Optional[bool]): True if the script should be run in
+          lazy import mode.
+
+    Returns:
+      dict[str, int]: cumulative import time, in microseconds, per module name.
+
+    Raises:
+      SkipTest: if the Python version does not support "-X importtime".
+    """
+    if sys.version_info[0:2] < (3, 7):
+      raise unittest.SkipTest('-X importtime not supported')
+
+    _, error_output = self._RunPythonScript(
+        script, interpreter_options=['-X', 'importtime'],
+        lazy_import=lazy_import)
+
+    import_times = {}
+    for line in error_output.split('\n'):
+      if not line.startswith('import time:'):
+        continue
+
+      _, cumulative_time, module_name = line[12:].split('|')
+      try:
+        import_times[module_name.strip()] = int(cumulative_time, 10)
+      except ValueError:
+        # The line is the header.
+        pass
+
+    return import_times
+
   def _GetTestFilePath(self, path_segments):
     """Retrieves the path of a test file in the test data directory.
 
@@ -47,6 +86,40 @@ class BaseTestCase(unittest.TestCase):
     # and not a list.
     return os.path.join(self._TEST_DATA_PATH, *path_segments)
 
+  def _RunPythonScript(
+      self, script, arguments=None, interpreter_options=None,
+      lazy_import=False):
+    """Runs a script in a separate Python interpreter.
+
+    Args:
+      script (str): Python script to run.
+      arguments (Optional[list[str]]): arguments of the script.
+      interpreter_options (Optional[list[str]]): options of the Python
+          interpreter.
+      lazy_import (Optional[bool]): True if the script should be run in
+          lazy import mode.
+
+    Returns:
+      tuple[str, str]: output and error output of the script.
+    """
+    environment = dict(os.environ)
+    environment.pop('DFVFS_LAZY_IMPORT', None)
+    if lazy_import:
+      environment['DFVFS_LAZY_IMPORT'] = '1'
+
+    command = [sys.executable]
+    command.extend(interpreter_options or [])
+    command.extend(['-c', script])
+    command.extend(arguments or [])
+
+    process = subprocess.Popen(
+        command, cwd=os.path.dirname(self._TEST_DATA_PATH), env=environment,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    output, error_output = process.communicate()
+    self.assertEqual(process.returncode, 0, msg=error_output)
+
+    return output.decode('utf-8'), error_output.decode('utf-8')
+
   def _SkipIfPathNotExists(self, path):
     """Skips the test if the path does not exist.
 
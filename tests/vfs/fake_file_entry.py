@@ -194,6 +194,23 @@ class FakeFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), expected_sub_file_entry_names)
 
+  def testGetSubFileEntryByNameAfterAddFileEntry(self):
+    """Test GetSubFileEntryByName after adding a file entry."""
+    path_spec = fake_path_spec.FakePathSpec(location=self._test_file)
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    self.assertIsNotNone(file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('file6.txt')
+    self.assertIsNone(sub_file_entry)
+
+    self._file_system.AddFileEntry(
+        '/test_data/testdir_fake/file6.txt', file_data=b'FILE6')
+
+    file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+    sub_file_entry = file_entry.GetSubFileEntryByName('file6.txt')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'file6.txt')
+
   def testDataStreams(self):
     """Test the data streams functionality."""
     test_file = '/test_data/testdir_fake/file1.txt'
@@ -62,6 +62,35 @@ class DataStreamTest(shared_test_lib.BaseTestCase):
     self.assertTrue(test_data_stream.IsDefault())
 
 
+class NameIndexTest(shared_test_lib.BaseTestCase):
+  """Tests the name index."""
+
+  def testGetPathSpecByName(self):
+    """Tests the AddPathSpec and GetPathSpecByName functions."""
+    name_index = file_entry.NameIndex()
+    self.assertEqual(name_index.number_of_names, 0)
+
+    path_spec1 = fake_path_spec.FakePathSpec(location='/File.txt')
+    path_spec2 = fake_path_spec.FakePathSpec(location='/file.txt')
+    name_index.AddPathSpec('File.txt', path_spec1)
+    name_index.AddPathSpec('file.txt', path_spec2)
+    self.assertEqual(name_index.number_of_names, 2)
+
+    path_spec = name_index.GetPathSpecByName('file.txt')
+    self.assertEqual(path_spec, path_spec2)
+
+    path_spec = name_index.GetPathSpecByName('FILE.TXT')
+    self.assertIsNone(path_spec)
+
+    # The first entry with a matching lower case name is returned.
+    path_spec = name_index.GetPathSpecByName('FILE.TXT', case_sensitive=False)
+    self.assertEqual(path_spec, path_spec1)
+
+    # An exact match is preferred over a case insensitive match.
+    path_spec = name_index.GetPathSpecByName('file.txt', case_sensitive=False)
+    self.assertEqual(path_spec, path_spec2)
+
+
 class DirectoryTest(shared_test_lib.BaseTestCase):
   """Tests the VFS directory interface."""
 
@@ -6,7 +6,9 @@ from __future__ import unicode_literals
 
 import unittest
 
+from dfvfs.path import fake_path_spec
 from dfvfs.resolver import context
+from dfvfs.vfs import file_entry
 from dfvfs.vfs import file_system
 
 from tests import test_lib as shared_test_lib
@@ -19,6 +21,8 @@ class TestFileSystem(file_system.FileSystem):
 
   TYPE_INDICATOR = 'test'
 
+  _MAXIMUM_NUMBER_OF_CACHED_NAMES = 4
+
 
 class FileSystemTest(shared_test_lib.BaseTestCase):
   """Tests the VFS file system object interface."""
@@ -36,6 +40,51 @@ class FileSystemTest(shared_test_lib.BaseTestCase):
   # TODO: add tests for _Close function.
   # TODO: add tests for _Open function.
   # TODO: add tests for BasenamePath function.
+
+  def testCacheNameIndex(self):
+    """Tests the CacheNameIndex and GetCachedNameIndex functions."""
+    test_file_system = TestFileSystem(self._resolver_context)
+
+    name_indexes = []
+    for location in ('/a', '/b', '/c'):
+      name_index = file_entry.NameIndex()
+      for name in ('x', 'y'):
+        name_index.AddPathSpec(name, fake_path_spec.FakePathSpec(
+            location='{0:s}/{1:s}'.format(location, name)))
+
+      path_spec = fake_path_spec.FakePathSpec(location=location)
+      name_indexes.append((path_spec, name_index))
+
+    path_spec_a, name_index_a = name_indexes[0]
+    path_spec_b, name_index_b = name_indexes[1]
+    path_spec_c, name_index_c = name_indexes[2]
+
+    test_file_system.CacheNameIndex(path_spec_a, name_index_a)
+    test_file_system.CacheNameIndex(path_spec_b, name_index_b)
+
+    self.assertEqual(
+        test_file_system.GetCachedNameIndex(path_spec_a), name_index_a)
+
+    # Caching /c exceeds the maximum number of cached names and removes the
+    # least recently used /b.
+    test_file_system.CacheNameIndex(path_spec_c, name_index_c)
+
+    self.assertEqual(
+        test_file_system.GetCachedNameIndex(path_spec_a), name_index_a)
+    self.assertIsNone(test_file_system.GetCachedNameIndex(path_spec_b))
+    self.assertEqual(
+        test_file_system.GetCachedNameIndex(path_spec_c), name_index_c)
+
+    # A name index that exceeds the maximum by itself is not cached.
+    name_index = file_entry.NameIndex()
+    for name in ('1', '2', '3', '4', '5'):
+      name_index.AddPathSpec(name, fake_path_spec.FakePathSpec(
+          location='/d/{0:s}'.format(name)))
+
+    path_spec = fake_path_spec.FakePathSpec(location='/d')
+    test_file_system.CacheNameIndex(path_spec, name_index)
+    self.assertIsNone(test_file_system.GetCachedNameIndex(path_spec))
+
   # TODO: add tests for Close function.
   # TODO: add tests for DirnamePath function.
   # TODO: add tests for GetDataStreamByPathSpec function.
@@ -315,6 +315,31 @@ class NTFSFileEntryTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(parent_file_entry.name, 'System Volume Information')
 
+  def testGetSubFileEntryByName(self):
+    """Tests the GetSubFileEntryByName function."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._ntfs_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        'System Volume Information')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'System Volume Information')
+    self.assertEqual(sub_file_entry.path_spec.mft_attribute, 2)
+    self.assertEqual(sub_file_entry.path_spec.mft_entry, 36)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        'system volume information')
+    self.assertIsNone(sub_file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        'system volume information', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'System Volume Information')
+    self.assertEqual(sub_file_entry.path_spec.mft_entry, 36)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('bogus')
+    self.assertIsNone(sub_file_entry)
+
   def testGetStat(self):
     """Tests the GetStat function."""
     test_location = (
@@ -4,8 +4,13 @@
 
 from __future__ import unicode_literals
 
+import os
+import platform
+import shutil
+import tempfile
 import unittest
 
+from dfvfs.lib import definitions
 from dfvfs.path import os_path_spec
 from dfvfs.resolver import context
 from dfvfs.vfs import os_file_entry
@@ -139,6 +144,60 @@ class OSFileEntryTest(shared_test_lib.BaseTestCase):
     self.assertEqual(
         sorted(sub_file_entry_names), expected_sub_file_entry_names)
 
+  def testSubFileEntriesTypes(self):
+    """Test the types and stat information of sub file entries."""
+    temporary_directory = tempfile.mkdtemp()
+    try:
+      os.mkdir(os.path.join(temporary_directory, 'directory'))
+      with open(os.path.join(temporary_directory, 'file'), 'wb') as file_object:
+        file_object.write(b'data')
+
+      expected_entry_types = {
+          'directory': definitions.FILE_ENTRY_TYPE_DIRECTORY,
+          'file': definitions.FILE_ENTRY_TYPE_FILE}
+
+      if hasattr(os, 'mkfifo'):
+        os.mkfifo(os.path.join(temporary_directory, 'pipe'))
+        expected_entry_types['pipe'] = definitions.FILE_ENTRY_TYPE_PIPE
+
+      if hasattr(os, 'symlink'):
+        # On Windows creating a symbolic link requires a privilege.
+        try:
+          os.symlink(
+              os.path.join(temporary_directory, 'directory'),
+              os.path.join(temporary_directory, 'link'))
+          expected_entry_types['link'] = definitions.FILE_ENTRY_TYPE_LINK
+        except OSError:
+          pass
+
+      path_spec = os_path_spec.OSPathSpec(location=temporary_directory)
+      file_entry = self._file_system.GetFileEntryByPathSpec(path_spec)
+      self.assertIsNotNone(file_entry)
+
+      entry_types = {}
+      for sub_file_entry in file_entry.sub_file_entries:
+        entry_types[sub_file_entry.name] = sub_file_entry.entry_type
+
+        # The stat information must match that of a file entry that was not
+        # created while listing the directory.
+        stat_object = sub_file_entry.GetStat()
+        expected_file_entry = self._file_system.GetFileEntryByPathSpec(
+            sub_file_entry.path_spec)
+        expected_stat_object = expected_file_entry.GetStat()
+
+        self.assertEqual(stat_object.type, expected_stat_object.type)
+        self.assertEqual(stat_object.size, expected_stat_object.size)
+        self.assertEqual(stat_object.mtime, expected_stat_object.mtime)
+
+        # The inode number is not supported on Windows.
+        if platform.system() != 'Windows':
+          self.assertEqual(stat_object.ino, expected_stat_object.ino)
+
+      self.assertEqual(entry_types, expected_entry_types)
+
+    finally:
+      shutil.rmtree(temporary_directory, True)
+
   def testDataStreams(self):
     """Test the data streams functionality."""
     test_file = self._GetTestFilePath(['testdir_os', 'file1.txt'])
@@ -73,6 +73,11 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
         location='/File System/Recordings', parent=test_file_path_spec)
     self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
 
+    # A partial name is not a virtual directory.
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/File Sys', parent=test_file_path_spec)
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
+
     file_system.Close()
 
   def testGetFileEntryByPathSpec(self):
@@ -123,6 +128,38 @@ class TARFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetSubLocations(self):
+    """Tests the GetSubLocations function."""
+    test_file = self._GetTestFilePath(['missing_directory_entries.tar'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = tar_path_spec.TARPathSpec(
+        location='/', parent=test_file_path_spec)
+
+    file_system = tar_file_system.TARFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+    file_system.Open(path_spec)
+
+    expected_sub_locations = [
+        '/File System', '/Non Missing Directory Entry']
+    sub_locations = file_system.GetSubLocations('/')
+    self.assertEqual(sub_locations, expected_sub_locations)
+
+    expected_sub_locations = ['/File System/Recordings']
+    sub_locations = file_system.GetSubLocations('/File System/')
+    self.assertEqual(sub_locations, expected_sub_locations)
+
+    expected_sub_locations = [
+        '/File System/Recordings/AssetManifest.plist']
+    sub_locations = file_system.GetSubLocations('/File System/Recordings')
+    self.assertEqual(sub_locations, expected_sub_locations)
+
+    sub_locations = file_system.GetSubLocations('/bogus')
+    self.assertEqual(sub_locations, [])
+
+    file_system.Close()
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = tar_file_system.TARFileSystem(self._resolver_context)
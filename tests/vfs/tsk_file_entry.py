@@ -182,6 +182,30 @@ class TSKFileEntryTestExt2(shared_test_lib.BaseTestCase):
 
     self.assertEqual(parent_file_entry.name, 'a_directory')
 
+  def testGetSubFileEntryByName(self):
+    """Tests the GetSubFileEntryByName function."""
+    file_entry = self._file_system.GetFileEntryByPathSpec(self._tsk_path_spec)
+    self.assertIsNotNone(file_entry)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('a_directory')
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'a_directory')
+    self.assertEqual(sub_file_entry.path_spec.inode, 12)
+    self.assertEqual(sub_file_entry.path_spec.location, '/a_directory')
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('A_Directory')
+    self.assertIsNone(sub_file_entry)
+
+    # ext2 is case sensitive, hence the name index is used.
+    sub_file_entry = file_entry.GetSubFileEntryByName(
+        'A_Directory', case_sensitive=False)
+    self.assertIsNotNone(sub_file_entry)
+    self.assertEqual(sub_file_entry.name, 'a_directory')
+    self.assertEqual(sub_file_entry.path_spec.inode, 12)
+
+    sub_file_entry = file_entry.GetSubFileEntryByName('bogus')
+    self.assertIsNone(sub_file_entry)
+
   def testGetStat(self):
     """Tests the GetStat function."""
     test_location = '/a_directory/another_file'
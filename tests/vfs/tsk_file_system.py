@@ -83,6 +83,32 @@ class TSKFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetTSKImageCacheStatistics(self):
+    """Tests the GetTSKImageCacheStatistics function."""
+    file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tsk_path_spec)
+
+    # The TSK image blocks are not cached by default.
+    self.assertEqual(file_system.GetTSKImageCacheStatistics(), (0, 0))
+
+    file_system.Close()
+
+    resolver_context = context.Context(maximum_number_of_tsk_image_blocks=64)
+    file_system = tsk_file_system.TSKFileSystem(resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._tsk_path_spec)
+
+    file_entry = file_system.GetRootFileEntry()
+    self.assertIsNotNone(file_entry)
+
+    _, number_of_cache_misses = file_system.GetTSKImageCacheStatistics()
+    self.assertGreater(number_of_cache_misses, 0)
+
+    file_system.Close()
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = tsk_file_system.TSKFileSystem(self._resolver_context)
@@ -5,6 +5,7 @@
 from __future__ import unicode_literals
 
 import unittest
+import zipfile
 
 from dfvfs.path import os_path_spec
 from dfvfs.path import zip_path_spec
@@ -124,6 +125,34 @@ class ZIPFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetSubLocations(self):
+    """Tests the GetSubLocations function."""
+    test_file = self._GetTestFilePath(['missing_directory_entries.zip'])
+    self._SkipIfPathNotExists(test_file)
+
+    test_file_path_spec = os_path_spec.OSPathSpec(location=test_file)
+    path_spec = zip_path_spec.ZipPathSpec(
+        location='/', parent=test_file_path_spec)
+
+    file_system = zip_file_system.ZipFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+    file_system.Open(path_spec)
+
+    sub_locations = file_system.GetSubLocations('/')
+    self.assertEqual(sub_locations, ['/folder/'])
+
+    expected_sub_locations = ['/folder/syslog', '/folder/wtmp.1']
+    sub_locations = file_system.GetSubLocations('/folder/')
+    self.assertEqual(sub_locations, expected_sub_locations)
+
+    sub_locations = file_system.GetSubLocations('/folder')
+    self.assertEqual(sub_locations, expected_sub_locations)
+
+    sub_locations = file_system.GetSubLocations('/fold')
+    self.assertEqual(sub_locations, [])
+
+    file_system.Close()
+
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
     file_system = zip_file_system.ZipFileSystem(self._resolver_context)
@@ -138,6 +167,29 @@ class ZIPFileSystemTest(shared_test_lib.BaseTestCase):
 
     file_system.Close()
 
+  def testGetSeekPoints(self):
+    """Test the GetSeekPoints function."""
+    file_system = zip_file_system.ZipFileSystem(self._resolver_context)
+    self.assertIsNotNone(file_system)
+
+    file_system.Open(self._zip_path_spec)
+
+    zip_info = zipfile.ZipInfo(filename='syslog')
+    zip_info.header_offset = 0
+
+    seek_points = file_system.GetSeekPoints(zip_info)
+    self.assertEqual(seek_points, ([], []))
+    self.assertIs(file_system.GetSeekPoints(zip_info), seek_points)
+
+    # Members with the same name do not share seek points.
+    other_zip_info = zipfile.ZipInfo(filename='syslog')
+    other_zip_info.header_offset = 1024
+
+    other_seek_points = file_system.GetSeekPoints(other_zip_info)
+    self.assertIsNot(other_seek_points, seek_points)
+
+    file_system.Close()
+
   # TODO: add tests for GetZipInfoByPathSpec function.
 
 
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark path specification comparable lookups."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import sys
+import timeit
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from dfvfs.lib import definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+
+
+def CreatePathSpec():
+  """Creates a TSK on partition on EWF path specification.
+
+  Returns:
+    PathSpec: path specification.
+  """
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_OS, location='/cases/image.E01')
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_EWF, parent=path_spec)
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_TSK_PARTITION, location='/p1', part_index=2,
+      start_offset=1048576, parent=path_spec)
+  return path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_TSK, inode=15,
+      location='/Windows/System32/config/SYSTEM', parent=path_spec)
+
+
+def BenchmarkPathSpec(path_spec, number_of_iterations):
+  """Benchmarks the lookups of a path specification.
+
+  Args:
+    path_spec (PathSpec): path specification.
+    number_of_iterations (int): number of iterations.
+
+  Returns:
+    tuple[float, float, float]: duration in seconds of the comparable, hash
+        and resolver context cache lookups.
+  """
+  resolver_context = context.Context()
+  resolver_context.CacheFileObject(path_spec, object())
+
+  comparable_duration = timeit.timeit(
+      lambda: path_spec.comparable, number=number_of_iterations)
+  hash_duration = timeit.timeit(
+      lambda: hash(path_spec), number=number_of_iterations)
+  cache_duration = timeit.timeit(
+      lambda: resolver_context.GetFileObject(path_spec),
+      number=number_of_iterations)
+
+  return comparable_duration, hash_duration, cache_duration
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks path specification comparable lookups with and without '
+      'freezing the path specification.'))
+
+  argument_parser.add_argument(
+      '-n', '--iterations', dest='number_of_iterations', type=int,
+      action='store', default=100000, metavar='NUMBER', help=(
+          'number of iterations.'))
+
+  options = argument_parser.parse_args()
+
+  print('Lookup\t\tMutable\t\tFrozen\t\tSpeedup')
+
+  mutable_durations = BenchmarkPathSpec(
+      CreatePathSpec(), options.number_of_iterations)
+  frozen_durations = BenchmarkPathSpec(
+      CreatePathSpec().Freeze(), options.number_of_iterations)
+
+  for name, mutable_duration, frozen_duration in zip(
+      ('comparable', 'hash', 'context'), mutable_durations, frozen_durations):
+    print('{0:s}\t{1:.3f}s\t\t{2:.3f}s\t\t{3:.1f}x'.format(
+        name.ljust(10), mutable_duration, frozen_duration,
+        mutable_duration / frozen_duration))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the SleuthKit (TSK) image block cache."""
+
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import sys
+import time
+
+import pytsk3
+
+# Change PYTHONPATH to include dfVFS.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from dfvfs.analyzer import analyzer
+from dfvfs.lib import definitions
+from dfvfs.lib import tsk_image
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context
+from dfvfs.resolver import resolver
+
+
+def CreatePathSpec(source_path):
+  """Creates a path specification of a storage media image.
+
+  Args:
+    source_path (str): path of the storage media image.
+
+  Returns:
+    PathSpec: path specification.
+  """
+  path_spec = path_spec_factory.Factory.NewPathSpec(
+      definitions.TYPE_INDICATOR_OS, location=source_path)
+
+  type_indicators = analyzer.Analyzer.GetStorageMediaImageTypeIndicators(
+      path_spec)
+  if len(type_indicators) == 1:
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        type_indicators[0], parent=path_spec)
+
+  return path_spec
+
+
+def WalkDirectory(tsk_directory, file_data_size):
+  """Walks a directory recursively.
+
+  Args:
+    tsk_directory (pytsk3.Directory): directory.
+    file_data_size (int): number of bytes of data to read from every file.
+
+  Returns:
+    int: number of file entries.
+  """
+  number_of_file_entries = 0
+  for tsk_file in tsk_directory:
+    name = getattr(tsk_file.info.name, 'name', None)
+    if name in (b'.', b'..'):
+      continue
+
+    number_of_file_entries += 1
+
+    tsk_meta = getattr(tsk_file.info, 'meta', None)
+    if not tsk_meta:
+      continue
+
+    if tsk_meta.type == pytsk3.TSK_FS_META_TYPE_DIR:
+      number_of_file_entries += WalkDirectory(
+          tsk_file.as_directory(), file_data_size)
+
+    elif tsk_meta.type == pytsk3.TSK_FS_META_TYPE_REG and file_data_size:
+      read_size = min(file_data_size, tsk_meta.size)
+      if read_size > 0:
+        try:
+          tsk_file.read_random(0, read_size)
+        except IOError:
+          pass
+
+  return number_of_file_entries
+
+
+def BenchmarkWalk(
+    path_spec, block_size, maximum_number_of_cached_blocks, file_data_size,
+    number_of_iterations):
+  """Benchmarks walking a file system with TSK.
+
+  Args:
+    path_spec (PathSpec): path specification of the volume that contains
+        the file system.
+    block_size (int): size of the cached blocks.
+    maximum_number_of_cached_blocks (int): maximum number of cached blocks,
+        where 0 disables the cache.
+    file_data_size (int): number of bytes of data to read from every file.
+    number_of_iterations (int): number of times to walk the file system.
+
+  Returns:
+    tuple[float, int, TSKFileSystemImage]: duration in seconds, number of
+        file entries and image object.
+  """
+  resolver_context = context.Context()
+  file_object = resolver.Resolver.OpenFileObject(
+      path_spec, resolver_context=resolver_context)
+
+  try:
+    tsk_image_object = tsk_image.TSKFileSystemImage(
+        file_object, block_size=block_size,
+        maximum_number_of_cached_blocks=maximum_number_of_cached_blocks)
+
+    number_of_file_entries = 0
+    start_time = time.time()
+    for _ in range(number_of_iterations):
+      tsk_file_system = pytsk3.FS_Info(tsk_image_object)
+      number_of_file_entries += WalkDirectory(
+          tsk_file_system.open_dir(path='/'), file_data_size)
+    duration = time.time() - start_time
+
+  finally:
+    file_object.close()
+
+  return duration, number_of_file_entries, tsk_image_object
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmarks walking a file system with TSK with and without the image '
+      'block cache.'))
+
+  argument_parser.add_argument(
+      '-b', '--block_size', '--block-size', dest='block_size', type=int,
+      action='store', default=32768, metavar='SIZE', help=(
+          'size of the cached blocks.'))
+
+  argument_parser.add_argument(
+      '-c', '--cached_blocks', '--cached-blocks', dest='cached_blocks',
+      type=int, action='store', default=512, metavar='NUMBER', help=(
+          'maximum number of cached blocks.'))
+
+  argument_parser.add_argument(
+      '-d', '--file_data_size', '--file-data-size', dest='file_data_size',
+      type=int, action='store', default=4096, metavar='SIZE', help=(
+          'number of bytes of data to read from every file.'))
+
+  argument_parser.add_argument(
+      '-n', '--iterations', dest='number_of_iterations', type=int,
+      action='store', default=1, metavar='NUMBER', help=(
+          'number of times to walk the file system.'))
+
+  argument_parser.add_argument(
+      'source', nargs='?', action='store', metavar='PATH',
+      default='test_data/image.qcow2', help=(
+          'path of the storage media image that contains the file system.'))
+
+  options = argument_parser.parse_args()
+
+  path_spec = CreatePathSpec(options.source)
+
+  print('Cache\t\tDuration\tEntries\t\tHits\t\tMisses')
+
+  for name, maximum_number_of_cached_blocks in (
+      ('disabled', 0), ('enabled', options.cached_blocks)):
+    duration, number_of_file_entries, tsk_image_object = BenchmarkWalk(
+        path_spec, options.block_size, maximum_number_of_cached_blocks,
+        options.file_data_size, options.number_of_iterations)
+
+    print('{0:s}\t{1:.3f}s\t\t{2:d}\t\t{3:d}\t\t{4:d}'.format(
+        name.ljust(10), duration, number_of_file_entries,
+        tsk_image_object.number_of_cache_hits,
+        tsk_image_object.number_of_cache_misses))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)